@@ -0,0 +1,57 @@
+import threading
+
+class _Guard:
+    def __init__(self, acquire, release):
+        self._acquire = acquire
+        self._release = release
+
+    def __enter__(self) -> None:
+        self._acquire()
+
+    def __exit__(self, *exc_info) -> None:
+        self._release()
+
+# Many concurrent readers or one writer. Waiting writers block new readers so a steady stream
+# of reads cannot starve them. Not reentrant: a holder must not acquire it again.
+class ReadWriteLock:
+    def __init__(self):
+        self._condition = threading.Condition(threading.Lock())
+        self._readers: int = 0
+        self._writer: bool = False
+        self._waiting_writers: int = 0
+        self.reading = _Guard(self.acquire_read, self.release_read)
+        self.writing = _Guard(self.acquire_write, self.release_write)
+
+    def acquire_read(self) -> None:
+        with self._condition:
+            while self._writer or self._waiting_writers:
+                self._condition.wait()
+            self._readers += 1
+
+    def release_read(self) -> None:
+        with self._condition:
+            self._readers -= 1
+            if not self._readers:
+                self._condition.notify_all()
+
+    def acquire_write(self) -> None:
+        with self._condition:
+            self._waiting_writers += 1
+            while self._writer or self._readers:
+                self._condition.wait()
+            self._waiting_writers -= 1
+            self._writer = True
+
+    def release_write(self) -> None:
+        with self._condition:
+            self._writer = False
+            self._condition.notify_all()
+
+def _noop() -> None:
+    pass
+
+# Same interface with no synchronization, for single-threaded use
+class NullReadWriteLock:
+    def __init__(self):
+        self.reading = _Guard(_noop, _noop)
+        self.writing = self.reading
@@ -0,0 +1,157 @@
+import asyncio
+import logging
+import threading
+from collections import deque
+from itertools import islice
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+from src.Domain.Entities.Book import Book
+from src.Domain.Entities.BookChange import BookChange
+from src.Domain.Entities.ChangeFeedGapError import ChangeFeedGapError
+
+_logger = logging.getLogger(__name__)
+_OVERFLOW = object()
+_CLOSED = object()
+
+class BookSubscription:
+    def __init__(self, feed: 'BookChangeFeed', callback: Callable[[BookChange], None]):
+        self.callback = callback
+        # Last sequence delivered; a dropped subscriber resumes from here
+        self.sequence: Optional[int] = None
+        self.active = True
+        self._feed = feed
+
+    def __enter__(self) -> 'BookSubscription':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._feed._unsubscribe(self)
+
+# Ordered, sequence-numbered stream of the changes made through one repository. Sequences start
+# at 1 and have no gaps; the newest `retention` changes are kept so a consumer can resume after
+# the last sequence it processed. Callbacks run in sequence order on a writing thread once the
+# write has been persisted, so they should be quick or hand the change off.
+# A consumer that starts from nothing subscribes first and then reads a snapshot: entries carry
+# resulting state, so changes that the snapshot already reflects apply harmlessly.
+class BookChangeFeed:
+    def __init__(self, retention: int = 10000):
+        self.retention = retention
+        # Plain tuples: a BookChange is only built when a subscriber or a resume needs one
+        self._retained: Deque[Tuple[Any, ...]] = deque(maxlen=retention)
+        self._sequence: int = 0
+        # Replaced rather than mutated, so a callback may subscribe or unsubscribe mid-delivery
+        self._subscriptions: List[BookSubscription] = []
+        self._lock = threading.RLock()
+
+    @property
+    def sequence(self) -> int:
+        return self._sequence
+
+    def publish(self, op: str, book_id: int, book: Optional[Book] = None, changes: Optional[Dict[str, Any]] = None) -> int:
+        with self._lock:
+            self._sequence += 1
+            entry = (self._sequence, op, book_id, book, changes)
+            self._retained.append(entry)
+            if self._subscriptions:
+                change = BookChange(*entry)
+                for subscription in self._subscriptions:
+                    self._deliver(subscription, change)
+            return self._sequence
+
+    def changes_since(self, sequence: int) -> List[BookChange]:
+        with self._lock:
+            if sequence > self._sequence:
+                # A cursor from before a restart: the sequence it names was never issued here
+                raise ChangeFeedGapError(sequence, f"Sequence {sequence} is ahead of this feed, which is at {self._sequence}")
+            if sequence == self._sequence:
+                return []
+            oldest = self._retained[0][0] if self._retained else self._sequence + 1
+            if sequence < oldest - 1:
+                raise ChangeFeedGapError(sequence, f"Changes after sequence {sequence} are no longer retained; the oldest is {oldest}")
+            return [BookChange(*entry) for entry in islice(self._retained, sequence - oldest + 1, None)]
+
+    def subscribe(self, callback: Callable[[BookChange], None], since: Optional[int] = None) -> BookSubscription:
+        # With since, the retained changes after it are delivered first, with no gap or repeat
+        # before live ones; a gap raises here, in the subscriber's thread
+        subscription = BookSubscription(self, callback)
+        with self._lock:
+            if since is not None:
+                subscription.sequence = since
+                for change in self.changes_since(since):
+                    callback(change)
+                    subscription.sequence = change.sequence
+            self._subscriptions = self._subscriptions + [subscription]
+        return subscription
+
+    def stream(self, since: Optional[int] = None, max_pending: int = 1000) -> 'BookChangeStream':
+        # Call from a coroutine; the stream is subscribed on return, before its first await
+        return BookChangeStream(self, since, max_pending)
+
+    def _unsubscribe(self, subscription: BookSubscription) -> None:
+        with self._lock:
+            subscription.active = False
+            self._subscriptions = [other for other in self._subscriptions if other is not subscription]
+
+    def _deliver(self, subscription: BookSubscription, change: BookChange) -> None:
+        # The write has already happened, so a failing consumer is dropped instead of failing it
+        try:
+            subscription.callback(change)
+        except Exception:
+            _logger.exception("Change feed subscriber failed at sequence %d and was unsubscribed", change.sequence)
+            self._unsubscribe(subscription)
+            return
+        subscription.sequence = change.sequence
+
+# Async iterator over a feed for the event loop it was created on. Changes arrive through
+# call_soon_threadsafe, so writers on any thread never block on the consumer. A consumer that
+# falls more than max_pending behind gets ChangeFeedGapError instead of an ever-growing queue,
+# and can open a new stream with since set to the sequence attribute, the last change it received.
+class BookChangeStream:
+    def __init__(self, feed: BookChangeFeed, since: Optional[int], max_pending: int):
+        self.sequence = since
+        self._max_pending = max_pending
+        self._loop = asyncio.get_running_loop()
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._overflowed = False
+        self._subscription = feed.subscribe(self._forward, since)
+
+    def __aiter__(self) -> 'BookChangeStream':
+        return self
+
+    async def __anext__(self) -> BookChange:
+        change = await self._queue.get()
+        if change is _CLOSED:
+            self._queue.put_nowait(_CLOSED)
+            raise StopAsyncIteration
+        if change is _OVERFLOW:
+            self.close()
+            raise ChangeFeedGapError(self.sequence, f"Consumer fell more than {self._max_pending} changes behind after sequence {self.sequence}")
+        self.sequence = change.sequence
+        return change
+
+    async def __aenter__(self) -> 'BookChangeStream':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
+
+    async def aclose(self) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._subscription.active:
+            self._subscription.close()
+            self._loop.call_soon_threadsafe(self._enqueue, _CLOSED)
+
+    def _forward(self, change: BookChange) -> None:
+        self._loop.call_soon_threadsafe(self._enqueue, change)
+
+    def _enqueue(self, change: Any) -> None:
+        if self._overflowed:
+            return
+        if change is not _CLOSED and self._queue.qsize() >= self._max_pending:
+            self._overflowed = True
+            change = _OVERFLOW
+        self._queue.put_nowait(change)
@@ -0,0 +1,51 @@
+import threading
+from collections import deque
+from typing import Any, Deque, List, Optional, Tuple
+from src.Application.Events.BookChangeFeed import BookChangeFeed
+
+# The changes of one write, queued until the write has been persisted or has failed
+class StagedWrite:
+    __slots__ = ('changes', 'done', 'failed')
+
+    def __init__(self, changes: List[Tuple[Any, ...]]):
+        self.changes = changes
+        self.done = False
+        self.failed = False
+
+# Hands a repository's changes to its feed in write order, after the repository has released its
+# locks, so subscribers never block readers and may call back into the repository. A writer
+# queues its changes while it still holds its write lock, then calls finish once the outcome is
+# known. A failed write whose change stays applied waits for a later write that succeeded.
+class BookChangeOutbox:
+    def __init__(self, feed: BookChangeFeed):
+        self.feed = feed
+        self._queue: Deque[StagedWrite] = deque()
+        self._lock = threading.Lock()
+        self._delivering_thread: Optional[int] = None
+
+    def enqueue(self, changes: List[Tuple[Any, ...]]) -> StagedWrite:
+        staged = StagedWrite(changes)
+        self._queue.append(staged)
+        return staged
+
+    def finish(self, staged: StagedWrite, failed: bool = False) -> None:
+        staged.failed = failed
+        staged.done = True
+        self.deliver()
+
+    def deliver(self) -> None:
+        # A write still saving holds back the ones behind it, and its own thread delivers them
+        # all when it finishes. A callback that writes leaves its change to the loop already
+        # running on this thread, so it is numbered after the whole batch being delivered.
+        if self._delivering_thread == threading.get_ident():
+            return
+        with self._lock:
+            self._delivering_thread = threading.get_ident()
+            try:
+                while self._queue and self._queue[0].done:
+                    if self._queue[0].failed and not any(staged.done and not staged.failed for staged in self._queue):
+                        break
+                    for change in self._queue.popleft().changes:
+                        self.feed.publish(*change)
+            finally:
+                self._delivering_thread = None
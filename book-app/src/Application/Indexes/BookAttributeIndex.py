@@ -0,0 +1,50 @@
+from bisect import bisect_left, bisect_right, insort
+from math import inf
+from typing import Dict, Iterable, List, Tuple
+from src.Domain.Entities.Book import Book
+
+def normalize_author(author: str) -> str:
+    return ' '.join(author.casefold().split())
+
+# Exact-match lookups on normalized author and range lookups on published_year. Author postings
+# and the (year, id) list are kept sorted, so a lookup is a hash probe or two bisects plus the
+# k matching ids, with no scan over the rest of the catalogue.
+class BookAttributeIndex:
+    def __init__(self, books: Iterable[Book] = ()):
+        self._authors: Dict[str, List[int]] = {}
+        self._years: List[Tuple[int, int]] = []
+        self._entries: Dict[int, Tuple[str, int]] = {}
+        for book in books:
+            self.add(book)
+
+    def add(self, book: Book) -> None:
+        author = normalize_author(book.author)
+        self._entries[book.id] = (author, book.published_year)
+        insort(self._authors.setdefault(author, []), book.id)
+        insort(self._years, (book.published_year, book.id))
+
+    def remove(self, book_id: int) -> None:
+        entry = self._entries.pop(book_id, None)
+        if entry is None:
+            return
+        author, year = entry
+        book_ids = self._authors[author]
+        del book_ids[bisect_left(book_ids, book_id)]
+        if not book_ids:
+            del self._authors[author]
+        del self._years[bisect_left(self._years, (year, book_id))]
+
+    def update(self, book: Book) -> None:
+        if self._entries.get(book.id) == (normalize_author(book.author), book.published_year):
+            return
+        self.remove(book.id)
+        self.add(book)
+
+    def find_by_author(self, author: str) -> List[int]:
+        return list(self._authors.get(normalize_author(author), ()))
+
+    def find_by_year_range(self, start_year: int, end_year: int) -> List[int]:
+        # Ordered by year, then id
+        start = bisect_left(self._years, (start_year, -inf))
+        end = bisect_right(self._years, (end_year, inf))
+        return [book_id for _, book_id in self._years[start:end]]
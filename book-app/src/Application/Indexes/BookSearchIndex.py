@@ -0,0 +1,87 @@
+import re
+from typing import Dict, Iterable, List, Set
+from src.Domain.Entities.Book import Book
+
+_TOKEN_PATTERN = re.compile(r'\w+')
+# Tokens are indexed under every substring up to this length, so short fragments are a single
+# lookup and longer ones intersect the posting sets of their trigrams.
+_GRAM_SIZE = 3
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN_PATTERN.findall(text.casefold())
+
+def matches(query: str, book: Book) -> bool:
+    # The rule BookSearchIndex.search applies, checked against a single book
+    tokens = set(tokenize(book.title)) | set(tokenize(book.author))
+    fragments = tokenize(query)
+    return bool(fragments) and all(any(fragment in token for token in tokens) for fragment in fragments)
+
+class BookSearchIndex:
+    def __init__(self, books: Iterable[Book] = ()):
+        self._postings: Dict[str, Set[int]] = {}
+        self._grams: Dict[str, Set[str]] = {}
+        self._book_tokens: Dict[int, Set[str]] = {}
+        for book in books:
+            self.add(book)
+
+    def add(self, book: Book) -> None:
+        tokens = set(tokenize(book.title)) | set(tokenize(book.author))
+        self._book_tokens[book.id] = tokens
+        for token in tokens:
+            postings = self._postings.get(token)
+            if postings is None:
+                postings = self._postings[token] = set()
+                for gram in self._token_grams(token):
+                    self._grams.setdefault(gram, set()).add(token)
+            postings.add(book.id)
+
+    def remove(self, book_id: int) -> None:
+        for token in self._book_tokens.pop(book_id, ()):
+            postings = self._postings[token]
+            postings.discard(book_id)
+            if postings:
+                continue
+            del self._postings[token]
+            for gram in self._token_grams(token):
+                tokens = self._grams[gram]
+                tokens.discard(token)
+                if not tokens:
+                    del self._grams[gram]
+
+    def update(self, book: Book) -> None:
+        self.remove(book.id)
+        self.add(book)
+
+    def search(self, query: str) -> Set[int]:
+        # Every query token must occur as a substring of some title or author token
+        result = None
+        for fragment in tokenize(query):
+            book_ids: Set[int] = set()
+            for token in self._matching_tokens(fragment):
+                book_ids |= self._postings[token]
+            result = book_ids if result is None else result & book_ids
+            if not result:
+                break
+        return result or set()
+
+    def _matching_tokens(self, fragment: str) -> Iterable[str]:
+        if len(fragment) <= _GRAM_SIZE:
+            return self._grams.get(fragment, ())
+
+        gram_sets = []
+        for start in range(len(fragment) - _GRAM_SIZE + 1):
+            tokens = self._grams.get(fragment[start:start + _GRAM_SIZE])
+            if not tokens:
+                return ()
+            gram_sets.append(tokens)
+        gram_sets.sort(key=len)
+        candidates = set(gram_sets[0]).intersection(*gram_sets[1:])
+        return [token for token in candidates if fragment in token]
+
+    @staticmethod
+    def _token_grams(token: str) -> Set[str]:
+        return {
+            token[start:start + size]
+            for size in range(1, _GRAM_SIZE + 1)
+            for start in range(len(token) - size + 1)
+        }
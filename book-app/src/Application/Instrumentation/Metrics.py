@@ -0,0 +1,189 @@
+import contextvars
+import inspect
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import wraps
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+# Bucket upper bounds in seconds: 1us doubling up to about 17s, then +Inf
+_BUCKET_BOUNDS = tuple(1e-6 * 2 ** exponent for exponent in range(25))
+# Private helpers and validation are called through self, so they are timed by shadowing the
+# instance attribute; public methods are timed by the proxy returned from instrument()
+DEFAULT_INTERNALS = {
+    'repository': ('_load_from_json', '_write_snapshot', '_ensure_search_index', '_ensure_attribute_index'),
+    'service': ('_validate_book_data', '_validate_rows'),
+}
+
+@dataclass
+class Span:
+    name: str
+    parent: Optional[str]
+    started: float
+    duration: float
+    error: Optional[BaseException] = None
+
+class LatencyHistogram:
+    def __init__(self, bounds: Sequence[float] = _BUCKET_BOUNDS):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.min = float('inf')
+        self.max = 0.0
+
+    def observe(self, seconds: float, error: bool = False) -> None:
+        self.counts[bisect_left(self.bounds, seconds)] += 1
+        self.count += 1
+        self.errors += error
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+
+    def quantile(self, q: float) -> float:
+        # Upper bound of the bucket holding the q-th observation, capped at the largest one seen
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            'calls': self.count,
+            'errors': self.errors,
+            'total_seconds': self.total,
+            'mean_seconds': self.total / self.count if self.count else 0.0,
+            'min_seconds': self.min if self.count else 0.0,
+            'max_seconds': self.max,
+            'p50_seconds': self.quantile(0.5),
+            'p95_seconds': self.quantile(0.95),
+            'p99_seconds': self.quantile(0.99),
+        }
+
+# Per-operation latency histograms and call/error counters, plus optional span listeners.
+# Disabling the registry leaves the wrappers in place but reduces each call to one flag check.
+class MetricsRegistry:
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._span_listeners: List[Callable[[Span], None]] = []
+        self._lock = threading.Lock()
+        self._current: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar('current_span', default=None)
+
+    def add_span_listener(self, listener: Callable[[Span], None]) -> None:
+        self._span_listeners.append(listener)
+
+    def remove_span_listener(self, listener: Callable[[Span], None]) -> None:
+        self._span_listeners.remove(listener)
+
+    def observe(self, name: str, seconds: float, error: bool = False) -> None:
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = LatencyHistogram()
+            histogram.observe(seconds, error)
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+        parent = self._current.get()
+        token = self._current.set(name)
+        started = time.perf_counter()
+        error: Optional[BaseException] = None
+        try:
+            yield
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            duration = time.perf_counter() - started
+            self._current.reset(token)
+            self.observe(name, duration, error is not None)
+            for listener in self._span_listeners:
+                listener(Span(name, parent, started, duration, error))
+
+    def timed(self, name: str, function: Callable[..., Any]) -> Callable[..., Any]:
+        registry = self
+        if inspect.iscoroutinefunction(function):
+            @wraps(function)
+            async def timed_coroutine(*args: Any, **kwargs: Any) -> Any:
+                if not registry.enabled:
+                    return await function(*args, **kwargs)
+                with registry.span(name):
+                    return await function(*args, **kwargs)
+            return timed_coroutine
+
+        @wraps(function)
+        def timed_call(*args: Any, **kwargs: Any) -> Any:
+            if not registry.enabled:
+                return function(*args, **kwargs)
+            with registry.span(name):
+                return function(*args, **kwargs)
+        return timed_call
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {name: histogram.snapshot() for name, histogram in sorted(self._histograms.items())}
+
+    def export_prometheus(self, metric: str = 'book_operation_seconds') -> str:
+        # Prometheus text exposition format: one histogram labelled by operation, then the error
+        # counters as their own family, each family contiguous under its TYPE line
+        lines = [f"# TYPE {metric} histogram"]
+        errors = [f"# TYPE {metric}_errors_total counter"]
+        with self._lock:
+            for name, histogram in sorted(self._histograms.items()):
+                label = f'operation="{name}"'
+                cumulative = 0
+                for bound, count in zip(histogram.bounds, histogram.counts):
+                    cumulative += count
+                    lines.append(f'{metric}_bucket{{{label},le="{bound:.6g}"}} {cumulative}')
+                lines.append(f'{metric}_bucket{{{label},le="+Inf"}} {histogram.count}')
+                lines.append(f'{metric}_sum{{{label}}} {histogram.total:.9f}')
+                lines.append(f'{metric}_count{{{label}}} {histogram.count}')
+                errors.append(f'{metric}_errors_total{{{label}}} {histogram.errors}')
+        return '\n'.join(lines + errors) + '\n'
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+
+class InstrumentedProxy:
+    def __init__(self, target: Any, registry: MetricsRegistry, layer: str):
+        self._target = target
+        self._registry = registry
+        self._layer = layer
+        self._wrapped: Dict[str, Callable[..., Any]] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._target, name)
+        if name.startswith('_') or not callable(attribute):
+            return attribute
+        wrapped = self._wrapped.get(name)
+        if wrapped is None:
+            wrapped = self._wrapped[name] = self._registry.timed(f"{self._layer}.{name}", attribute)
+        return wrapped
+
+def instrument(
+    target: Any,
+    registry: Optional[MetricsRegistry],
+    layer: str,
+    internals: Optional[Sequence[str]] = None
+) -> Any:
+    # Without a registry the target is returned untouched, so uninstrumented code pays nothing
+    if registry is None:
+        return target
+    for name in DEFAULT_INTERNALS.get(layer, ()) if internals is None else internals:
+        method = getattr(target, name, None)
+        if callable(method):
+            setattr(target, name, registry.timed(f"{layer}.{name}", method))
+    return InstrumentedProxy(target, registry, layer)
@@ -0,0 +1,84 @@
+import asyncio
+from concurrent.futures import Executor
+from functools import partial
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+from src.Application.Events.BookChangeFeed import BookChangeFeed
+from src.Domain.Entities.Book import Book
+from src.Domain.Entities.BulkResult import BulkResult
+from src.Domain.Interfaces.AsyncBookInterface import AsyncBookRepositoryInterface
+from src.Domain.Interfaces.BookInterface import BookRepositoryInterface
+
+_STREAM_BATCH_SIZE = 500
+
+# Runs a synchronous repository on worker threads so the event loop never waits on locks or disk.
+# Calls from concurrent tasks overlap, so the repository must be thread-safe: the JSON repository
+# needs thread_safe=True, and then reads keep running while a snapshot is written.
+class AsyncBookRepositoryAdapter(AsyncBookRepositoryInterface):
+    def __init__(self, repository: BookRepositoryInterface, executor: Optional[Executor] = None):
+        if getattr(repository, 'thread_safe', True) is False:
+            raise ValueError("Repository must be created with thread_safe=True")
+        self.repository = repository
+        self._executor = executor
+
+    @property
+    def changes(self) -> Optional[BookChangeFeed]:
+        # Published on the worker threads that run writes; BookChangeFeed.stream hands them to the loop
+        return getattr(self.repository, 'changes', None)
+
+    async def browse(self, offset: int = 0, limit: Optional[int] = None, after_id: Optional[int] = None) -> List[Book]:
+        return await self._run(self.repository.browse, offset, limit, after_id)
+
+    async def iter_books(self, offset: int = 0, limit: Optional[int] = None, after_id: Optional[int] = None) -> AsyncIterator[Book]:
+        # Keyset batches, each fetched on a worker thread
+        remaining = limit
+        while remaining is None or remaining > 0:
+            batch_size = _STREAM_BATCH_SIZE if remaining is None else min(_STREAM_BATCH_SIZE, remaining)
+            books = await self.browse(offset, batch_size, after_id)
+            for book in books:
+                yield book
+            if len(books) < batch_size:
+                return
+            after_id, offset = books[-1].id, 0
+            if remaining is not None:
+                remaining -= len(books)
+
+    async def read(self, book_id: int) -> Optional[Book]:
+        return await self._run(self.repository.read, book_id)
+
+    async def search(self, query: str) -> List[Book]:
+        return await self._run(self.repository.search, query)
+
+    async def find_by_author(self, author: str) -> List[Book]:
+        return await self._run(self.repository.find_by_author, author)
+
+    async def find_by_year_range(self, start_year: int, end_year: int) -> List[Book]:
+        return await self._run(self.repository.find_by_year_range, start_year, end_year)
+
+    async def add(self, book_data: Dict[str, Any]) -> int:
+        return await self._run(self.repository.add, book_data)
+
+    async def edit(self, book_id: int, book_data: Dict[str, Any]) -> bool:
+        return await self._run(self.repository.edit, book_id, book_data)
+
+    async def delete(self, book_id: int) -> bool:
+        return await self._run(self.repository.delete, book_id)
+
+    async def adjust_quantity(self, book_id: int, delta: int) -> Optional[int]:
+        return await self._run(self.repository.adjust_quantity, book_id, delta)
+
+    async def add_many(self, books_data: List[Dict[str, Any]]) -> List[BulkResult]:
+        return await self._run(self.repository.add_many, books_data)
+
+    async def edit_many(self, books_data: List[Dict[str, Any]]) -> List[BulkResult]:
+        return await self._run(self.repository.edit_many, books_data)
+
+    async def delete_many(self, book_ids: List[int]) -> List[BulkResult]:
+        return await self._run(self.repository.delete_many, book_ids)
+
+    async def close(self) -> None:
+        close = getattr(self.repository, 'close', None)
+        if close is not None:
+            await self._run(close)
+
+    async def _run(self, function: Callable[..., Any], *args: Any) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(self._executor, partial(function, *args))
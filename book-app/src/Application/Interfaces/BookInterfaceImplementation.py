@@ -1,25 +1,361 @@
 import json
-from typing import List, Optional
-from src.Domain.Entities.Book import Book
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import replace
+from functools import partial
+from itertools import dropwhile, islice
+from typing import Any, Dict, Iterable, Iterator, List, MutableMapping, Optional, Tuple
+from src.Domain.Entities.Book import Book, changed_fields
+from src.Domain.Entities.BookSnapshot import BookSnapshot
+from src.Domain.Entities.BulkResult import BulkResult, describe_row_error
+from src.Domain.Entities.InsufficientStockError import InsufficientStockError
+from src.Application.Events.BookChangeFeed import BookChangeFeed
+from src.Application.Events.BookChangeOutbox import BookChangeOutbox
+from src.Application.Concurrency.ReadWriteLock import NullReadWriteLock, ReadWriteLock
+from src.Application.Indexes.BookAttributeIndex import BookAttributeIndex
+from src.Application.Indexes.BookSearchIndex import BookSearchIndex
 from src.Domain.Interfaces.BookInterface import BookRepositoryInterface
+from src.Infrastructure.Persistence.AtomicFile import atomic_write
+from src.Infrastructure.Persistence.BookJournal import BookJournal
+from src.Infrastructure.Persistence.BookSnapshotCodecs import SnapshotFormatError, TextSnapshotCodec, book_to_dict, get_codec
+from src.Infrastructure.Persistence.FileLock import FileLock, NullFileLock, file_signature
+from src.Infrastructure.Storage.BookColumnStore import BookColumnStore
+from src.Infrastructure.Storage.LazyBookStore import LazyBookStore
+from src.Infrastructure.Storage.MappedBookStore import MappedBookStore
+
+_ITER_BATCH_SIZE = 256
+_logger = logging.getLogger(__name__)
 
 class BookInterfaceImplementation(BookRepositoryInterface):
-    def __init__(self, file_path: str = "book-app/src/Infrastructure/Data/Books.json"):
+    def __init__(
+        self,
+        file_path: str = "book-app/src/Infrastructure/Data/Books.json",
+        journaled: bool = False,
+        compaction_threshold: int = 1000,
+        commit_interval: float = 0.0,
+        columnar: bool = False,
+        lazy: bool = False,
+        codec: str = 'json',
+        thread_safe: bool = False,
+        shared: bool = False,
+        change_retention: int = 10000
+    ):
+        if columnar and lazy:
+            raise ValueError("Columnar and lazy storage cannot be combined")
+        if shared and (journaled or commit_interval > 0):
+            raise ValueError("Shared mode writes every change straight to the snapshot")
+        if shared and lazy and isinstance(get_codec(codec), TextSnapshotCodec):
+            # A text index holds offsets into the file, which another process may replace
+            raise ValueError("Shared lazy mode needs the binary codec")
         self.file_path = file_path
-        self.books: List[Book] = []
+        # Snapshot format: 'json' (the original pretty-printed array), 'jsonl' or 'binary'
+        self.codec = get_codec(codec)
+        # In journaled mode mutations are appended to a log and folded into the snapshot on compaction
+        self.journal: Optional[BookJournal] = (
+            BookJournal(file_path + '.journal', sync_interval=commit_interval) if journaled else None
+        )
+        self.compaction_threshold = compaction_threshold
+        # Group-commit window: mutations within it share one snapshot write or journal fsync
+        self.commit_interval = commit_interval
+        self._commit_lock = threading.RLock()
+        # One flush at a time, so close() waits for a timer flush that is still writing
+        self._flush_lock = threading.Lock()
+        self._commit_timer: Optional[threading.Timer] = None
+        self._dirty: bool = False
+        # Open batch() blocks; while any is open, snapshot writes wait for the outermost to exit
+        self._batch_depth: int = 0
+        # Books keyed by id; dicts keep insertion order, so this doubles as the ordered list.
+        # The columnar store trades per-access Book construction for far less resident memory.
+        # Lazy mode only indexes record offsets at startup and parses a Book on first access;
+        # with the binary codec it memory-maps the snapshot and reads records in place.
+        self.columnar = columnar
+        self.lazy = lazy
+        self._books: MutableMapping[int, Book] = self._new_store()
         self.next_id: int = 0
-        self._load_from_json()
+        # Built on the first search or find_by_* call and maintained incrementally from then on
+        self._search_index: Optional[BookSearchIndex] = None
+        self._attribute_index: Optional[BookAttributeIndex] = None
+        self._index_lock = threading.Lock()
+        # Thread-safe mode: many readers or one writer; snapshot files are written after the
+        # writer releases the lock, serialized by _io_lock so only the newest version lands.
+        # A group-commit timer flushes the store from its own thread, so that also needs a real lock.
+        self.thread_safe = thread_safe
+        timed_saves = commit_interval > 0 and not journaled
+        self._lock = ReadWriteLock() if thread_safe or timed_saves else NullReadWriteLock()
+        self._io_lock = threading.Lock()
+        self._snapshot_version: int = 0
+        self._written_version: int = 0
+        self._pending_snapshot: Optional[Tuple[int, List[Book]]] = None
+        # Copy-on-write read views: snapshot() hands out the live store and counts the open views
+        # of it, and a mutation while any is open copies the store before changing it, so a view
+        # is never written to. A copy costs one pass over the ids, paid once per version that an
+        # open view pinned; views of an older store no longer count once it has been replaced.
+        self._version: int = 0
+        self._viewed_store: Optional[MutableMapping[int, Book]] = None
+        self._open_views: int = 0
+        self._view_lock = threading.Lock()
+        # Encoded text of each record, next to the Book it was made from. Books are immutable and
+        # every change stores a new instance, so a snapshot write re-encodes only the records whose
+        # instance changed since the last write. Off for the memory-saving stores.
+        self._encoded: Optional[Dict[int, Tuple[Book, str]]] = (
+            {} if isinstance(self.codec, TextSnapshotCodec) and not columnar and not lazy else None
+        )
+        # Shared mode: several processes use one snapshot. Writers hold an exclusive file lock
+        # while they reload, mutate and write; readers stat the file and reload only when its
+        # signature has changed since it was last read or written here.
+        self.shared = shared
+        self._file_lock = FileLock(file_path + '.lock') if shared else NullFileLock()
+        self._signature = None
+        # Where an unreadable snapshot was moved on load, if one was
+        self.corrupt_snapshot_path: Optional[str] = None
+        # Changes made through this instance. They are staged under the write lock and published
+        # in write order once the write is persisted and the locks are released, so a subscriber
+        # may call back into the repository. A failed write keeps its change in memory, so its
+        # changes wait until a later write succeeds, which saves them too, and go out first.
+        # Loading, journal replay and reloads after another process wrote publish nothing.
+        self.changes = BookChangeFeed(change_retention)
+        self._staged_changes: List[Tuple[Any, ...]] = []
+        self._outbox = BookChangeOutbox(self.changes)
+        with self._file_lock.shared():
+            self._load_from_json()
+
+    @property
+    def books(self) -> List[Book]:
+        self._refresh()
+        with self._lock.reading:
+            return list(self._books.values())
+
+    @books.setter
+    def books(self, books: Iterable[Book]) -> None:
+        with self._lock.writing:
+            self._books = self._new_store(books)
+            self._version += 1
+            self._search_index = None
+            self._attribute_index = None
 
-    def browse(self) -> List[Book]:
-        return self.books
+    def browse(self, offset: int = 0, limit: Optional[int] = None, after_id: Optional[int] = None) -> List[Book]:
+        self._refresh()
+        with self._lock.reading:
+            if offset == 0 and limit is None and after_id is None:
+                return list(self._books.values())
+            return list(self._page(offset, limit, after_id))
+
+    def iter_books(self, offset: int = 0, limit: Optional[int] = None, after_id: Optional[int] = None) -> Iterator[Book]:
+        self._refresh()
+        if self.thread_safe:
+            return self._iter_books_locked(offset, limit, after_id)
+        return self._page(offset, limit, after_id)
 
     def read(self, book_id: int) -> Optional[Book]:
-        try:
-            return next(book for book in self.books if book.id == book_id)
-        except StopIteration:
-            return None
+        self._refresh()
+        with self._lock.reading:
+            return self._books.get(book_id)
+
+    def search(self, query: str) -> List[Book]:
+        self._refresh()
+        with self._lock.reading:
+            book_ids = self._ensure_search_index().search(query)
+            return [self._books[book_id] for book_id in sorted(book_ids)]
+
+    def find_by_author(self, author: str) -> List[Book]:
+        self._refresh()
+        with self._lock.reading:
+            return [self._books[book_id] for book_id in self._ensure_attribute_index().find_by_author(author)]
+
+    def find_by_year_range(self, start_year: int, end_year: int) -> List[Book]:
+        self._refresh()
+        with self._lock.reading:
+            book_ids = self._ensure_attribute_index().find_by_year_range(start_year, end_year)
+            return [self._books[book_id] for book_id in book_ids]
 
     def add(self, book_data: dict) -> int:
+        with self._mutating():
+            book = self._insert(book_data)
+            self._persist([{'op': 'add', 'book': book_to_dict(book)}])
+        return book.id
+
+    def edit(self, book_id: int, book_data: dict) -> bool:
+        # Only changed fields are applied and journaled; an edit that changes nothing writes nothing
+        with self._mutating():
+            changes = self._update(book_id, book_data)
+            if changes is None:
+                return False
+            if changes:
+                self._persist([{'op': 'patch', 'id': book_id, 'changes': changes}])
+        return True
+
+    def delete(self, book_id: int) -> bool:
+        with self._mutating():
+            if not self._remove(book_id):
+                return False
+            self._persist([{'op': 'delete', 'id': book_id}])
+        return True
+
+    def adjust_quantity(self, book_id: int, delta: int) -> Optional[int]:
+        # Read, check and write under one write lock, so concurrent adjustments never lose an update.
+        # The journal record carries only the resulting quantity.
+        with self._mutating():
+            book = self._books.get(book_id)
+            if not book:
+                return None
+            quantity = book.quantity + delta
+            if quantity < 0:
+                raise InsufficientStockError(book_id, book.quantity, -delta)
+            self._books[book_id] = updated_book = replace(book, quantity=quantity)
+            self._staged_changes.append(('edit', book_id, updated_book, {'quantity': quantity}))
+            self._persist([{'op': 'stock', 'id': book_id, 'quantity': quantity}])
+        return quantity
+
+    def add_many(self, books_data: List[Dict[str, Any]]) -> List[BulkResult]:
+        results, records = [], []
+        with self._mutating():
+            for index, book_data in enumerate(books_data):
+                try:
+                    book = self._insert(book_data)
+                except (KeyError, TypeError, ValueError) as e:
+                    results.append(BulkResult(index=index, success=False, error=describe_row_error(e)))
+                    continue
+                records.append({'op': 'add', 'book': book_to_dict(book)})
+                results.append(BulkResult(index=index, success=True, book_id=book.id))
+            self._persist(records)
+        return results
+
+    def edit_many(self, books_data: List[Dict[str, Any]]) -> List[BulkResult]:
+        results, records = [], []
+        with self._mutating():
+            for index, book_data in enumerate(books_data):
+                book_id = book_data.get('id')
+                try:
+                    changes = self._update(book_id, book_data)
+                except (TypeError, ValueError) as e:
+                    results.append(BulkResult(index=index, success=False, book_id=book_id, error=describe_row_error(e)))
+                    continue
+                if changes is None:
+                    results.append(BulkResult(index=index, success=False, book_id=book_id, error=f"Book with ID {book_id} not found"))
+                    continue
+                if changes:
+                    records.append({'op': 'patch', 'id': book_id, 'changes': changes})
+                results.append(BulkResult(index=index, success=True, book_id=book_id))
+            self._persist(records)
+        return results
+
+    def delete_many(self, book_ids: List[int]) -> List[BulkResult]:
+        results, records = [], []
+        with self._mutating():
+            for index, book_id in enumerate(book_ids):
+                if not self._remove(book_id):
+                    results.append(BulkResult(index=index, success=False, book_id=book_id, error=f"Book with ID {book_id} not found"))
+                    continue
+                records.append({'op': 'delete', 'id': book_id})
+                results.append(BulkResult(index=index, success=True, book_id=book_id))
+            self._persist(records)
+        return results
+
+    def snapshot(self) -> BookSnapshot:
+        self._refresh()
+        if isinstance(self._books, (LazyBookStore, MappedBookStore)):
+            # A view can outlive the file a lazy store reads from, so the store is loaded into
+            # memory first, as the first write does
+            with self._lock.writing:
+                if isinstance(self._books, (LazyBookStore, MappedBookStore)):
+                    self._release_store(list(self._books.values()))
+        with self._lock.reading:
+            books = self._books
+            with self._view_lock:
+                if self._viewed_store is not books:
+                    self._viewed_store, self._open_views = books, 0
+                self._open_views += 1
+            return BookSnapshot(books, self._version, partial(self._close_view, books))
+
+    def _close_view(self, books: MutableMapping[int, Book]) -> None:
+        with self._view_lock:
+            if books is self._viewed_store:
+                self._open_views -= 1
+                if not self._open_views:
+                    self._viewed_store = None
+
+    @contextmanager
+    def _mutating(self) -> Iterator[None]:
+        # Lock order: file lock, then the read/write lock, then _io_lock. A snapshot captured by
+        # _persist is written once the write lock is released but before the file lock is.
+        # Staged changes join the outbox in write order and are delivered after both locks.
+        staged = None
+        try:
+            with self._file_lock.exclusive():
+                with self._lock.writing:
+                    self._reload_if_changed()
+                    with self._view_lock:
+                        if self._viewed_store is self._books:
+                            self._books = self._books.copy()
+                            self._viewed_store, self._open_views = None, 0
+                    self._version += 1
+                    try:
+                        yield
+                    finally:
+                        # Staged changes are already in the store, even when the body then failed
+                        if self._staged_changes:
+                            staged = self._outbox.enqueue(self._staged_changes)
+                        self._staged_changes = []
+                        pending, self._pending_snapshot = self._pending_snapshot, None
+                self._write_pending(pending)
+        except BaseException:
+            if staged is not None:
+                self._outbox.finish(staged, failed=True)
+            raise
+        if staged is not None:
+            self._outbox.finish(staged)
+
+    def _refresh(self) -> None:
+        if not self.shared or file_signature(self.file_path) == self._signature:
+            return
+        with self._file_lock.shared():
+            with self._lock.writing:
+                self._reload_if_changed()
+
+    def _reload_if_changed(self) -> None:
+        if self.shared and file_signature(self.file_path) != self._signature:
+            self._load_from_json()
+
+    def _page(self, offset: int, limit: Optional[int], after_id: Optional[int]) -> Iterator[Book]:
+        # Ids are handed out in increasing order, so insertion order is also id order for keyset paging.
+        # Paging walks ids, so a lazy store only parses the books on the page.
+        book_ids = iter(self._books)
+        if after_id is not None:
+            book_ids = dropwhile(lambda book_id: book_id <= after_id, book_ids)
+        return map(self._books.__getitem__, islice(book_ids, offset, None if limit is None else offset + limit))
+
+    def _iter_books_locked(self, offset: int, limit: Optional[int], after_id: Optional[int]) -> Iterator[Book]:
+        # Copy the page's ids under the lock, then fetch books a batch at a time so a long scan
+        # never blocks writers for its whole duration; books deleted in between are skipped
+        with self._lock.reading:
+            book_ids = iter(self._books)
+            if after_id is not None:
+                book_ids = dropwhile(lambda book_id: book_id <= after_id, book_ids)
+            book_ids = list(islice(book_ids, offset, None if limit is None else offset + limit))
+        for start in range(0, len(book_ids), _ITER_BATCH_SIZE):
+            with self._lock.reading:
+                batch = [self._books.get(book_id) for book_id in book_ids[start:start + _ITER_BATCH_SIZE]]
+            yield from (book for book in batch if book is not None)
+
+    def _ensure_search_index(self) -> BookSearchIndex:
+        # Readers may race to build the index; only one of them does the work
+        if self._search_index is None:
+            with self._index_lock:
+                if self._search_index is None:
+                    self._search_index = BookSearchIndex(self._books.values())
+        return self._search_index
+
+    def _ensure_attribute_index(self) -> BookAttributeIndex:
+        if self._attribute_index is None:
+            with self._index_lock:
+                if self._attribute_index is None:
+                    self._attribute_index = BookAttributeIndex(self._books.values())
+        return self._attribute_index
+
+    def _insert(self, book_data: Dict[str, Any]) -> Book:
         book = Book(
             title=book_data['title'],
             author=book_data['author'],
@@ -27,61 +363,236 @@ class BookInterfaceImplementation(BookRepositoryInterface):
             quantity=book_data['quantity'],
             id=self.next_id
         )
-        self.books.append(book)
+        self._books[book.id] = book
         self.next_id += 1
-        self._save_to_json()
-        return book.id
+        if self._search_index is not None:
+            self._search_index.add(book)
+        if self._attribute_index is not None:
+            self._attribute_index.add(book)
+        self._staged_changes.append(('add', book.id, book))
+        return book
 
-    def edit(self, book_id: int, book_data: dict) -> bool:
-        book = self.read(book_id)
+    def _update(self, book_id: int, book_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        # Returns the fields that changed, or None when there is no such book
+        book = self._books.get(book_id)
         if not book:
+            return None
+        changes = changed_fields(book, book_data)
+        if not changes:
+            return changes
+
+        updated_book = replace(book, **changes)
+        self._books[book_id] = updated_book
+        if self._search_index is not None:
+            self._search_index.update(updated_book)
+        if self._attribute_index is not None:
+            self._attribute_index.update(updated_book)
+        self._staged_changes.append(('edit', book_id, updated_book, changes))
+        return changes
+
+    def _remove(self, book_id: int) -> bool:
+        if book_id not in self._books:
             return False
-            
-        updated_book = Book(
-            title=book_data.get('title', book.title),
-            author=book_data.get('author', book.author),
-            published_year=book_data.get('published_year', book.published_year),
-            quantity=book_data.get('quantity', book.quantity),
-            id=book_id
-        )
-        
-        self.books = [updated_book if b.id == book_id else b for b in self.books]
-        self._save_to_json()
+        del self._books[book_id]
+        if self._search_index is not None:
+            self._search_index.remove(book_id)
+        if self._attribute_index is not None:
+            self._attribute_index.remove(book_id)
+        self._staged_changes.append(('delete', book_id))
         return True
 
-    def delete(self, book_id: int) -> bool:
-        initial_length = len(self.books)
-        self.books = [book for book in self.books if book.id != book_id]
-        if len(self.books) < initial_length:
-            self._save_to_json()
-            return True
-        return False
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        # Snapshot writes are deferred to the end of the outermost batch, like a commit interval
+        # that closes when the block does. Journaled mode already appends per call, and shared
+        # mode always writes through so other processes see every change.
+        with self._commit_lock:
+            self._batch_depth += 1
+        try:
+            yield
+        finally:
+            with self._commit_lock:
+                self._batch_depth -= 1
+                closed = self._batch_depth == 0
+            if closed:
+                self.flush()
+
+    def compact(self) -> None:
+        with self._mutating():
+            self._compact()
+
+    def flush(self) -> None:
+        # The commit lock is never held while waiting for the read/write lock, since writers
+        # take the commit lock in _schedule_save while they hold the write lock
+        with self._flush_lock:
+            with self._commit_lock:
+                if self._commit_timer is not None:
+                    self._commit_timer.cancel()
+                    self._commit_timer = None
+                dirty, self._dirty = self._dirty, False
+            if dirty:
+                try:
+                    with self._lock.writing:
+                        pending = self._capture_snapshot()
+                    self._write_pending(pending)
+                except BaseException:
+                    # Still unsaved: the next flush, or close(), tries again
+                    with self._commit_lock:
+                        self._dirty = True
+                    raise
+            if self.journal:
+                self.journal.sync()
+
+    def close(self) -> None:
+        self.flush()
+        with self._lock.writing:
+            if self.journal:
+                self.journal.close()
+            if isinstance(self._books, MappedBookStore):
+                self._books.close()
+        self._file_lock.close()
+
+    def _compact(self) -> None:
+        self._save_to_json()
+        if self.journal:
+            self.journal.truncate()
+
+    def _persist(self, records: List[Dict[str, Any]]) -> None:
+        # Called inside _mutating, which writes a captured snapshot after releasing the write lock
+        if not records:
+            return
+        if self.journal:
+            self.journal.append_many(records)
+            if self.journal.record_count >= self.compaction_threshold:
+                self._compact()
+        elif self.commit_interval > 0:
+            self._schedule_save()
+        elif self._batch_depth and not self.shared:
+            with self._commit_lock:
+                self._dirty = True
+        else:
+            self._pending_snapshot = self._capture_snapshot()
+
+    def _schedule_save(self) -> None:
+        with self._commit_lock:
+            self._dirty = True
+            if self._commit_timer is None:
+                self._commit_timer = threading.Timer(self.commit_interval, self.flush)
+                self._commit_timer.daemon = True
+                self._commit_timer.start()
+
+    def _apply_journal_record(self, record: Dict[str, Any]) -> None:
+        # Records carry the full resulting state, so replaying one twice is harmless
+        if record['op'] == 'delete':
+            self._books.pop(record['id'], None)
+        elif record['op'] == 'patch':
+            book = self._books.get(record['id'])
+            if book:
+                self._books[book.id] = replace(book, **record['changes'])
+        elif record['op'] == 'stock':
+            book = self._books.get(record['id'])
+            if book:
+                self._books[book.id] = replace(book, quantity=record['quantity'])
+        else:
+            book = Book(**record['book'])
+            self._books[book.id] = book
+
+    def _new_store(self, books: Iterable[Book] = ()) -> MutableMapping[int, Book]:
+        if self.columnar:
+            return BookColumnStore(books)
+        return {book.id: book for book in books}
 
     def _save_to_json(self) -> None:
-        with open(self.file_path, 'w') as file:
-            books_data = [
-                {
-                    'id': book.id,
-                    'title': book.title,
-                    'author': book.author,
-                    'published_year': book.published_year,
-                    'quantity': book.quantity
-                }
-                for book in self.books
-            ]
-            json.dump(books_data, file, indent=4)
+        self._write_pending(self._capture_snapshot())
+
+    def _capture_snapshot(self) -> Tuple[int, List[Book]]:
+        books = list(self._books.values())
+        if isinstance(self._books, (LazyBookStore, MappedBookStore)):
+            # Everything is in memory now; let go of the old file before it is replaced
+            self._release_store(books)
+        self._snapshot_version += 1
+        return self._snapshot_version, books
+
+    def _write_pending(self, pending: Optional[Tuple[int, List[Book]]]) -> None:
+        if pending is None:
+            return
+        version, books = pending
+        with self._io_lock:
+            if version <= self._written_version:
+                # A newer snapshot has already been written
+                return
+            self._write_snapshot(books)
+            self._written_version = version
+            if self.shared:
+                self._signature = file_signature(self.file_path)
+
+    def _write_snapshot(self, books: List[Book]) -> None:
+        with atomic_write(self.file_path, 'wb' if self.codec.binary else 'w') as file:
+            if self._encoded is None:
+                self.codec.dump(books, file)
+            else:
+                self.codec.dump_encoded(self._encode_records(books), file)
+
+    def _encode_records(self, books: List[Book]) -> List[str]:
+        # Runs under _io_lock. Rebuilding the cache from this snapshot drops deleted books.
+        previous, self._encoded = self._encoded, {}
+        encode = self.codec.encode
+        records = []
+        for book in books:
+            entry = previous.get(book.id)
+            if entry is None or entry[0] is not book:
+                entry = (book, encode(book))
+            self._encoded[book.id] = entry
+            records.append(entry[1])
+        return records
 
     def _load_from_json(self) -> None:
+        self._version += 1
+        self._search_index = None
+        self._attribute_index = None
+        self._signature = file_signature(self.file_path)
+        self._release_store(())
         try:
-            with open(self.file_path, 'r') as file:
-                try:
-                    books_data = json.load(file)
-                    self.books = [Book(**book_data) for book_data in books_data]
-                    self.next_id = max((book.id for book in self.books), default=-1) + 1
-                except json.JSONDecodeError:
-                    # Handle invalid JSON
-                    self.books = []
-                    self.next_id = 0
+            if self.lazy and isinstance(self.codec, TextSnapshotCodec):
+                self._books = LazyBookStore.index_file(self.file_path, self.codec)
+            elif self.lazy:
+                self._books = MappedBookStore.open(self.file_path)
+            else:
+                with open(self.file_path, 'rb' if self.codec.binary else 'r') as file:
+                    # Records are parsed as they stream in instead of loading the whole document first
+                    self._books = self._new_store(self.codec.load(file))
+            self.next_id = self._max_id() + 1
+        except (json.JSONDecodeError, SnapshotFormatError) as e:
+            # Start empty, but move the unreadable snapshot aside first: the next write would
+            # otherwise replace the user's data with the empty catalogue
+            self._books = self._new_store()
+            self.next_id = 0
+            self._quarantine_snapshot(e)
         except FileNotFoundError:
-            self.books = []
+            self._books = self._new_store()
             self.next_id = 0
+
+        if self.journal:
+            for record in self.journal.replay():
+                self._apply_journal_record(record)
+            self.next_id = self._max_id() + 1
+
+    def _quarantine_snapshot(self, error: Exception) -> None:
+        if not os.path.getsize(self.file_path):
+            return
+        corrupt_path = f"{self.file_path}.corrupt-{time.time_ns()}"
+        os.replace(self.file_path, corrupt_path)
+        self.corrupt_snapshot_path = corrupt_path
+        self._signature = file_signature(self.file_path)
+        _logger.warning("Unreadable snapshot %s moved to %s: %s", self.file_path, corrupt_path, error)
+
+    def _max_id(self) -> int:
+        if isinstance(self._books, MappedBookStore):
+            # Read from the snapshot header instead of scanning every record
+            return self._books.max_id()
+        return max(self._books, default=-1)
+
+    def _release_store(self, books: Iterable[Book]) -> None:
+        if isinstance(self._books, MappedBookStore):
+            self._books.close()
+        self._books = self._new_store(books)
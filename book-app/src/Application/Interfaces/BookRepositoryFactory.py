@@ -0,0 +1,64 @@
+import json
+from typing import Dict, Optional
+from src.Domain.Interfaces.AsyncBookInterface import AsyncBookRepositoryInterface
+from src.Domain.Interfaces.BookInterface import BookRepositoryInterface
+
+DEFAULT_SETTINGS_PATH = "book-app/appsettings.json"
+DEFAULT_JSON_PATH = "book-app/src/Infrastructure/Data/Books.json"
+
+_SQLITE_URL_PREFIX = "sqlite:///"
+_SQLITE_SOURCE_KEYS = ("data source", "datasource", "filename")
+
+def load_connection_string(settings_path: str = DEFAULT_SETTINGS_PATH) -> Optional[str]:
+    try:
+        with open(settings_path, 'r') as file:
+            settings = json.load(file)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    return settings.get('ConnectionStrings', {}).get('DefaultConnection')
+
+def sqlite_path_from_connection_string(connection_string: Optional[str]) -> Optional[str]:
+    # Accepts "sqlite:///path.db" or ADO.NET style "Data Source=path.db"; anything else is not SQLite
+    if not connection_string:
+        return None
+    if connection_string.startswith(_SQLITE_URL_PREFIX):
+        return connection_string[len(_SQLITE_URL_PREFIX):]
+    settings = _parse_connection_string(connection_string)
+    if 'server' in settings:
+        return None
+    return next((settings[key] for key in _SQLITE_SOURCE_KEYS if key in settings), None)
+
+def create_repository(
+    connection_string: Optional[str] = None,
+    json_path: str = DEFAULT_JSON_PATH,
+    thread_safe: bool = False,
+    cached: bool = False,
+    lazy: bool = False,
+    shared: bool = False
+) -> BookRepositoryInterface:
+    database_path = sqlite_path_from_connection_string(connection_string)
+    if database_path:
+        # Always thread-safe: every statement runs under the connection lock
+        from src.Application.Interfaces.BookSqliteImplementation import BookSqliteImplementation
+        repository: BookRepositoryInterface = BookSqliteImplementation(database_path)
+    else:
+        from src.Application.Interfaces.BookInterfaceImplementation import BookInterfaceImplementation
+        # Lazy: index the snapshot's records at startup and parse each one on first access.
+        # Shared: several processes use the same snapshot file.
+        repository = BookInterfaceImplementation(json_path, thread_safe=thread_safe, lazy=lazy, shared=shared)
+    if cached:
+        from src.Application.Interfaces.CachingBookRepository import CachingBookRepository
+        repository = CachingBookRepository(repository)
+    return repository
+
+def create_async_repository(connection_string: Optional[str] = None, json_path: str = DEFAULT_JSON_PATH) -> AsyncBookRepositoryInterface:
+    from src.Application.Interfaces.AsyncBookRepositoryAdapter import AsyncBookRepositoryAdapter
+    return AsyncBookRepositoryAdapter(create_repository(connection_string, json_path, thread_safe=True))
+
+def _parse_connection_string(connection_string: str) -> Dict[str, str]:
+    settings = {}
+    for part in connection_string.split(';'):
+        key, separator, value = part.partition('=')
+        if separator:
+            settings[key.strip().lower()] = value.strip()
+    return settings
@@ -0,0 +1,357 @@
+import sqlite3
+import threading
+from contextlib import contextmanager
+from dataclasses import replace
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Tuple
+from src.Domain.Entities.Book import Book, changed_fields
+from src.Domain.Entities.BookSnapshot import BookSnapshot
+from src.Domain.Entities.BulkResult import BulkResult, describe_row_error
+from src.Domain.Entities.InsufficientStockError import InsufficientStockError
+from src.Domain.Interfaces.BookInterface import BookRepositoryInterface
+from src.Application.Events.BookChangeFeed import BookChangeFeed
+from src.Application.Events.BookChangeOutbox import BookChangeOutbox
+from src.Application.Indexes.BookSearchIndex import tokenize
+
+_COLUMNS = "id, title, author, published_year, quantity"
+
+# Statements are module constants so sqlite3's per-connection statement cache reuses the
+# prepared form instead of re-parsing the SQL on every call.
+_CREATE_TABLE = """
+    CREATE TABLE IF NOT EXISTS books (
+        id INTEGER PRIMARY KEY,
+        title TEXT NOT NULL,
+        author TEXT NOT NULL,
+        published_year INTEGER NOT NULL,
+        quantity INTEGER NOT NULL CHECK (quantity >= 0)
+    )
+"""
+_CREATE_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS ix_books_title ON books (title COLLATE NOCASE)",
+    "CREATE INDEX IF NOT EXISTS ix_books_author ON books (author COLLATE NOCASE)",
+    "CREATE INDEX IF NOT EXISTS ix_books_published_year ON books (published_year)",
+)
+_SELECT_ALL = f"SELECT {_COLUMNS} FROM books ORDER BY id"
+_SELECT_PAGE = f"SELECT {_COLUMNS} FROM books WHERE id > ? ORDER BY id LIMIT ? OFFSET ?"
+_SELECT_ONE = f"SELECT {_COLUMNS} FROM books WHERE id = ?"
+# Both use the matching index: NOCASE on author, published_year for the range
+_SELECT_BY_AUTHOR = f"SELECT {_COLUMNS} FROM books WHERE author = ? COLLATE NOCASE ORDER BY id"
+_SELECT_BY_YEARS = f"SELECT {_COLUMNS} FROM books WHERE published_year BETWEEN ? AND ? ORDER BY published_year, id"
+_SELECT_NEXT_ID = "SELECT COALESCE(MAX(id), -1) + 1 FROM books"
+_SELECT_IDS = "SELECT id FROM books ORDER BY id"
+_COUNT = "SELECT COUNT(*) FROM books"
+_INSERT = "INSERT INTO books (id, title, author, published_year, quantity) VALUES (?, ?, ?, ?, ?)"
+_UPDATE = "UPDATE books SET title = ?, author = ?, published_year = ?, quantity = ? WHERE id = ?"
+_DELETE = "DELETE FROM books WHERE id = ?"
+# The delta is applied by the database, so no stale quantity is ever written back
+_ADJUST_QUANTITY = "UPDATE books SET quantity = quantity + ? WHERE id = ? AND quantity + ? >= 0"
+_STREAM_BATCH_SIZE = 500
+_SEARCH_TERM = "(title LIKE ? ESCAPE '\\' OR author LIKE ? ESCAPE '\\')"
+# Full-text index over title and author, kept in step with books by triggers. The trigram
+# tokenizer matches any substring of three or more characters, case-insensitively, so search
+# terms that long are answered from the index instead of a LIKE scan of every row.
+_SEARCH_TABLE_EXISTS = "SELECT 1 FROM sqlite_master WHERE name = 'books_search'"
+_CREATE_SEARCH_TABLE = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS books_search "
+    "USING fts5(title, author, content='books', content_rowid='id', tokenize='trigram')"
+)
+_CREATE_SEARCH_TRIGGERS = (
+    """CREATE TRIGGER IF NOT EXISTS books_search_insert AFTER INSERT ON books BEGIN
+        INSERT INTO books_search (rowid, title, author) VALUES (new.id, new.title, new.author);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS books_search_delete AFTER DELETE ON books BEGIN
+        INSERT INTO books_search (books_search, rowid, title, author) VALUES ('delete', old.id, old.title, old.author);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS books_search_update AFTER UPDATE OF title, author ON books BEGIN
+        INSERT INTO books_search (books_search, rowid, title, author) VALUES ('delete', old.id, old.title, old.author);
+        INSERT INTO books_search (rowid, title, author) VALUES (new.id, new.title, new.author);
+    END""",
+)
+_REBUILD_SEARCH_TABLE = "INSERT INTO books_search (books_search) VALUES ('rebuild')"
+_SEARCH_MATCH = "id IN (SELECT rowid FROM books_search WHERE books_search MATCH ?)"
+_MIN_MATCH_LENGTH = 3
+
+class BookSqliteImplementation(BookRepositoryInterface):
+    def __init__(self, database_path: str = "book-app/src/Infrastructure/Data/Books.db", change_retention: int = 10000):
+        self.database_path = database_path
+        # Autocommit mode; transactions are opened explicitly so writes can take the lock up front
+        self._connection = sqlite3.connect(database_path, isolation_level=None, check_same_thread=False)
+        self._lock = threading.RLock()
+        # Changes are staged while a transaction runs and queued in commit order when it commits;
+        # they are published after the lock is released, so subscribers never hold up readers.
+        # A rolled-back transaction publishes nothing.
+        self.changes = BookChangeFeed(change_retention)
+        self._staged_changes: List[Tuple[Any, ...]] = []
+        self._outbox = BookChangeOutbox(self.changes)
+        if database_path != ":memory:":
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(_CREATE_TABLE)
+        for statement in _CREATE_INDEXES:
+            self._connection.execute(statement)
+        self.full_text_search = self._create_search_table()
+
+    def browse(self, offset: int = 0, limit: Optional[int] = None, after_id: Optional[int] = None) -> List[Book]:
+        with self._lock:
+            if offset == 0 and limit is None and after_id is None:
+                rows = self._connection.execute(_SELECT_ALL)
+            else:
+                # SQLite treats a negative LIMIT as unbounded; -1 is below every id
+                params = (-1 if after_id is None else after_id, -1 if limit is None else limit, offset)
+                rows = self._connection.execute(_SELECT_PAGE, params)
+            return [self._row_to_book(row) for row in rows]
+
+    def iter_books(self, offset: int = 0, limit: Optional[int] = None, after_id: Optional[int] = None) -> Iterator[Book]:
+        # Keyset batches: the lock is only held per batch and memory stays bounded by the batch size
+        remaining = limit
+        while remaining is None or remaining > 0:
+            batch_size = _STREAM_BATCH_SIZE if remaining is None else min(_STREAM_BATCH_SIZE, remaining)
+            books = self.browse(offset, batch_size, after_id)
+            yield from books
+            if len(books) < batch_size:
+                return
+            after_id, offset = books[-1].id, 0
+            if remaining is not None:
+                remaining -= len(books)
+
+    def read(self, book_id: int) -> Optional[Book]:
+        with self._lock:
+            row = self._connection.execute(_SELECT_ONE, (book_id,)).fetchone()
+        return self._row_to_book(row) if row else None
+
+    def search(self, query: str) -> List[Book]:
+        # Same semantics as the in-memory index: every term must occur in the title or author.
+        # Terms of three or more characters go to the full-text index; shorter ones, or every
+        # term when SQLite lacks FTS5, fall back to LIKE, which scans the rows left to check.
+        terms = tokenize(query)
+        if not terms:
+            return []
+        conditions: List[str] = []
+        params: List[str] = []
+        indexed = [term for term in terms if self.full_text_search and len(term) >= _MIN_MATCH_LENGTH]
+        if indexed:
+            conditions.append(_SEARCH_MATCH)
+            params.append(' AND '.join('"' + term.replace('"', '""') + '"' for term in indexed))
+        for term in terms:
+            if term in indexed:
+                continue
+            pattern = '%' + term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+            conditions.append(_SEARCH_TERM)
+            params.extend((pattern, pattern))
+        sql = f"SELECT {_COLUMNS} FROM books WHERE {' AND '.join(conditions)} ORDER BY id"
+        with self._lock:
+            return [self._row_to_book(row) for row in self._connection.execute(sql, params)]
+
+    def find_by_author(self, author: str) -> List[Book]:
+        # NOCASE folds ASCII case only; whitespace is collapsed here to match the in-memory index
+        with self._lock:
+            rows = self._connection.execute(_SELECT_BY_AUTHOR, (' '.join(author.split()),))
+            return [self._row_to_book(row) for row in rows]
+
+    def find_by_year_range(self, start_year: int, end_year: int) -> List[Book]:
+        with self._lock:
+            rows = self._connection.execute(_SELECT_BY_YEARS, (start_year, end_year))
+            return [self._row_to_book(row) for row in rows]
+
+    def add(self, book_data: dict) -> int:
+        with self._transaction() as cursor:
+            book_id = cursor.execute(_SELECT_NEXT_ID).fetchone()[0]
+            book = self._new_book(book_data, book_id)
+            cursor.execute(_INSERT, self._insert_params(book))
+            self._staged_changes.append(('add', book_id, book))
+        return book_id
+
+    def edit(self, book_id: int, book_data: dict) -> bool:
+        with self._transaction() as cursor:
+            return self._edit_row(cursor, book_id, book_data)
+
+    def delete(self, book_id: int) -> bool:
+        with self._transaction() as cursor:
+            return self._delete_row(cursor, book_id)
+
+    def adjust_quantity(self, book_id: int, delta: int) -> Optional[int]:
+        with self._transaction() as cursor:
+            updated = cursor.execute(_ADJUST_QUANTITY, (delta, book_id, delta)).rowcount > 0
+            row = cursor.execute(_SELECT_ONE, (book_id,)).fetchone()
+            if updated:
+                book = self._row_to_book(row)
+                self._staged_changes.append(('edit', book_id, book, {'quantity': book.quantity}))
+        if not row:
+            return None
+        if not updated:
+            raise InsufficientStockError(book_id, row[4], -delta)
+        return row[4]
+
+    def add_many(self, books_data: List[Dict[str, Any]]) -> List[BulkResult]:
+        results, params = [], []
+        with self._transaction() as cursor:
+            next_id = cursor.execute(_SELECT_NEXT_ID).fetchone()[0]
+            for index, book_data in enumerate(books_data):
+                try:
+                    book = self._new_book(book_data, next_id)
+                except (KeyError, TypeError, ValueError) as e:
+                    results.append(BulkResult(index=index, success=False, error=describe_row_error(e)))
+                    continue
+                params.append(self._insert_params(book))
+                self._staged_changes.append(('add', book.id, book))
+                results.append(BulkResult(index=index, success=True, book_id=book.id))
+                next_id += 1
+            cursor.executemany(_INSERT, params)
+        return results
+
+    def edit_many(self, books_data: List[Dict[str, Any]]) -> List[BulkResult]:
+        results = []
+        with self._transaction() as cursor:
+            for index, book_data in enumerate(books_data):
+                book_id = book_data.get('id')
+                try:
+                    found = self._edit_row(cursor, book_id, book_data)
+                except (TypeError, ValueError) as e:
+                    results.append(BulkResult(index=index, success=False, book_id=book_id, error=describe_row_error(e)))
+                    continue
+                if not found:
+                    results.append(BulkResult(index=index, success=False, book_id=book_id, error=f"Book with ID {book_id} not found"))
+                    continue
+                results.append(BulkResult(index=index, success=True, book_id=book_id))
+        return results
+
+    def delete_many(self, book_ids: List[int]) -> List[BulkResult]:
+        results = []
+        with self._transaction() as cursor:
+            for index, book_id in enumerate(book_ids):
+                if self._delete_row(cursor, book_id):
+                    results.append(BulkResult(index=index, success=True, book_id=book_id))
+                else:
+                    results.append(BulkResult(index=index, success=False, book_id=book_id, error=f"Book with ID {book_id} not found"))
+        return results
+
+    def snapshot(self) -> BookSnapshot:
+        # In WAL mode a read transaction sees the database as of its first read until it ends, and
+        # writers keep committing meanwhile; the view is such a transaction on its own connection.
+        # An open view holds back WAL checkpoints, so close it when done. In-memory databases
+        # cannot be opened twice and are copied instead.
+        with self._lock:
+            version = self._connection.total_changes
+            if self.database_path == ":memory:":
+                return BookSnapshot({book.id: book for book in self.browse()}, version)
+            connection = sqlite3.connect(self.database_path, isolation_level=None, check_same_thread=False)
+            connection.execute("BEGIN")
+            connection.execute(_SELECT_NEXT_ID).fetchone()
+        return BookSnapshot(_SnapshotRows(connection, self._row_to_book), version, on_close=connection.close)
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def _create_search_table(self) -> bool:
+        # False when this SQLite build has no FTS5 or no trigram tokenizer (before 3.34)
+        with self._lock:
+            existed = self._connection.execute(_SEARCH_TABLE_EXISTS).fetchone() is not None
+            try:
+                self._connection.execute(_CREATE_SEARCH_TABLE)
+            except sqlite3.OperationalError:
+                return False
+            for statement in _CREATE_SEARCH_TRIGGERS:
+                self._connection.execute(statement)
+            if not existed:
+                # A database created before the index existed
+                self._connection.execute(_REBUILD_SEARCH_TABLE)
+        return True
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Cursor]:
+        staged = None
+        with self._lock:
+            cursor = self._connection.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                yield cursor
+            except BaseException:
+                self._staged_changes.clear()
+                cursor.execute("ROLLBACK")
+                raise
+            cursor.execute("COMMIT")
+            if self._staged_changes:
+                staged = self._outbox.enqueue(self._staged_changes)
+                self._staged_changes = []
+        if staged is not None:
+            self._outbox.finish(staged)
+
+    def _edit_row(self, cursor: sqlite3.Cursor, book_id: int, book_data: Dict[str, Any]) -> bool:
+        # Returns False when there is no such book; an edit that changes nothing issues no UPDATE
+        row = cursor.execute(_SELECT_ONE, (book_id,)).fetchone()
+        if not row:
+            return False
+        book = self._row_to_book(row)
+        changes = changed_fields(book, book_data)
+        if changes:
+            updated_book = replace(book, **changes)
+            cursor.execute(_UPDATE, self._update_params(updated_book))
+            self._staged_changes.append(('edit', book_id, updated_book, changes))
+        return True
+
+    def _delete_row(self, cursor: sqlite3.Cursor, book_id: int) -> bool:
+        if cursor.execute(_DELETE, (book_id,)).rowcount == 0:
+            return False
+        self._staged_changes.append(('delete', book_id))
+        return True
+
+    @staticmethod
+    def _new_book(book_data: Dict[str, Any], book_id: int) -> Book:
+        return Book(
+            title=book_data['title'],
+            author=book_data['author'],
+            published_year=book_data['published_year'],
+            quantity=book_data['quantity'],
+            id=book_id
+        )
+
+    @staticmethod
+    def _insert_params(book: Book) -> Tuple[Any, ...]:
+        return (book.id, book.title, book.author, book.published_year, book.quantity)
+
+    @staticmethod
+    def _update_params(book: Book) -> Tuple[Any, ...]:
+        return (book.title, book.author, book.published_year, book.quantity, book.id)
+
+    @staticmethod
+    def _row_to_book(row: Tuple[Any, ...]) -> Book:
+        return Book(id=row[0], title=row[1], author=row[2], published_year=row[3], quantity=row[4])
+
+class _SnapshotRows(Mapping[int, Book]):
+    # Books as seen by one open read transaction, queried on demand
+    def __init__(self, connection: sqlite3.Connection, row_to_book: Callable[[Tuple[Any, ...]], Book]):
+        self._connection = connection
+        self._row_to_book = row_to_book
+        self._lock = threading.Lock()
+
+    def __getitem__(self, book_id: int) -> Book:
+        with self._lock:
+            row = self._connection.execute(_SELECT_ONE, (book_id,)).fetchone()
+        if row is None:
+            raise KeyError(book_id)
+        return self._row_to_book(row)
+
+    def __iter__(self) -> Iterator[int]:
+        for rows in self._batches(_SELECT_IDS):
+            for row in rows:
+                yield row[0]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute(_COUNT).fetchone()[0]
+
+    def values(self) -> Iterator[Book]:
+        # One ordered scan instead of a lookup per id
+        for rows in self._batches(_SELECT_ALL):
+            yield from map(self._row_to_book, rows)
+
+    def _batches(self, statement: str) -> Iterator[List[Tuple[Any, ...]]]:
+        # Each caller gets its own cursor; the lock is only held while a batch is fetched
+        with self._lock:
+            cursor = self._connection.execute(statement)
+        while True:
+            with self._lock:
+                rows = cursor.fetchmany(_STREAM_BATCH_SIZE)
+            if not rows:
+                return
+            yield rows
@@ -0,0 +1,253 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Any, Callable, ContextManager, Dict, Hashable, Iterator, List, Optional, Tuple
+from src.Domain.Entities.Book import Book
+from src.Domain.Entities.BookSnapshot import BookSnapshot
+from src.Domain.Entities.BulkResult import BulkResult
+from src.Domain.Interfaces.BookInterface import BookRepositoryInterface
+from src.Application.Events.BookChangeFeed import BookChangeFeed
+from src.Application.Indexes.BookAttributeIndex import normalize_author
+from src.Application.Indexes.BookSearchIndex import matches
+
+@dataclass
+class CacheStats:
+    read_hits: int = 0
+    read_misses: int = 0
+    query_hits: int = 0
+    query_misses: int = 0
+
+_MISSING = object()
+# Fields whose change can move a book into or out of a cached search or find_by_* result
+_FILTERED_FIELDS = ('title', 'author', 'published_year')
+
+# Read-through cache for a slow repository. read() results, including "not found", sit in an LRU
+# bounded by read_cache_size; browse pages, searches and find_by_* results sit in a second LRU
+# whose entries also expire after query_ttl seconds. Writes made through this wrapper drop
+# exactly the entries they can change. Writes made elsewhere are only seen once a query entry
+# expires or a read entry is evicted, so share one wrapper per process.
+class CachingBookRepository(BookRepositoryInterface):
+    def __init__(
+        self,
+        repository: BookRepositoryInterface,
+        read_cache_size: int = 1024,
+        query_cache_size: int = 256,
+        query_ttl: float = 30.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.repository = repository
+        self.read_cache_size = read_cache_size
+        self.query_cache_size = query_cache_size
+        self.query_ttl = query_ttl
+        self.stats = CacheStats()
+        self._clock = clock
+        self._reads: 'OrderedDict[int, Optional[Book]]' = OrderedDict()
+        self._queries: 'OrderedDict[Tuple[Hashable, ...], Tuple[float, List[Book]]]' = OrderedDict()
+        self._lock = threading.Lock()
+        # Bumped by every invalidation; a fetch that raced with a write does not store its result
+        self._generation: int = 0
+
+    def browse(self, offset: int = 0, limit: Optional[int] = None, after_id: Optional[int] = None) -> List[Book]:
+        return self._cached_query(('browse', offset, limit, after_id), lambda: self.repository.browse(offset, limit, after_id))
+
+    def iter_books(self, offset: int = 0, limit: Optional[int] = None, after_id: Optional[int] = None) -> Iterator[Book]:
+        # Streams are not cached
+        return self.repository.iter_books(offset, limit, after_id)
+
+    def read(self, book_id: int) -> Optional[Book]:
+        with self._lock:
+            book = self._reads.get(book_id, _MISSING)
+            if book is not _MISSING:
+                self._reads.move_to_end(book_id)
+                self.stats.read_hits += 1
+                return book
+            self.stats.read_misses += 1
+            generation = self._generation
+        book = self.repository.read(book_id)
+        with self._lock:
+            if generation == self._generation:
+                self._reads[book_id] = book
+                if len(self._reads) > self.read_cache_size:
+                    self._reads.popitem(last=False)
+        return book
+
+    def search(self, query: str) -> List[Book]:
+        return self._cached_query(('search', query), lambda: self.repository.search(query))
+
+    def find_by_author(self, author: str) -> List[Book]:
+        return self._cached_query(('author', normalize_author(author)), lambda: self.repository.find_by_author(author))
+
+    def find_by_year_range(self, start_year: int, end_year: int) -> List[Book]:
+        return self._cached_query(
+            ('years', start_year, end_year), lambda: self.repository.find_by_year_range(start_year, end_year)
+        )
+
+    def add(self, book_data: dict) -> int:
+        book_id = self.repository.add(book_data)
+        self._invalidate_added([self._new_book(book_data, book_id)])
+        return book_id
+
+    def edit(self, book_id: int, book_data: dict) -> bool:
+        if not self.repository.edit(book_id, book_data):
+            return False
+        self._invalidate_edited([(book_id, book_data)])
+        return True
+
+    def delete(self, book_id: int) -> bool:
+        if not self.repository.delete(book_id):
+            return False
+        self._invalidate_deleted([book_id])
+        return True
+
+    def adjust_quantity(self, book_id: int, delta: int) -> Optional[int]:
+        quantity = self.repository.adjust_quantity(book_id, delta)
+        if quantity is not None:
+            self._invalidate_edited([(book_id, {'quantity': quantity})])
+        return quantity
+
+    def add_many(self, books_data: List[Dict[str, Any]]) -> List[BulkResult]:
+        results = self.repository.add_many(books_data)
+        self._invalidate_added([
+            self._new_book(books_data[result.index], result.book_id) for result in results if result.success
+        ])
+        return results
+
+    def edit_many(self, books_data: List[Dict[str, Any]]) -> List[BulkResult]:
+        results = self.repository.edit_many(books_data)
+        self._invalidate_edited([(result.book_id, books_data[result.index]) for result in results if result.success])
+        return results
+
+    def delete_many(self, book_ids: List[int]) -> List[BulkResult]:
+        results = self.repository.delete_many(book_ids)
+        self._invalidate_deleted([result.book_id for result in results if result.success])
+        return results
+
+    @property
+    def changes(self) -> Optional[BookChangeFeed]:
+        return getattr(self.repository, 'changes', None)
+
+    def snapshot(self) -> BookSnapshot:
+        return self.repository.snapshot()
+
+    def batch(self) -> ContextManager[None]:
+        return self.repository.batch()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._reads.clear()
+            self._queries.clear()
+
+    def close(self) -> None:
+        close = getattr(self.repository, 'close', None)
+        if close is not None:
+            close()
+
+    def _cached_query(self, key: Tuple[Hashable, ...], fetch: Callable[[], List[Book]]) -> List[Book]:
+        now = self._clock()
+        with self._lock:
+            entry = self._queries.get(key)
+            if entry is not None and entry[0] > now:
+                self._queries.move_to_end(key)
+                self.stats.query_hits += 1
+                return list(entry[1])
+            if entry is not None:
+                del self._queries[key]
+            self.stats.query_misses += 1
+            generation = self._generation
+        books = fetch()
+        with self._lock:
+            if generation == self._generation:
+                self._queries[key] = (now + self.query_ttl, list(books))
+                if len(self._queries) > self.query_cache_size:
+                    self._queries.popitem(last=False)
+        return books
+
+    def _invalidate_added(self, books: List[Book]) -> None:
+        if not books:
+            return
+        with self._lock:
+            self._generation += 1
+            for book in books:
+                # The id may be cached as "not found"
+                self._reads.pop(book.id, None)
+            self._drop_queries(lambda key, cached: any(
+                self._page_shifted(key, cached, book.id) if key[0] == 'browse' else self._query_matches(key, book)
+                for book in books
+            ))
+
+    def _invalidate_edited(self, edits: List[Tuple[int, Dict[str, Any]]]) -> None:
+        if not edits:
+            return
+        with self._lock:
+            self._generation += 1
+            previous = {book_id: self._reads.pop(book_id, None) for book_id, _ in edits}
+            filters_cached = any(key[0] != 'browse' for key in self._queries)
+        # An edited book may start matching cached searches and finds; work out its new version,
+        # asking the repository only when the old one was not cached
+        changed: List[Book] = []
+        if filters_cached:
+            for book_id, changes in edits:
+                if not any(field in changes for field in _FILTERED_FIELDS):
+                    continue
+                book = previous[book_id]
+                if book is not None:
+                    book = replace(book, **{field: changes[field] for field in _FILTERED_FIELDS if field in changes})
+                else:
+                    book = self.repository.read(book_id)
+                if book is not None:
+                    changed.append(book)
+        edited_ids = set(previous)
+        with self._lock:
+            self._generation += 1
+            self._drop_queries(lambda key, cached: (
+                any(book.id in edited_ids for book in cached)
+                or (key[0] != 'browse' and any(self._query_matches(key, book) for book in changed))
+            ))
+
+    def _invalidate_deleted(self, book_ids: List[int]) -> None:
+        if not book_ids:
+            return
+        deleted_ids = set(book_ids)
+        with self._lock:
+            self._generation += 1
+            for book_id in book_ids:
+                self._reads.pop(book_id, None)
+            self._drop_queries(lambda key, cached: (
+                any(self._page_shifted(key, cached, book_id) for book_id in book_ids) if key[0] == 'browse'
+                else any(book.id in deleted_ids for book in cached)
+            ))
+
+    def _drop_queries(self, affected: Callable[[Tuple[Hashable, ...], List[Book]], bool]) -> None:
+        for key in [key for key, (_, cached) in self._queries.items() if affected(key, cached)]:
+            del self._queries[key]
+
+    @staticmethod
+    def _query_matches(key: Tuple[Hashable, ...], book: Book) -> bool:
+        if key[0] == 'search':
+            return matches(key[1], book)
+        if key[0] == 'author':
+            return normalize_author(book.author) == key[1]
+        return key[1] <= book.published_year <= key[2]
+
+    @staticmethod
+    def _page_shifted(key: Tuple[Hashable, ...], cached: List[Book], book_id: int) -> bool:
+        # Adding or removing book_id changes a page unless the id sits before its after_id
+        # or past the last book of a full page
+        _, _, limit, after_id = key
+        if after_id is not None and book_id <= after_id:
+            return False
+        if cached and limit is not None and len(cached) >= limit and book_id > cached[-1].id:
+            return False
+        return True
+
+    @staticmethod
+    def _new_book(book_data: Dict[str, Any], book_id: int) -> Book:
+        return Book(
+            title=book_data['title'],
+            author=book_data['author'],
+            published_year=book_data['published_year'],
+            quantity=book_data['quantity'],
+            id=book_id
+        )
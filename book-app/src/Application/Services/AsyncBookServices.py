@@ -0,0 +1,82 @@
+from typing import List, Optional, Dict, Any, AsyncIterator
+from src.Application.Services.BookServices import BookServiceBase
+from src.Domain.Interfaces.AsyncBookInterface import AsyncBookRepositoryInterface
+from src.Domain.Entities.Book import Book
+from src.Domain.Entities.BulkResult import BulkResult
+from src.Domain.Entities.BookNotFoundError import BookNotFoundError
+from src.Domain.Entities.InsufficientStockError import InsufficientStockError
+
+class AsyncBookServices(BookServiceBase):
+
+    def __init__(self, book_repository: AsyncBookRepositoryInterface):
+        self._repository = book_repository
+
+    async def browse(self, offset: int = 0, limit: Optional[int] = None, after_id: Optional[int] = None) -> List[Book]:
+        return await self._repository.browse(offset, limit, after_id)
+
+    def iter_books(self, offset: int = 0, limit: Optional[int] = None, after_id: Optional[int] = None) -> AsyncIterator[Book]:
+        return self._repository.iter_books(offset, limit, after_id)
+
+    async def read(self, book_id: int) -> Book:
+        book = await self._repository.read(book_id)
+        if not book:
+            raise BookNotFoundError(book_id)
+        return book
+
+    async def search(self, query: str) -> List[Book]:
+        return await self._repository.search(query)
+
+    async def find_by_author(self, author: str) -> List[Book]:
+        self._validate_non_empty_string('author', author)
+        return await self._repository.find_by_author(author)
+
+    async def find_by_year_range(self, start_year: int, end_year: int) -> List[Book]:
+        self._validate_year_range(start_year, end_year)
+        return await self._repository.find_by_year_range(start_year, end_year)
+
+    async def add(self, book_data: Dict[str, Any]) -> int:
+        self._validate_book_data(book_data)
+        return await self._repository.add(book_data)
+
+    async def edit(self, book_id: int, book_data: Dict[str, Any]) -> bool:
+        if book_data:
+            self._validate_book_data(book_data, is_update=True)
+
+        success = await self._repository.edit(book_id, book_data)
+        if not success:
+            raise BookNotFoundError(book_id)
+        return True
+
+    async def delete(self, book_id: int) -> bool:
+        success = await self._repository.delete(book_id)
+        if not success:
+            raise BookNotFoundError(book_id)
+        return True
+
+    async def increment_quantity(self, book_id: int, amount: int = 1) -> int:
+        self._validate_positive_integer('amount', amount)
+        return self._adjusted_quantity(book_id, await self._repository.adjust_quantity(book_id, amount))
+
+    async def decrement_quantity(self, book_id: int, amount: int = 1) -> int:
+        self._validate_positive_integer('amount', amount)
+        return self._adjusted_quantity(book_id, await self._repository.adjust_quantity(book_id, -amount))
+
+    async def reserve(self, book_id: int, amount: int = 1) -> bool:
+        try:
+            await self.decrement_quantity(book_id, amount)
+        except InsufficientStockError:
+            return False
+        return True
+
+    async def add_many(self, books_data: List[Dict[str, Any]]) -> List[BulkResult]:
+        results, valid_indexes = self._validate_rows(books_data)
+        repository_results = await self._repository.add_many([books_data[index] for index in valid_indexes])
+        return self._merge_results(results, valid_indexes, repository_results)
+
+    async def edit_many(self, books_data: List[Dict[str, Any]]) -> List[BulkResult]:
+        results, valid_indexes = self._validate_rows(books_data, is_update=True)
+        repository_results = await self._repository.edit_many([books_data[index] for index in valid_indexes])
+        return self._merge_results(results, valid_indexes, repository_results)
+
+    async def delete_many(self, book_ids: List[int]) -> List[BulkResult]:
+        return await self._repository.delete_many(book_ids)
@@ -1,21 +1,120 @@
-from typing import List, Optional, Dict, Any
+from typing import IO, List, Optional, Dict, Any, Callable, Iterator, Tuple, Union
 from src.Domain.Interfaces.BookInterface import BookRepositoryInterface
+from src.Application.Events.BookChangeFeed import BookChangeFeed, BookChangeStream, BookSubscription
 from src.Domain.Entities.Book import Book
+from src.Domain.Entities.BookChange import BookChange
+from src.Domain.Entities.BookSnapshot import BookSnapshot
+from src.Domain.Entities.BulkResult import BulkResult
+from src.Domain.Entities.ImportSummary import ImportSummary
+from src.Domain.Entities.BookNotFoundError import BookNotFoundError
+from src.Domain.Entities.InsufficientStockError import InsufficientStockError
+from src.Domain.Validation.BookSchema import (
+    BOOK_SCHEMA, is_non_empty_string, is_positive_integer
+)
+from src.Infrastructure.Persistence.BookTransferFormats import (
+    TRANSFER_CHUNK_SIZE, chunked, get_transfer_format, infer_transfer_format, open_export, open_import, write_books
+)
 
-class BookServices:
+# Validation rules and change feed access shared by BookServices and AsyncBookServices
+class BookServiceBase:
+
+    def subscribe(self, callback: Callable[[BookChange], None], since: Optional[int] = None) -> BookSubscription:
+        return self._change_feed().subscribe(callback, since)
+
+    def changes_since(self, sequence: int) -> List[BookChange]:
+        return self._change_feed().changes_since(sequence)
+
+    def stream_changes(self, since: Optional[int] = None, max_pending: int = 1000) -> BookChangeStream:
+        return self._change_feed().stream(since, max_pending)
+
+    def _change_feed(self) -> BookChangeFeed:
+        feed = getattr(self._repository, 'changes', None)
+        if feed is None:
+            raise ValueError("Repository does not publish changes")
+        return feed
+
+    def _validate_rows(self, books_data: List[Dict[str, Any]], is_update: bool = False) -> Tuple[List[Optional[BulkResult]], List[int]]:
+        # Rejected rows get their result here, listing every error; the indexes of the rest go to the repository
+        invalid = BOOK_SCHEMA.validate_batch(books_data, is_update)
+        results: List[Optional[BulkResult]] = [None] * len(books_data)
+        valid_indexes = []
+        for index, book_data in enumerate(books_data):
+            errors = invalid.get(index, [])
+            book_id = book_data.get('id') if is_update else None
+            if is_update and not isinstance(book_id, int):
+                errors = ["Id must be an integer"] + errors
+            if errors:
+                results[index] = BulkResult(index=index, success=False, book_id=book_id, error='; '.join(errors))
+                continue
+            valid_indexes.append(index)
+        return results, valid_indexes
+
+    @staticmethod
+    def _merge_results(
+        results: List[Optional[BulkResult]],
+        valid_indexes: List[int],
+        repository_results: List[BulkResult]
+    ) -> List[BulkResult]:
+        # The repository numbers rows within the valid subset; map them back to the caller's rows
+        for result in repository_results:
+            result.index = valid_indexes[result.index]
+            results[result.index] = result
+        return results
+
+    @staticmethod
+    def _adjusted_quantity(book_id: int, quantity: Optional[int]) -> int:
+        if quantity is None:
+            raise BookNotFoundError(book_id)
+        return quantity
+
+    def _validate_year_range(self, start_year: int, end_year: int) -> None:
+        self._validate_positive_integer('start year', start_year)
+        self._validate_positive_integer('end year', end_year)
+        if start_year > end_year:
+            raise ValueError("Start year must not be after end year")
+
+    def _validate_book_data(self, book_data: Dict[str, Any], is_update: bool = False) -> None:
+        BOOK_SCHEMA.validate(book_data, is_update)
+
+    def _validate_non_empty_string(self, field: str, value: Any) -> None:
+        if not is_non_empty_string(value):
+            raise ValueError(f"{field.capitalize()} must be a non-empty string")
+
+    def _validate_positive_integer(self, field: str, value: Any) -> None:
+        if not is_positive_integer(value):
+            raise ValueError(f"{field.capitalize()} must be a positive integer")
+
+class BookServices(BookServiceBase):
 
     def __init__(self, book_repository: BookRepositoryInterface):
         self._repository = book_repository
 
-    def browse(self) -> List[Book]:
-        return self._repository.browse()
+    def browse(self, offset: int = 0, limit: Optional[int] = None, after_id: Optional[int] = None) -> List[Book]:
+        return self._repository.browse(offset, limit, after_id)
+
+    def iter_books(self, offset: int = 0, limit: Optional[int] = None, after_id: Optional[int] = None) -> Iterator[Book]:
+        return self._repository.iter_books(offset, limit, after_id)
+
+    def snapshot(self) -> BookSnapshot:
+        return self._repository.snapshot()
 
     def read(self, book_id: int) -> Book:
         book = self._repository.read(book_id)
         if not book:
-            raise ValueError(f"Book with ID {book_id} not found")
+            raise BookNotFoundError(book_id)
         return book
 
+    def search(self, query: str) -> List[Book]:
+        return self._repository.search(query)
+
+    def find_by_author(self, author: str) -> List[Book]:
+        self._validate_non_empty_string('author', author)
+        return self._repository.find_by_author(author)
+
+    def find_by_year_range(self, start_year: int, end_year: int) -> List[Book]:
+        self._validate_year_range(start_year, end_year)
+        return self._repository.find_by_year_range(start_year, end_year)
+
     def add(self, book_data: Dict[str, Any]) -> int:
         self._validate_book_data(book_data)
         return self._repository.add(book_data)
@@ -23,44 +122,83 @@ class BookServices:
     def edit(self, book_id: int, book_data: Dict[str, Any]) -> bool:
         if book_data:
             self._validate_book_data(book_data, is_update=True)
-        
+
         success = self._repository.edit(book_id, book_data)
         if not success:
-            raise ValueError(f"Book with ID {book_id} not found")
+            raise BookNotFoundError(book_id)
         return True
 
     def delete(self, book_id: int) -> bool:
         success = self._repository.delete(book_id)
         if not success:
-            raise ValueError(f"Book with ID {book_id} not found")
+            raise BookNotFoundError(book_id)
         return True
-    def _validate_book_data(self, book_data: Dict[str, Any], is_update: bool = False) -> None:
-        required_fields = {'title', 'author', 'published_year', 'quantity'}
 
-        if not is_update:
-            missing_fields = required_fields - book_data.keys()
-            if missing_fields:
-                raise ValueError(f"Missing required fields: {', '.join(missing_fields)}")
+    def increment_quantity(self, book_id: int, amount: int = 1) -> int:
+        self._validate_positive_integer('amount', amount)
+        return self._adjusted_quantity(book_id, self._repository.adjust_quantity(book_id, amount))
 
-        validators = {
-            'title': self._validate_non_empty_string,
-            'author': self._validate_non_empty_string,
-            'published_year': self._validate_positive_integer,
-            'quantity': self._validate_non_negative_integer
-        }
+    def decrement_quantity(self, book_id: int, amount: int = 1) -> int:
+        self._validate_positive_integer('amount', amount)
+        return self._adjusted_quantity(book_id, self._repository.adjust_quantity(book_id, -amount))
 
-        for field, validator in validators.items():
-            if field in book_data:
-                validator(field, book_data[field])
+    def reserve(self, book_id: int, amount: int = 1) -> bool:
+        # Checkout path: running out of stock is an expected outcome rather than an error
+        try:
+            self.decrement_quantity(book_id, amount)
+        except InsufficientStockError:
+            return False
+        return True
 
-    def _validate_non_empty_string(self, field: str, value: Any) -> None:
-        if not isinstance(value, str) or not value.strip():
-            raise ValueError(f"{field.capitalize()} must be a non-empty string")
+    def add_many(self, books_data: List[Dict[str, Any]]) -> List[BulkResult]:
+        results, valid_indexes = self._validate_rows(books_data)
+        repository_results = self._repository.add_many([books_data[index] for index in valid_indexes])
+        return self._merge_results(results, valid_indexes, repository_results)
 
-    def _validate_positive_integer(self, field: str, value: Any) -> None:
-        if not isinstance(value, int) or value <= 0:
-            raise ValueError(f"{field.capitalize()} must be a positive integer")
+    def edit_many(self, books_data: List[Dict[str, Any]]) -> List[BulkResult]:
+        results, valid_indexes = self._validate_rows(books_data, is_update=True)
+        repository_results = self._repository.edit_many([books_data[index] for index in valid_indexes])
+        return self._merge_results(results, valid_indexes, repository_results)
+
+    def delete_many(self, book_ids: List[int]) -> List[BulkResult]:
+        return self._repository.delete_many(book_ids)
+
+    def export_books(
+        self,
+        target: Union[str, IO],
+        format_name: Optional[str] = None,
+        compress: Optional[bool] = None,
+        chunk_size: int = TRANSFER_CHUNK_SIZE
+    ) -> int:
+        # Streams one snapshot of the catalogue a chunk at a time, so the file is consistent while
+        # writes go on; format and compression default from a path's suffix ("books.csv.gz"),
+        # else JSON lines, uncompressed
+        if isinstance(target, str):
+            inferred_format, inferred_compress = infer_transfer_format(target)
+            format_name = format_name or inferred_format
+            compress = inferred_compress if compress is None else compress
+        transfer_format = get_transfer_format(format_name or 'jsonl')
+        self._validate_positive_integer('chunk size', chunk_size)
+        with self._repository.snapshot() as snapshot, open_export(target, bool(compress)) as file:
+            return write_books(snapshot, file, transfer_format, chunk_size)
 
-    def _validate_non_negative_integer(self, field: str, value: Any) -> None:
-        if not isinstance(value, int) or value < 0:
-            raise ValueError(f"{field.capitalize()} must be a non-negative integer")
+    def import_books(
+        self,
+        source: Union[str, IO],
+        format_name: Optional[str] = None,
+        chunk_size: int = TRANSFER_CHUNK_SIZE
+    ) -> ImportSummary:
+        # Reads and adds chunk_size rows at a time through add_many; the repository batch makes
+        # the chunks share one snapshot write. Rows added before a malformed line stay added.
+        self._validate_positive_integer('chunk size', chunk_size)
+        summary = ImportSummary()
+        with self._repository.batch(), open_import(source, format_name) as rows:
+            for chunk in chunked(rows, chunk_size):
+                for result in self.add_many(chunk):
+                    if result.success:
+                        summary.imported += 1
+                    else:
+                        result.index += summary.rows
+                        summary.failures.append(result)
+                summary.rows += len(chunk)
+        return summary
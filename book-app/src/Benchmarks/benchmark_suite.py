@@ -0,0 +1,206 @@
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.Application.Interfaces.BookInterfaceImplementation import BookInterfaceImplementation
+from src.Application.Services.BookServices import BookServices
+from src.Domain.Entities.Book import Book
+from src.Presentation.Controllers.BookController import BookController
+
+# Usage, from book-app:
+#   python -m src.Benchmarks.benchmark_suite --sizes 1000,100000 --output after.json
+#   python -m src.Benchmarks.benchmark_suite --sizes 1000,100000 --compare before.json
+# Each operation runs through the repository, the service and the controller. Timings are the
+# best of --repeat runs, and fast read paths loop within a run so timer noise stays small; memory
+# peaks come from a separate tracemalloc run, which would otherwise distort the timings. Every
+# mutation rewrites the snapshot, so lower --mutations for catalogues near a million books.
+
+LAYERS = ("repository", "service", "controller")
+# Method names per layer, in LAYERS order
+METHODS = {
+    "browse": ("browse", "browse", "get_all_books"),
+    "browse_page": ("browse", "browse", "get_books_page"),
+    "read": ("read", "read", "get_book_by_id"),
+    "search": ("search", "search", "search_books"),
+    "add": ("add", "add", "create_book"),
+    "edit": ("edit", "edit", "update_book"),
+    "delete": ("delete", "delete", "delete_book"),
+}
+TRACED_OPERATIONS = {"load", "save", "browse"}
+SEARCH_QUERIES = ("title 1", "author 42", "itle 99", "author", "nothing matches")
+PAGE_SIZE = 20
+MIN_RUN_SECONDS = 0.1
+
+def make_books(count: int) -> List[Book]:
+    return [
+        Book(title=f"Title {i}", author=f"Author {i % 1000}", published_year=1900 + i % 120, quantity=i % 50, id=i)
+        for i in range(count)
+    ]
+
+def new_book_data(n: int) -> Dict[str, Any]:
+    return {"title": f"Benchmark {n}", "author": "Benchmark Author", "published_year": 2000, "quantity": 1}
+
+def best_time(action: Callable[[], Any], repeat: int, loop: bool = False) -> float:
+    # With loop, each run calls action until MIN_RUN_SECONDS have passed and reports the mean call
+    timings = []
+    for _ in range(repeat):
+        calls = 0
+        started = time.perf_counter()
+        while True:
+            action()
+            calls += 1
+            elapsed = time.perf_counter() - started
+            if not loop or elapsed >= MIN_RUN_SECONDS:
+                break
+        timings.append(elapsed / calls)
+    return min(timings)
+
+def peak_memory(action: Callable[[], Any]) -> int:
+    tracemalloc.start()
+    try:
+        action()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def layer_actions(target: Any, layer_index: int, size: int, rng: random.Random, mutations: int, reads: int) -> Dict[str, tuple]:
+    # operation -> (action, operations per run); mutations add, edit and then delete the same books
+    method = {name: getattr(target, names[layer_index]) for name, names in METHODS.items()}
+    read_ids = [rng.randrange(size) for _ in range(reads)]
+    added_ids: List[int] = []
+
+    def add():
+        added_ids.clear()
+        added_ids.extend(method["add"](new_book_data(n)) for n in range(mutations))
+
+    return {
+        "browse": (lambda: method["browse"](), 1),
+        "browse_page": (lambda: method["browse_page"](offset=size // 2, limit=PAGE_SIZE), 1),
+        "read": (lambda: [method["read"](book_id) for book_id in read_ids], reads),
+        "search": (lambda: [method["search"](query) for query in SEARCH_QUERIES], len(SEARCH_QUERIES)),
+        "add": (add, mutations),
+        "edit": (lambda: [method["edit"](book_id, {"quantity": 2}) for book_id in added_ids], mutations),
+        "delete": (lambda: [method["delete"](book_id) for book_id in added_ids], mutations),
+    }
+
+def result(size: int, layer: str, operation: str, seconds: float, ops: int, peak: Optional[int] = None) -> Dict[str, Any]:
+    return {
+        "size": size,
+        "layer": layer,
+        "operation": operation,
+        "ops": ops,
+        "seconds": round(seconds, 6),
+        "per_op_us": round(seconds / ops * 1e6, 3),
+        "peak_bytes": peak,
+    }
+
+def bench_size(directory: str, size: int, repeat: int, mutations: int, reads: int) -> List[Dict[str, Any]]:
+    file_path = os.path.join(directory, f"Books-{size}.json")
+    repository = BookInterfaceImplementation(file_path)
+    repository.books = make_books(size)
+    results = []
+
+    save = repository._save_to_json
+    results.append(result(size, "repository", "save", best_time(save, repeat, loop=True), 1, peak_memory(save)))
+    load = lambda: BookInterfaceImplementation(file_path)
+    results.append(result(size, "repository", "load", best_time(load, repeat, loop=True), 1, peak_memory(load)))
+
+    repository = BookInterfaceImplementation(file_path)
+    # The first search builds the index; measure it once, apart from warm searches
+    results.append(result(size, "repository", "search_index_build", best_time(lambda: repository.search("x"), 1), 1))
+    service = BookServices(repository)
+    targets = (repository, service, BookController(service))
+    for layer_index, layer in enumerate(LAYERS):
+        rng = random.Random(size)
+        actions = layer_actions(targets[layer_index], layer_index, size, rng, mutations, reads)
+        for operation, (action, ops) in actions.items():
+            # Mutations change state, so each of add/edit/delete runs once per layer
+            mutating = operation in ("add", "edit", "delete")
+            seconds = best_time(action, 1 if mutating else repeat, loop=not mutating)
+            peak = peak_memory(action) if operation in TRACED_OPERATIONS else None
+            results.append(result(size, layer, operation, seconds, ops, peak))
+    return results
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float) -> List[str]:
+    # Returns the regressions: operations whose per-op time grew by more than threshold
+    previous = {(r["size"], r["layer"], r["operation"]): r for r in baseline["results"]}
+    regressions = []
+    print(f"{'size':>9} {'layer':<11}{'operation':<20}{'before us':>12}{'after us':>12}{'ratio':>8}")
+    for record in current["results"]:
+        before = previous.get((record["size"], record["layer"], record["operation"]))
+        if before is None or not before["per_op_us"]:
+            continue
+        ratio = record["per_op_us"] / before["per_op_us"]
+        marker = " !" if ratio > 1 + threshold else ""
+        print(
+            f"{record['size']:>9} {record['layer']:<11}{record['operation']:<20}"
+            f"{before['per_op_us']:>12.1f}{record['per_op_us']:>12.1f}{ratio:>8.2f}{marker}"
+        )
+        if marker:
+            regressions.append(f"{record['size']}/{record['layer']}/{record['operation']}: {ratio:.2f}x")
+    return regressions
+
+def print_results(results: List[Dict[str, Any]]) -> None:
+    print(f"{'size':>9} {'layer':<11}{'operation':<20}{'per op us':>14}{'peak MiB':>10}")
+    for r in results:
+        peak = "" if r["peak_bytes"] is None else f"{r['peak_bytes'] / 2 ** 20:.1f}"
+        print(f"{r['size']:>9} {r['layer']:<11}{r['operation']:<20}{r['per_op_us']:>14.1f}{peak:>10}")
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Time repository, service and controller hot paths")
+    parser.add_argument("--sizes", default="1000,10000,100000", help="comma-separated catalogue sizes, e.g. 1000,1000000")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--mutations", type=int, default=20, help="adds, edits and deletes per layer")
+    parser.add_argument("--reads", type=int, default=1000)
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--compare", help="baseline JSON from an earlier run")
+    parser.add_argument("--threshold", type=float, default=0.5, help="allowed slowdown before --compare fails")
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for size in (int(size) for size in args.sizes.split(",")):
+            results.extend(bench_size(directory, size, args.repeat, args.mutations, args.reads))
+
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        },
+        "results": results,
+    }
+    print_results(results)
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    if args.compare:
+        with open(args.compare) as file:
+            regressions = compare(json.load(file), report, args.threshold)
+        if regressions:
+            print("Regressions: " + ", ".join(regressions))
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
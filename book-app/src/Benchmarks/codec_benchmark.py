@@ -0,0 +1,64 @@
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.Application.Interfaces.BookInterfaceImplementation import BookInterfaceImplementation
+from src.Domain.Entities.Book import Book
+
+CODECS = ("json", "jsonl", "binary")
+RANDOM_READS = 1000
+
+def make_books(count: int):
+    return [
+        Book(title=f"Title {i}", author=f"Author {i % 1000}", published_year=1900 + i % 120, quantity=i % 50, id=i)
+        for i in range(count)
+    ]
+
+def timed(action) -> float:
+    started = time.perf_counter()
+    action()
+    return time.perf_counter() - started
+
+def bench_codec(directory: str, codec: str, books) -> dict:
+    file_path = os.path.join(directory, f"Books.{codec}")
+    repository = BookInterfaceImplementation(file_path, codec=codec)
+    repository.books = books
+    save = timed(repository._save_to_json)
+    load = timed(lambda: BookInterfaceImplementation(file_path, codec=codec))
+
+    ids = random.Random(0).sample(range(len(books)), min(RANDOM_READS, len(books)))
+    def cold_reads():
+        lazy_repository = BookInterfaceImplementation(file_path, codec=codec, lazy=True)
+        for book_id in ids:
+            lazy_repository.read(book_id)
+        lazy_repository.close()
+    return {
+        "save": save,
+        "load": load,
+        "lazy_reads": timed(cold_reads),
+        "size": os.path.getsize(file_path),
+    }
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Snapshot save/load cost per codec")
+    parser.add_argument("--sizes", default="10000,100000,1000000", help="comma-separated catalogue sizes")
+    args = parser.parse_args()
+
+    print(f"{'books':>9} {'codec':<7}{'save s':>9}{'load s':>9}{'open+' + str(RANDOM_READS) + ' reads s':>20}{'MiB':>9}")
+    for count in (int(size) for size in args.sizes.split(',')):
+        books = make_books(count)
+        with tempfile.TemporaryDirectory() as directory:
+            for codec in CODECS:
+                result = bench_codec(directory, codec, books)
+                print(
+                    f"{count:>9} {codec:<7}{result['save']:>9.3f}{result['load']:>9.3f}"
+                    f"{result['lazy_reads']:>20.3f}{result['size'] / 2 ** 20:>9.1f}"
+                )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+import argparse
+import http.client
+import json
+import multiprocessing
+from multiprocessing.pool import Pool
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.Application.Interfaces.BookInterfaceImplementation import BookInterfaceImplementation
+from src.Benchmarks.benchmark_suite import make_books
+
+# Usage, from book-app:
+#   python -m src.Benchmarks.http_load_generator --size 10000 --connections 1,8,32 --workers 8
+#   python -m src.Benchmarks.http_load_generator --processes 4 --write-ratio 0.1
+#   python -m src.Benchmarks.http_load_generator --url http://127.0.0.1:8000 --connections 16
+# Without --url it starts "main.py serve" in its own process against a generated catalogue.
+# Load comes from several client processes so the generator itself is not held back by one GIL.
+# Each connection sends requests back to back for --duration seconds, over keep-alive unless
+# --no-keep-alive is given; a level whose throughput stops rising has reached the ceiling.
+
+MAIN_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'main.py'))
+NEW_BOOK = {"title": "Load Test", "author": "Load Author", "published_year": 2000, "quantity": 1}
+
+def free_port() -> int:
+    with socket.socket() as probe:
+        probe.bind(('127.0.0.1', 0))
+        return probe.getsockname()[1]
+
+def wait_until_healthy(host: str, port: int, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            connection = http.client.HTTPConnection(host, port, timeout=1)
+            connection.request('GET', '/health')
+            if connection.getresponse().status == 200:
+                return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.1)
+
+def next_request(rng: random.Random, size: int, write_ratio: float, search_ratio: float) -> Tuple[str, str, Optional[bytes]]:
+    roll = rng.random()
+    if roll < write_ratio:
+        if rng.random() < 0.5:
+            return 'POST', '/books', json.dumps(NEW_BOOK).encode()
+        return 'PATCH', f'/books/{rng.randrange(size)}', json.dumps({"quantity": rng.randrange(100)}).encode()
+    if roll < write_ratio + search_ratio:
+        return 'GET', f'/books/search?q=title+{rng.randrange(100)}', None
+    return 'GET', f'/books/{rng.randrange(size)}', None
+
+def run_connection(
+    host: str, port: int, duration: float, size: int, write_ratio: float, search_ratio: float,
+    keep_alive: bool, seed: int, latencies: List[float], statuses: Counter
+) -> None:
+    rng = random.Random(seed)
+    connection = http.client.HTTPConnection(host, port, timeout=30)
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        method, path, body = next_request(rng, size, write_ratio, search_ratio)
+        headers = {'Content-Type': 'application/json'} if body else {}
+        if not keep_alive:
+            headers['Connection'] = 'close'
+        started = time.perf_counter()
+        try:
+            connection.request(method, path, body=body, headers=headers)
+            response = connection.getresponse()
+            response.read()
+            statuses[response.status] += 1
+        except (OSError, http.client.HTTPException):
+            statuses['error'] += 1
+            connection.close()
+            connection = http.client.HTTPConnection(host, port, timeout=30)
+            continue
+        latencies.append(time.perf_counter() - started)
+        if not keep_alive:
+            connection.close()
+    connection.close()
+
+def client_process(arguments: Tuple) -> Tuple[List[float], Dict]:
+    # One client process runs several connections on threads and reports back raw results
+    host, port, connections, duration, size, write_ratio, search_ratio, keep_alive, seed = arguments
+    latencies: List[float] = []
+    statuses: Counter = Counter()
+    threads = [
+        threading.Thread(
+            target=run_connection,
+            args=(host, port, duration, size, write_ratio, search_ratio, keep_alive, seed + n, latencies, statuses)
+        )
+        for n in range(connections)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies, dict(statuses)
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+def run_level(host: str, port: int, connections: int, args: argparse.Namespace, pool: Pool) -> Dict:
+    processes = min(connections, args.client_processes)
+    shares = [connections // processes + (n < connections % processes) for n in range(processes)]
+    jobs = [
+        (host, port, share, args.duration, args.size, args.write_ratio, args.search_ratio, not args.no_keep_alive, n * 1000)
+        for n, share in enumerate(shares)
+    ]
+    latencies: List[float] = []
+    statuses: Counter = Counter()
+    for process_latencies, process_statuses in pool.map(client_process, jobs):
+        latencies.extend(process_latencies)
+        statuses.update(process_statuses)
+    latencies.sort()
+    return {
+        "connections": connections,
+        "requests": len(latencies),
+        "rps": len(latencies) / args.duration,
+        "p50_ms": percentile(latencies, 0.5) * 1e3,
+        "p95_ms": percentile(latencies, 0.95) * 1e3,
+        "p99_ms": percentile(latencies, 0.99) * 1e3,
+        "statuses": {str(status): count for status, count in sorted(statuses.items(), key=str)},
+    }
+
+def start_server(args: argparse.Namespace, directory: str) -> Tuple[subprocess.Popen, str, int]:
+    data_path = os.path.join(directory, "Books.json")
+    repository = BookInterfaceImplementation(data_path)
+    repository.books = make_books(args.size)
+    repository._save_to_json()
+    port = free_port()
+    command = [
+        sys.executable, MAIN_PATH, 'serve', '--port', str(port), '--workers', str(args.workers),
+        '--processes', str(args.processes), '--max-in-flight', str(args.max_in_flight)
+    ]
+    server = subprocess.Popen(command, cwd=directory, env={**os.environ, "BOOK_APP_DATA": data_path})
+    wait_until_healthy('127.0.0.1', port)
+    return server, '127.0.0.1', port
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Drive the HTTP API with concurrent keep-alive connections")
+    parser.add_argument("--url", help="existing server to load; by default one is started")
+    parser.add_argument("--size", type=int, default=10000, help="books in the generated catalogue (and the ID range)")
+    parser.add_argument("--connections", default="1,4,16,64", help="comma-separated concurrency levels")
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds per level")
+    parser.add_argument("--write-ratio", type=float, default=0.0, help="share of POST/PATCH requests")
+    parser.add_argument("--search-ratio", type=float, default=0.0, help="share of search requests")
+    parser.add_argument("--no-keep-alive", action="store_true", help="open a new connection per request")
+    parser.add_argument("--client-processes", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--workers", type=int, default=8, help="server threads per process")
+    parser.add_argument("--processes", type=int, default=1, help="server processes")
+    parser.add_argument("--max-in-flight", type=int, default=64)
+    parser.add_argument("--output", help="write results as JSON to this file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        server = None
+        if args.url:
+            url = urlsplit(args.url)
+            host, port = url.hostname, url.port or 80
+        else:
+            server, host, port = start_server(args, directory)
+        try:
+            results = []
+            print(f"{'connections':>11}{'requests':>10}{'req/s':>10}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}  statuses")
+            with multiprocessing.Pool(args.client_processes) as pool:
+                for connections in (int(level) for level in args.connections.split(",")):
+                    level = run_level(host, port, connections, args, pool)
+                    results.append(level)
+                    print(
+                        f"{level['connections']:>11}{level['requests']:>10}{level['rps']:>10.0f}"
+                        f"{level['p50_ms']:>9.2f}{level['p95_ms']:>9.2f}{level['p99_ms']:>9.2f}  {level['statuses']}"
+                    )
+        finally:
+            if server is not None:
+                server.terminate()
+                server.wait()
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump({"settings": vars(args), "results": results}, file, indent=2)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
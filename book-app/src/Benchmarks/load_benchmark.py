@@ -0,0 +1,62 @@
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.Application.Interfaces.BookInterfaceImplementation import BookInterfaceImplementation
+from src.Domain.Entities.Book import Book
+
+def write_catalogue(file_path: str, count: int) -> None:
+    books = [
+        {"id": i, "title": f"Title {i}", "author": f"Author {i % 1000}", "published_year": 1900 + i % 120, "quantity": i % 50}
+        for i in range(count)
+    ]
+    with open(file_path, 'w') as file:
+        json.dump(books, file, indent=4)
+
+def load_eager_json(file_path: str) -> None:
+    # The previous loader: json.load the whole document, then build every Book
+    with open(file_path, 'r') as file:
+        books = [Book(**book_data) for book_data in json.load(file)]
+    return books
+
+def cold_lookup(file_path: str, **options) -> None:
+    repository = BookInterfaceImplementation(file_path, **options)
+    repository.read(repository.next_id // 2)
+
+def measure(action) -> tuple:
+    # Timed and traced separately: tracemalloc slows allocation-heavy code disproportionately
+    started = time.perf_counter()
+    action()
+    elapsed = time.perf_counter() - started
+    tracemalloc.start()
+    action()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Cold start: load the catalogue and serve one lookup")
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        file_path = os.path.join(directory, "Books.json")
+        write_catalogue(file_path, args.count)
+        cases = [
+            ("json.load + eager Books", lambda: load_eager_json(file_path)),
+            ("streaming loader", lambda: cold_lookup(file_path)),
+            ("lazy offset index", lambda: cold_lookup(file_path, lazy=True)),
+        ]
+        print(f"{'loader':<26}{'seconds':>10}{'peak MiB':>12}")
+        for name, action in cases:
+            elapsed, peak = measure(action)
+            print(f"{name:<26}{elapsed:>10.3f}{peak / 2 ** 20:>12.1f}")
+
+if __name__ == "__main__":
+    main()
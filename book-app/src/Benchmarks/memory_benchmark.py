@@ -0,0 +1,64 @@
+import argparse
+import gc
+import sys
+import os
+import tracemalloc
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.Domain.Entities.Book import Book
+from src.Infrastructure.Storage.BookColumnStore import BookColumnStore
+
+AUTHOR_COUNT = 1000
+
+# The pre-slots entity, kept here only as the baseline for comparison
+@dataclass
+class _DictBook:
+    title: str
+    author: str
+    published_year: int
+    quantity: int
+    id: Optional[int] = None
+
+def _rows(count: int):
+    for i in range(count):
+        # Authors are rebuilt per row, as they would be when parsed from a file
+        yield i, f"Title {i}", "".join(["Author ", str(i % AUTHOR_COUNT)]), 1900 + i % 120, i % 50
+
+def build_dict_books(count: int):
+    return {i: _DictBook(title, author, year, quantity, i) for i, title, author, year, quantity in _rows(count)}
+
+def build_slotted_books(count: int):
+    return {i: Book(title, author, year, quantity, i) for i, title, author, year, quantity in _rows(count)}
+
+def build_column_store(count: int):
+    return BookColumnStore(Book(title, author, year, quantity, i) for i, title, author, year, quantity in _rows(count))
+
+def measure(build: Callable[[int], object], count: int) -> int:
+    gc.collect()
+    tracemalloc.start()
+    store = build(count)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del store
+    return current
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Resident memory of the in-memory book stores")
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+
+    results = [
+        ("dataclass with __dict__", measure(build_dict_books, args.count)),
+        ("slotted frozen Book", measure(build_slotted_books, args.count)),
+        ("BookColumnStore", measure(build_column_store, args.count)),
+    ]
+    baseline = results[0][1]
+    print(f"{'store':<26}{'bytes':>14}{'bytes/book':>12}{'vs baseline':>13}")
+    for name, size in results:
+        print(f"{name:<26}{size:>14,}{size / args.count:>12.1f}{size / baseline:>12.0%}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional, Tuple
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.Application.Interfaces.BookInterfaceImplementation import BookInterfaceImplementation
+from src.Benchmarks.benchmark_suite import make_books
+
+# Usage, from book-app:
+#   python -m src.Benchmarks.startup_benchmark --size 100000
+# Times fresh interpreter runs of main.py against a generated catalogue: the interactive menu
+# (exited straight away) next to batch commands. Each figure is wall time from process start
+# to exit, so it includes interpreter startup, imports and loading the data a command needs.
+
+MAIN_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'main.py'))
+# name -> (arguments, stdin)
+SCENARIOS: Dict[str, Tuple[List[str], Optional[str]]] = {
+    "menu": ([], "0\n"),
+    "help": (["--help"], None),
+    "get": (["get", "0"], None),
+    "list --limit 20": (["list", "--limit", "20"], None),
+    "search": (["search", "title 1"], None),
+}
+
+def time_run(arguments: List[str], stdin: Optional[str], directory: str, env: Dict[str, str]) -> float:
+    started = time.perf_counter()
+    subprocess.run(
+        [sys.executable, MAIN_PATH, *arguments],
+        input=stdin, text=True, cwd=directory, env=env, stdout=subprocess.DEVNULL, check=True
+    )
+    return time.perf_counter() - started
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare main.py cold-start time for the menu and batch commands")
+    parser.add_argument("--size", type=int, default=10000, help="books in the generated catalogue")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        data_path = os.path.join(directory, "Books.json")
+        repository = BookInterfaceImplementation(data_path)
+        repository.books = make_books(args.size)
+        repository._save_to_json()
+        # Run from the empty directory, so no appsettings.json points elsewhere
+        env = {**os.environ, "BOOK_APP_DATA": data_path}
+
+        print(f"{'command':<18}{'min ms':>10}{'median ms':>12}")
+        for name, (arguments, stdin) in SCENARIOS.items():
+            timings = [time_run(arguments, stdin, directory, env) for _ in range(args.repeat)]
+            print(f"{name:<18}{min(timings) * 1e3:>10.1f}{statistics.median(timings) * 1e3:>12.1f}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
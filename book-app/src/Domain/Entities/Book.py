@@ -1,11 +1,13 @@
 import sys
 import os
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Dict, Optional
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+from src.Domain.Validation.BookSchema import is_non_negative_integer, is_positive_integer
 
-@dataclass
+# Slotted and frozen: no per-instance __dict__, and repositories can share instances safely
+@dataclass(frozen=True, slots=True)
 class Book:
     title: str
     author: str
@@ -17,10 +19,21 @@ class Book:
         if not self.title or not self.author:
             raise ValueError("Title and author cannot be empty.")
         
-        if not isinstance(self.published_year, int) or self.published_year <= 0:
+        if not is_positive_integer(self.published_year):
             raise ValueError("Published year must be a positive integer.")
 
-        if not isinstance(self.quantity, int) or self.quantity < 0:
+        if not is_non_negative_integer(self.quantity):
             raise ValueError("Quantity must be a non-negative integer.")
 
+BOOK_FIELDS = ('title', 'author', 'published_year', 'quantity')
 
+def changed_fields(book: Book, book_data: Dict[str, Any]) -> Dict[str, Any]:
+    # The editable fields of book_data that differ from book; other keys are ignored, as edits always did.
+    # Comparing types too keeps True from passing for 1, so validation still sees it.
+    changes = {}
+    for field in BOOK_FIELDS:
+        if field in book_data:
+            value, current = book_data[field], getattr(book, field)
+            if value != current or type(value) is not type(current):
+                changes[field] = value
+    return changes
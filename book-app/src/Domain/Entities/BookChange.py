@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+from .Book import Book
+
+# One entry of a repository's change feed. Adds and edits carry the book as it is after the
+# change, deletes only the id, so applying an entry twice leaves a consumer in the same state.
+@dataclass(frozen=True)
+class BookChange:
+    sequence: int
+    op: str
+    book_id: int
+    book: Optional[Book] = None
+    changes: Optional[Dict[str, Any]] = None
@@ -0,0 +1,4 @@
+class BookNotFoundError(ValueError):
+    def __init__(self, book_id: int):
+        super().__init__(f"Book with ID {book_id} not found")
+        self.book_id = book_id
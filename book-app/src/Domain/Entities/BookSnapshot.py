@@ -0,0 +1,46 @@
+from itertools import dropwhile, islice
+from typing import Callable, Iterator, List, Mapping, Optional
+from .Book import Book
+
+# Read-only view of the catalogue as of one version. Repositories hand out a view of data that
+# writers no longer change in place (a copy-on-write store, a database read transaction), so a
+# long scan sees one consistent catalogue while writes carry on. Books are kept in ascending id
+# order, which keyset paging relies on. Close the view, or use it as a context manager, to let
+# the repository release what it pins.
+class BookSnapshot:
+    def __init__(self, books: Mapping[int, Book], version: int, on_close: Optional[Callable[[], None]] = None):
+        self._books = books
+        self.version = version
+        self._on_close = on_close
+
+    def __len__(self) -> int:
+        return len(self._books)
+
+    def __iter__(self) -> Iterator[Book]:
+        return iter(self._books.values())
+
+    def __contains__(self, book_id: object) -> bool:
+        return book_id in self._books
+
+    def __enter__(self) -> 'BookSnapshot':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def read(self, book_id: int) -> Optional[Book]:
+        return self._books.get(book_id)
+
+    def browse(self, offset: int = 0, limit: Optional[int] = None, after_id: Optional[int] = None) -> List[Book]:
+        return list(self.iter_books(offset, limit, after_id))
+
+    def iter_books(self, offset: int = 0, limit: Optional[int] = None, after_id: Optional[int] = None) -> Iterator[Book]:
+        book_ids = iter(self._books)
+        if after_id is not None:
+            book_ids = dropwhile(lambda book_id: book_id <= after_id, book_ids)
+        return map(self._books.__getitem__, islice(book_ids, offset, None if limit is None else offset + limit))
+
+    def close(self) -> None:
+        on_close, self._on_close = self._on_close, None
+        if on_close is not None:
+            on_close()
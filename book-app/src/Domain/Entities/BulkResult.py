@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+from typing import Optional
+
+@dataclass
+class BulkResult:
+    index: int
+    success: bool
+    book_id: Optional[int] = None
+    error: Optional[str] = None
+
+def describe_row_error(error: Exception) -> str:
+    if isinstance(error, KeyError):
+        return f"Missing required field: {error.args[0]}"
+    return str(error)
@@ -0,0 +1,7 @@
+# A consumer cannot continue gaplessly after sequence: the changes after it are no longer
+# retained, or it fell too far behind a stream. It can resume from sequence while those changes
+# are still retained, and otherwise has to rescan.
+class ChangeFeedGapError(ValueError):
+    def __init__(self, sequence: int, message: str):
+        super().__init__(message)
+        self.sequence = sequence
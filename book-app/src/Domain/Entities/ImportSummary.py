@@ -0,0 +1,11 @@
+from dataclasses import dataclass, field
+from typing import List
+from .BulkResult import BulkResult
+
+# Outcome of a streaming import: counts plus only the rejected rows, so memory stays flat however
+# many rows succeed. Failure indexes count rows from the start of the source.
+@dataclass
+class ImportSummary:
+    rows: int = 0
+    imported: int = 0
+    failures: List[BulkResult] = field(default_factory=list)
@@ -0,0 +1,6 @@
+class InsufficientStockError(ValueError):
+    def __init__(self, book_id: int, available: int, requested: int):
+        super().__init__(f"Book with ID {book_id} has {available} in stock, cannot remove {requested}")
+        self.book_id = book_id
+        self.available = available
+        self.requested = requested
@@ -0,0 +1,48 @@
+from typing import List, Dict, Any, AsyncIterator, Optional
+from abc import abstractmethod
+from ..Entities.Book import Book
+from ..Entities.BulkResult import BulkResult
+
+class AsyncBookRepositoryInterface:
+    @abstractmethod
+    async def browse(self, offset: int = 0, limit: Optional[int] = None, after_id: Optional[int] = None) -> List[Book]:
+        pass
+
+    def iter_books(self, offset: int = 0, limit: Optional[int] = None, after_id: Optional[int] = None) -> AsyncIterator[Book]:
+        pass
+
+    async def read(self, book_id: int) -> Optional[Book]:
+        pass
+
+    async def search(self, query: str) -> List[Book]:
+        pass
+
+    async def find_by_author(self, author: str) -> List[Book]:
+        pass
+
+    async def find_by_year_range(self, start_year: int, end_year: int) -> List[Book]:
+        pass
+
+    async def add(self, book_data: Dict[str, Any]) -> int:
+        pass
+
+    async def edit(self, book_id: int, book_data: Dict[str, Any]) -> bool:
+        pass
+
+    async def delete(self, book_id: int) -> bool:
+        pass
+
+    async def adjust_quantity(self, book_id: int, delta: int) -> Optional[int]:
+        pass
+
+    async def add_many(self, books_data: List[Dict[str, Any]]) -> List[BulkResult]:
+        pass
+
+    async def edit_many(self, books_data: List[Dict[str, Any]]) -> List[BulkResult]:
+        pass
+
+    async def delete_many(self, book_ids: List[int]) -> List[BulkResult]:
+        pass
+
+    async def close(self) -> None:
+        pass
@@ -1,15 +1,30 @@
-from typing import List, Dict, Any
+from contextlib import nullcontext
+from typing import List, Dict, Any, ContextManager, Iterator, Optional
 from abc import ABC, abstractmethod
 from ..Entities.Book import Book
+from ..Entities.BookSnapshot import BookSnapshot
+from ..Entities.BulkResult import BulkResult
 
 class BookRepositoryInterface:
     @abstractmethod
-    def browse(self) -> List[Book]:
+    def browse(self, offset: int = 0, limit: Optional[int] = None, after_id: Optional[int] = None) -> List[Book]:
+        pass
+
+    def iter_books(self, offset: int = 0, limit: Optional[int] = None, after_id: Optional[int] = None) -> Iterator[Book]:
         pass
 
     def read(self,book_id:int) -> Book:
         pass
 
+    def search(self, query: str) -> List[Book]:
+        pass
+
+    def find_by_author(self, author: str) -> List[Book]:
+        pass
+
+    def find_by_year_range(self, start_year: int, end_year: int) -> List[Book]:
+        pass
+
     def add(self, book_data: dict) -> int:
         pass
 
@@ -17,4 +32,24 @@ class BookRepositoryInterface:
         pass
 
     def delete(self, book_id) -> bool:
-        pass
\ No newline at end of file
+        pass
+
+    def adjust_quantity(self, book_id: int, delta: int) -> Optional[int]:
+        pass
+
+    def add_many(self, books_data: List[Dict[str, Any]]) -> List[BulkResult]:
+        pass
+
+    def edit_many(self, books_data: List[Dict[str, Any]]) -> List[BulkResult]:
+        pass
+
+    def delete_many(self, book_ids: List[int]) -> List[BulkResult]:
+        pass
+
+    def snapshot(self) -> BookSnapshot:
+        # A consistent copy from one browse; stores that can share unchanging data override it
+        return BookSnapshot({book.id: book for book in self.browse()}, 0)
+
+    def batch(self) -> ContextManager[None]:
+        # Mutations made inside may share one persistence step; by default each persists on its own
+        return nullcontext()
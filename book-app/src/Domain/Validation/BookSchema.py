@@ -0,0 +1,62 @@
+from typing import Any, Callable, Dict, List, Mapping, NamedTuple, Sequence
+
+# Predicates shared by the service schema and Book.__post_init__. isinstance is kept on purpose:
+# bool is an int subclass and has always been accepted.
+def is_non_empty_string(value: Any) -> bool:
+    return isinstance(value, str) and bool(value.strip())
+
+def is_positive_integer(value: Any) -> bool:
+    return isinstance(value, int) and value > 0
+
+def is_non_negative_integer(value: Any) -> bool:
+    return isinstance(value, int) and value >= 0
+
+class FieldRule(NamedTuple):
+    name: str
+    check: Callable[[Any], bool]
+    message: str
+
+# Rules and messages are compiled once; validating a row is a subset test plus one predicate
+# call per present field, with nothing allocated unless the row is invalid.
+class BookSchema:
+    def __init__(self, rules: Sequence[FieldRule]):
+        self.rules = tuple(rules)
+        self.required = frozenset(rule.name for rule in self.rules)
+
+    def validate(self, data: Mapping[str, Any], is_update: bool = False) -> None:
+        # Raises the first error, in the same order errors() reports them
+        if not is_update and not data.keys() >= self.required:
+            raise ValueError(self._missing_message(data))
+        for name, check, message in self.rules:
+            if name in data and not check(data[name]):
+                raise ValueError(message)
+
+    def errors(self, data: Mapping[str, Any], is_update: bool = False) -> List[str]:
+        errors = []
+        if not is_update and not data.keys() >= self.required:
+            errors.append(self._missing_message(data))
+        for name, check, message in self.rules:
+            if name in data and not check(data[name]):
+                errors.append(message)
+        return errors
+
+    def validate_batch(self, rows: Sequence[Mapping[str, Any]], is_update: bool = False) -> Dict[int, List[str]]:
+        # One pass over the rows; every error of every invalid row, keyed by row index
+        invalid = {}
+        for index, row in enumerate(rows):
+            try:
+                self.validate(row, is_update)
+            except ValueError:
+                invalid[index] = self.errors(row, is_update)
+        return invalid
+
+    def _missing_message(self, data: Mapping[str, Any]) -> str:
+        missing = [rule.name for rule in self.rules if rule.name not in data]
+        return f"Missing required fields: {', '.join(missing)}"
+
+BOOK_SCHEMA = BookSchema([
+    FieldRule('title', is_non_empty_string, "Title must be a non-empty string"),
+    FieldRule('author', is_non_empty_string, "Author must be a non-empty string"),
+    FieldRule('published_year', is_positive_integer, "Published_year must be a positive integer"),
+    FieldRule('quantity', is_non_negative_integer, "Quantity must be a non-negative integer"),
+])
@@ -0,0 +1,51 @@
+import os
+import stat
+import tempfile
+from contextlib import contextmanager
+from typing import IO, Iterator
+
+def _current_umask() -> int:
+    # os.umask can only be read by setting it; done once at import, before any threads write files
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+# Mode of a file created with open(); mkstemp always uses 0600
+_NEW_FILE_MODE = 0o666 & ~_current_umask()
+
+@contextmanager
+def atomic_write(file_path: str, mode: str = 'w') -> Iterator[IO]:
+    # Write to a temp file in the target directory and rename it over the original,
+    # so readers and crashes only ever see the old or the new file, never a truncated one.
+    directory = os.path.dirname(os.path.abspath(file_path))
+    fd, temp_path = tempfile.mkstemp(prefix=os.path.basename(file_path) + '.', suffix='.tmp', dir=directory)
+    try:
+        # The replacement keeps the permissions of the file it replaces
+        try:
+            permissions = stat.S_IMODE(os.stat(file_path).st_mode)
+        except FileNotFoundError:
+            permissions = _NEW_FILE_MODE
+        if hasattr(os, 'fchmod'):
+            os.fchmod(fd, permissions)
+        else:
+            os.chmod(temp_path, permissions)
+        with os.fdopen(fd, mode) as file:
+            yield file
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, file_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    _fsync_directory(directory)
+
+def _fsync_directory(directory: str) -> None:
+    # Persist the rename itself; not supported on Windows
+    if not hasattr(os, 'O_DIRECTORY'):
+        return
+    fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
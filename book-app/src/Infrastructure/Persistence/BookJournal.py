@@ -0,0 +1,101 @@
+import json
+import os
+import threading
+from typing import Any, Dict, Iterator, List, Optional, TextIO
+
+# Append-only log of repository mutations, one compact JSON record per line.
+# With a sync_interval, appends within the window share a single fsync (group commit).
+class BookJournal:
+    def __init__(self, file_path: str, sync_interval: float = 0.0):
+        self.file_path = file_path
+        self.sync_interval = sync_interval
+        self.record_count: int = 0
+        self._file: Optional[TextIO] = None
+        self._unsynced: bool = False
+        self._sync_timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+
+    def append(self, record: Dict[str, Any]) -> None:
+        self.append_many([record])
+
+    def append_many(self, records: List[Dict[str, Any]]) -> None:
+        if not records:
+            return
+        lines = ''.join(json.dumps(record, separators=(',', ':')) + '\n' for record in records)
+        with self._lock:
+            if self._file is None:
+                self._file = self._open_for_append()
+            self._file.write(lines)
+            self._file.flush()
+            self.record_count += len(records)
+            self._unsynced = True
+            if self.sync_interval <= 0:
+                self._fsync()
+            elif self._sync_timer is None:
+                self._sync_timer = threading.Timer(self.sync_interval, self.sync)
+                self._sync_timer.daemon = True
+                self._sync_timer.start()
+
+    def sync(self) -> None:
+        with self._lock:
+            self._cancel_timer()
+            self._fsync()
+
+    def _fsync(self) -> None:
+        if self._unsynced and self._file is not None:
+            os.fsync(self._file.fileno())
+            self._unsynced = False
+
+    def _cancel_timer(self) -> None:
+        if self._sync_timer is not None:
+            self._sync_timer.cancel()
+            self._sync_timer = None
+
+    def replay(self) -> Iterator[Dict[str, Any]]:
+        self.record_count = 0
+        try:
+            with open(self.file_path, 'r') as file:
+                for line in file:
+                    if not line.strip():
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # A torn line left behind by an interrupted append
+                        continue
+                    self.record_count += 1
+                    yield record
+        except FileNotFoundError:
+            return
+
+    def _open_for_append(self) -> TextIO:
+        torn = False
+        if os.path.exists(self.file_path) and os.path.getsize(self.file_path) > 0:
+            with open(self.file_path, 'rb') as file:
+                file.seek(-1, os.SEEK_END)
+                torn = file.read(1) != b'\n'
+        file = open(self.file_path, 'a')
+        if torn:
+            # Terminate a torn line so the next record starts cleanly
+            file.write('\n')
+        return file
+
+    def truncate(self) -> None:
+        with self._lock:
+            self._cancel_timer()
+            self._close_file()
+            if os.path.exists(self.file_path):
+                os.remove(self.file_path)
+            self.record_count = 0
+            self._unsynced = False
+
+    def close(self) -> None:
+        with self._lock:
+            self._cancel_timer()
+            self._fsync()
+            self._close_file()
+
+    def _close_file(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,259 @@
+import io
+import json
+import mmap
+import os
+import struct
+from abc import ABC, abstractmethod
+from typing import IO, Any, Dict, Iterator, List, Optional, Sequence, Tuple
+from src.Domain.Entities.Book import Book
+from src.Infrastructure.Persistence.BookStreamLoader import iter_json_array
+
+class SnapshotFormatError(ValueError):
+    pass
+
+def book_to_dict(book: Book) -> Dict[str, Any]:
+    return {
+        'id': book.id,
+        'title': book.title,
+        'author': book.author,
+        'published_year': book.published_year,
+        'quantity': book.quantity
+    }
+
+# A codec writes a whole snapshot and streams it back. Text codecs also encode records one at a
+# time, so a writer can keep unchanged records' text, and list (id, start, end) byte ranges of
+# their records and decode a single record from those bytes for the lazy load mode. The binary
+# codec has neither: it is always written whole and read lazily through MappedBookTable.
+class BookSnapshotCodec(ABC):
+    name = ''
+    binary = False
+
+    @abstractmethod
+    def dump(self, books: Sequence[Book], file: IO) -> None: ...
+
+    @abstractmethod
+    def load(self, file: IO) -> Iterator[Book]: ...
+
+class TextSnapshotCodec(BookSnapshotCodec):
+    @abstractmethod
+    def encode(self, book: Book) -> str: ...
+
+    @abstractmethod
+    def dump_encoded(self, records: Sequence[str], file: IO) -> None: ...
+
+    @abstractmethod
+    def index(self, file: IO) -> Iterator[Tuple[int, int, int]]: ...
+
+    @abstractmethod
+    def decode(self, data: bytes) -> Book: ...
+
+# The original Books.json layout: one pretty-printed array
+class JsonArrayCodec(TextSnapshotCodec):
+    name = 'json'
+
+    def dump(self, books: Sequence[Book], file: IO) -> None:
+        json.dump([book_to_dict(book) for book in books], file, indent=4)
+
+    def encode(self, book: Book) -> str:
+        # Indented as an array element; strings never contain raw newlines, so this matches dump
+        return '    ' + json.dumps(book_to_dict(book), indent=4).replace('\n', '\n    ')
+
+    def dump_encoded(self, records: Sequence[str], file: IO) -> None:
+        if not records:
+            file.write('[]')
+            return
+        file.write('[\n')
+        for start in range(0, len(records), 1000):
+            if start:
+                file.write(',\n')
+            file.write(',\n'.join(records[start:start + 1000]))
+        file.write('\n]')
+
+    def load(self, file: IO) -> Iterator[Book]:
+        for _, _, book_data in iter_json_array(file):
+            yield Book(**book_data)
+
+    def index(self, file: IO) -> Iterator[Tuple[int, int, int]]:
+        # Latin-1 maps every byte to one character, so character offsets are byte offsets;
+        # only the numeric id is used here, the record itself is decoded properly later.
+        text = io.TextIOWrapper(file, encoding='latin-1', newline='')
+        for start, end, book_data in iter_json_array(text):
+            yield book_data['id'], start, end
+        text.detach()
+
+    def decode(self, data: bytes) -> Book:
+        return Book(**json.loads(data))
+
+# One compact JSON object per line
+class JsonLinesCodec(TextSnapshotCodec):
+    name = 'jsonl'
+
+    def __init__(self):
+        self._encoder = json.JSONEncoder(separators=(',', ':'))
+
+    def dump(self, books: Sequence[Book], file: IO) -> None:
+        encode = self._encoder.encode
+        for start in range(0, len(books), 1000):
+            file.write(''.join(encode(book_to_dict(book)) + '\n' for book in books[start:start + 1000]))
+
+    def encode(self, book: Book) -> str:
+        return self._encoder.encode(book_to_dict(book)) + '\n'
+
+    def dump_encoded(self, records: Sequence[str], file: IO) -> None:
+        for start in range(0, len(records), 1000):
+            file.write(''.join(records[start:start + 1000]))
+
+    def load(self, file: IO) -> Iterator[Book]:
+        for line in file:
+            if line.strip():
+                yield Book(**json.loads(line))
+
+    def index(self, file: IO) -> Iterator[Tuple[int, int, int]]:
+        position = 0
+        for line in file:
+            if line.strip():
+                yield json.loads(line)['id'], position, position + len(line)
+            position += len(line)
+
+    def decode(self, data: bytes) -> Book:
+        return Book(**json.loads(data))
+
+# Header, then one fixed-size record per book, then a heap holding each title and author as
+# UTF-8. Record i lives at a known offset, so a memory map can read any book without decoding
+# the rest of the file; when ids are ascending it can also binary-search them. Numbers are
+# 64-bit; version 1 files, which stored the year in 32 bits, are still read.
+_MAGIC = b'BKS2'
+_FLAG_SORTED = 1
+_HEADER = struct.Struct('<4sB3xqQ')
+_RECORD = struct.Struct('<qqqQII')
+_RECORDS = {b'BKS1': struct.Struct('<qiqQII'), _MAGIC: _RECORD}
+_ID = struct.Struct('<q')
+
+class BinaryBookCodec(BookSnapshotCodec):
+    name = 'binary'
+    binary = True
+
+    def dump(self, books: Sequence[Book], file: IO) -> None:
+        records = bytearray(_RECORD.size * len(books))
+        heap: List[bytes] = []
+        heap_size = 0
+        ascending = True
+        max_id = -1
+        for row, book in enumerate(books):
+            title = book.title.encode('utf-8')
+            author = book.author.encode('utf-8')
+            try:
+                _RECORD.pack_into(
+                    records, row * _RECORD.size,
+                    book.id, book.published_year, book.quantity, heap_size, len(title), len(author)
+                )
+            except struct.error:
+                raise ValueError(f"Book with ID {book.id} has a number too large for the binary codec") from None
+            heap.append(title)
+            heap.append(author)
+            heap_size += len(title) + len(author)
+            ascending = ascending and book.id > max_id
+            max_id = max(max_id, book.id)
+        file.write(_HEADER.pack(_MAGIC, _FLAG_SORTED if ascending else 0, max_id, len(books)))
+        file.write(records)
+        file.write(b''.join(heap))
+
+    def load(self, file: IO) -> Iterator[Book]:
+        table = MappedBookTable.from_file(file)
+        try:
+            yield from table
+        finally:
+            table.close()
+
+class MappedBookTable:
+    def __init__(self, buffer: Any, file: Optional[IO] = None):
+        self._buffer = buffer
+        self._file = file
+        if len(buffer) < _HEADER.size:
+            raise SnapshotFormatError("Binary snapshot is truncated")
+        magic, flags, self.max_id, self._count = _HEADER.unpack_from(buffer, 0)
+        self._record = _RECORDS.get(magic)
+        if self._record is None:
+            raise SnapshotFormatError("Not a binary book snapshot")
+        self.ids_sorted = bool(flags & _FLAG_SORTED)
+        self._heap = _HEADER.size + self._record.size * self._count
+        if len(buffer) < self._heap:
+            raise SnapshotFormatError("Binary snapshot is truncated")
+        self._rows: Optional[Dict[int, int]] = None
+
+    @classmethod
+    def open(cls, file_path: str) -> 'MappedBookTable':
+        return cls.from_file(open(file_path, 'rb'), owns_file=True)
+
+    @classmethod
+    def from_file(cls, file: IO, owns_file: bool = False) -> 'MappedBookTable':
+        if os.fstat(file.fileno()).st_size == 0:
+            # mmap cannot map an empty file
+            buffer: Any = b''
+        else:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return cls(buffer, file if owns_file else None)
+        except SnapshotFormatError:
+            if isinstance(buffer, mmap.mmap):
+                buffer.close()
+            if owns_file:
+                file.close()
+            raise
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[Book]:
+        for row in range(self._count):
+            yield self.book_at(row)
+
+    def id_at(self, row: int) -> int:
+        return _ID.unpack_from(self._buffer, _HEADER.size + row * self._record.size)[0]
+
+    def book_at(self, row: int) -> Book:
+        book_id, published_year, quantity, offset, title_length, author_length = self._record.unpack_from(
+            self._buffer, _HEADER.size + row * self._record.size
+        )
+        start = self._heap + offset
+        middle = start + title_length
+        return Book(
+            title=self._buffer[start:middle].decode('utf-8'),
+            author=self._buffer[middle:middle + author_length].decode('utf-8'),
+            published_year=published_year,
+            quantity=quantity,
+            id=book_id
+        )
+
+    def find(self, book_id: int) -> Optional[int]:
+        if not self.ids_sorted:
+            if self._rows is None:
+                self._rows = {self.id_at(row): row for row in range(self._count)}
+            return self._rows.get(book_id)
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self.id_at(middle) < book_id:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self._count and self.id_at(low) == book_id:
+            return low
+        return None
+
+    def close(self) -> None:
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+SNAPSHOT_CODECS: Dict[str, BookSnapshotCodec] = {
+    codec.name: codec for codec in (JsonArrayCodec(), JsonLinesCodec(), BinaryBookCodec())
+}
+
+def get_codec(name: str) -> BookSnapshotCodec:
+    try:
+        return SNAPSHOT_CODECS[name]
+    except KeyError:
+        raise ValueError(f"Unknown snapshot codec: {name}") from None
@@ -0,0 +1,67 @@
+import json
+import re
+from typing import Any, Iterator, TextIO, Tuple
+
+_CHUNK_SIZE = 64 * 1024
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+# Separator between two elements together with the whitespace around it
+_SEPARATOR = re.compile(r'[ \t\n\r]*([,\]])[ \t\n\r]*')
+# The decoder's C scanner, called directly to skip raw_decode's per-call Python overhead
+_scan_once = json.JSONDecoder().scan_once
+
+def iter_json_array(file: TextIO, chunk_size: int = _CHUNK_SIZE) -> Iterator[Tuple[int, int, Any]]:
+    # Yields (start, end, value) for each element of a top-level JSON array while reading the
+    # file in chunks, so peak memory is one chunk plus one element rather than the whole document.
+    # Offsets count characters from the start of the file.
+    buffer, base, position = '', 0, 0
+    eof = False
+
+    def fill() -> bool:
+        nonlocal buffer, base, position, eof
+        if eof:
+            return False
+        chunk = file.read(chunk_size)
+        if not chunk:
+            eof = True
+            return False
+        buffer = buffer[position:] + chunk
+        base += position
+        position = 0
+        return True
+
+    def skip_whitespace() -> str:
+        nonlocal position
+        while True:
+            position = _WHITESPACE.match(buffer, position).end()
+            if position < len(buffer):
+                return buffer[position]
+            if not fill():
+                return ''
+
+    if skip_whitespace() != '[':
+        raise json.JSONDecodeError("Expecting '['", buffer, position)
+    position += 1
+    if skip_whitespace() == ']':
+        return
+
+    while True:
+        try:
+            value, end = _scan_once(buffer, position)
+        except (StopIteration, json.JSONDecodeError) as e:
+            # Either the element continues in the next chunk or the document is malformed
+            if fill():
+                continue
+            if isinstance(e, StopIteration):
+                raise json.JSONDecodeError("Expecting value", buffer, position) from None
+            raise
+        separator = _SEPARATOR.match(buffer, end)
+        if separator is None or separator.end() == len(buffer):
+            # Not enough lookahead to be sure where this element stops; read on and rescan it
+            if fill():
+                continue
+            if separator is None:
+                raise json.JSONDecodeError("Expecting ',' delimiter", buffer, end)
+        yield base + position, base + end, value
+        if separator.group(1) == ']':
+            return
+        position = separator.end()
@@ -0,0 +1,189 @@
+import csv
+import gzip
+import io
+import json
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from itertools import islice
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from src.Domain.Entities.Book import Book
+from src.Infrastructure.Persistence.AtomicFile import atomic_write
+from src.Infrastructure.Persistence.BookSnapshotCodecs import book_to_dict
+from src.Infrastructure.Persistence.BookStreamLoader import iter_json_array
+
+TRANSFER_CHUNK_SIZE = 1000
+_GZIP_MAGIC = b'\x1f\x8b'
+_CSV_COLUMNS = ('id', 'title', 'author', 'published_year', 'quantity')
+_CSV_INTEGER_COLUMNS = ('id', 'published_year', 'quantity')
+
+# Export and import formats. Export encodes a chunk of books into one string, so the text held
+# at any time is a single chunk however large the catalogue; import yields one row dict at a time.
+class BookTransferFormat(ABC):
+    name = ''
+
+    def header(self) -> str:
+        return ''
+
+    @abstractmethod
+    def encode_chunk(self, books: Iterable[Book]) -> str: ...
+
+    @abstractmethod
+    def rows(self, file: IO) -> Iterator[Dict[str, Any]]: ...
+
+class CsvTransferFormat(BookTransferFormat):
+    name = 'csv'
+
+    def header(self) -> str:
+        return ','.join(_CSV_COLUMNS) + '\n'
+
+    def encode_chunk(self, books: Iterable[Book]) -> str:
+        buffer = io.StringIO()
+        csv.writer(buffer, lineterminator='\n').writerows(
+            (book.id, book.title, book.author, book.published_year, book.quantity) for book in books
+        )
+        return buffer.getvalue()
+
+    def rows(self, file: IO) -> Iterator[Dict[str, Any]]:
+        # CSV has no types: whole numbers become ints, anything else is left for validation to reject
+        for row in csv.DictReader(file):
+            for column in _CSV_INTEGER_COLUMNS:
+                value = row.get(column)
+                if isinstance(value, str) and value.strip().lstrip('-').isdigit():
+                    try:
+                        row[column] = int(value)
+                    except ValueError:
+                        # e.g. "--5" or "²": kept as text, so validation rejects just this row
+                        pass
+            if row.get('id') == '':
+                del row['id']
+            yield row
+
+class JsonLinesTransferFormat(BookTransferFormat):
+    name = 'jsonl'
+
+    def __init__(self):
+        self._encoder = json.JSONEncoder(separators=(',', ':'))
+
+    def encode_chunk(self, books: Iterable[Book]) -> str:
+        encode = self._encoder.encode
+        return ''.join(encode(book_to_dict(book)) + '\n' for book in books)
+
+    def rows(self, file: IO) -> Iterator[Dict[str, Any]]:
+        # Also reads the Books.json layout, one array of objects, without loading it whole
+        first = _peek_text(file)
+        if first == '[':
+            values = (value for _, _, value in iter_json_array(file))
+        else:
+            values = (json.loads(line) for line in file if line.strip())
+        for number, value in enumerate(values, 1):
+            if not isinstance(value, dict):
+                raise ValueError(f"Row {number}: expected a JSON object")
+            yield value
+
+TRANSFER_FORMATS: Dict[str, BookTransferFormat] = {
+    transfer_format.name: transfer_format for transfer_format in (CsvTransferFormat(), JsonLinesTransferFormat())
+}
+
+def get_transfer_format(name: str) -> BookTransferFormat:
+    try:
+        return TRANSFER_FORMATS[name]
+    except KeyError:
+        raise ValueError(f"Unknown transfer format: {name}") from None
+
+def infer_transfer_format(path: str) -> Tuple[Optional[str], bool]:
+    # "books.csv.gz" -> ('csv', True); a suffix that names no format gives None
+    compressed = path.endswith('.gz')
+    stem = path[:-3] if compressed else path
+    extension = stem.rsplit('.', 1)[-1].lower() if '.' in stem else ''
+    return (extension if extension in TRANSFER_FORMATS else None), compressed
+
+def chunked(items: Iterable[Any], chunk_size: int) -> Iterator[List[Any]]:
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+def write_books(books: Iterable[Book], file: IO, transfer_format: BookTransferFormat, chunk_size: int = TRANSFER_CHUNK_SIZE) -> int:
+    file.write(transfer_format.header())
+    written = 0
+    for chunk in chunked(books, chunk_size):
+        file.write(transfer_format.encode_chunk(chunk))
+        written += len(chunk)
+    return written
+
+@contextmanager
+def open_export(target: Union[str, IO], compress: bool = False) -> Iterator[IO]:
+    # A path is replaced atomically once the export completes. A stream is written in place:
+    # text streams as they are, binary ones through a UTF-8 (and optionally gzip) layer.
+    if isinstance(target, str):
+        with atomic_write(target, 'wb') as raw:
+            with _text_writer(raw, compress) as file:
+                yield file
+    elif isinstance(target, io.TextIOBase):
+        if compress:
+            raise ValueError("Compressed export needs a file or a binary stream")
+        yield target
+        target.flush()
+    else:
+        with _text_writer(target, compress) as file:
+            yield file
+
+@contextmanager
+def open_import(source: Union[str, IO], format_name: Optional[str] = None) -> Iterator[Iterator[Dict[str, Any]]]:
+    # Yields an iterator over the source's rows. Gzip is recognised by its magic bytes and the
+    # format, unless given, by the path suffix or else by the first character of the data.
+    if format_name is None and isinstance(source, str):
+        format_name = infer_transfer_format(source)[0]
+    with _text_reader(source) as file:
+        if format_name is None:
+            format_name = 'jsonl' if _peek_text(file) in ('[', '{') else 'csv'
+        yield get_transfer_format(format_name).rows(file)
+
+@contextmanager
+def _text_writer(raw: IO, compress: bool) -> Iterator[IO]:
+    stream = gzip.GzipFile(fileobj=raw, mode='wb', compresslevel=6, mtime=0) if compress else raw
+    file = io.TextIOWrapper(stream, encoding='utf-8', newline='')
+    try:
+        yield file
+    finally:
+        # Detach so the wrapper never closes a stream the caller or atomic_write owns;
+        # closing the gzip layer only writes its trailer
+        file.detach()
+        if compress:
+            stream.close()
+    raw.flush()
+
+@contextmanager
+def _text_reader(source: Union[str, IO]) -> Iterator[IO]:
+    if isinstance(source, io.TextIOBase):
+        yield source
+        return
+    raw = open(source, 'rb') if isinstance(source, str) else source
+    try:
+        if not hasattr(raw, 'peek'):
+            raw = io.BufferedReader(raw)
+        stream = gzip.GzipFile(fileobj=raw, mode='rb') if raw.peek(2)[:2] == _GZIP_MAGIC else raw
+        file = io.TextIOWrapper(stream, encoding='utf-8', newline='')
+        try:
+            yield file
+        finally:
+            file.detach()
+    finally:
+        if isinstance(source, str):
+            raw.close()
+
+def _peek_text(file: IO) -> str:
+    # First non-whitespace character, without consuming it: peeked from the byte buffer of a
+    # wrapper that has not read yet (pipes cannot seek), otherwise read and seeked back
+    buffer = getattr(file, 'buffer', None)
+    if hasattr(buffer, 'peek'):
+        return buffer.peek(1).lstrip()[:1].decode('ascii', 'replace')
+    position = file.tell()
+    while True:
+        character = file.read(1)
+        if not character or not character.isspace():
+            break
+    file.seek(position)
+    return character
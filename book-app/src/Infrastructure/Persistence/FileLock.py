@@ -0,0 +1,89 @@
+import os
+import threading
+from contextlib import contextmanager
+from typing import IO, Iterator, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:
+    # Windows
+    fcntl = None
+    import msvcrt
+
+FileSignature = Tuple[int, int, int]
+
+def file_signature(file_path: str) -> Optional[FileSignature]:
+    # Snapshots are replaced with os.replace, so every write also gets a new inode
+    try:
+        stat = os.stat(file_path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+# Advisory lock on a sidecar file, shared between processes. Inside one process it also
+# behaves like a plain mutex, since flock would let two threads share one descriptor's lock.
+class FileLock:
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self._thread_lock = threading.Lock()
+        self._file: Optional[IO] = None
+
+    @contextmanager
+    def shared(self) -> Iterator[None]:
+        with self._holding(exclusive=False):
+            yield
+
+    @contextmanager
+    def exclusive(self) -> Iterator[None]:
+        with self._holding(exclusive=True):
+            yield
+
+    def close(self) -> None:
+        with self._thread_lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    @contextmanager
+    def _holding(self, exclusive: bool) -> Iterator[None]:
+        with self._thread_lock:
+            if self._file is None:
+                self._file = open(self.file_path, 'a+b')
+            _lock_file(self._file, exclusive)
+            try:
+                yield
+            finally:
+                _unlock_file(self._file)
+
+# Same interface without any locking, for a catalogue owned by a single process
+class NullFileLock:
+    @contextmanager
+    def shared(self) -> Iterator[None]:
+        yield
+
+    @contextmanager
+    def exclusive(self) -> Iterator[None]:
+        yield
+
+    def close(self) -> None:
+        pass
+
+def _lock_file(file: IO, exclusive: bool) -> None:
+    if fcntl is not None:
+        fcntl.flock(file.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        return
+    # msvcrt only has exclusive byte-range locks; LK_LOCK gives up after ten seconds, so keep retrying
+    file.seek(0)
+    while True:
+        try:
+            msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+            return
+        except OSError:
+            continue
+
+def _unlock_file(file: IO) -> None:
+    if fcntl is not None:
+        fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+        return
+    file.seek(0)
+    msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
@@ -0,0 +1,138 @@
+import sys
+from array import array
+from bisect import bisect_left
+from typing import Iterable, Iterator, List, MutableMapping, Optional
+from src.Domain.Entities.Book import Book
+
+# One-slot arrays matching the numeric columns, used to check that a value fits before storing it
+_ID_SLOT = array('q', [0])
+_YEAR_SLOT = array('l', [0])
+_QUANTITY_SLOT = array('q', [0])
+
+# Id-keyed book store that keeps each field in a parallel column instead of one object per book.
+# Ids are handed out in increasing order, so the id column stays sorted and doubles as the
+# lookup index; deleted rows are tombstoned and squeezed out once they outnumber live rows.
+class BookColumnStore(MutableMapping[int, Book]):
+    def __init__(self, books: Iterable[Book] = ()):
+        self._ids = array('q')
+        self._titles: List[Optional[str]] = []
+        self._authors: List[Optional[str]] = []
+        self._years = array('l')
+        self._quantities = array('q')
+        self._live: int = 0
+        for book in books:
+            self[book.id] = book
+
+    def __getitem__(self, book_id: int) -> Book:
+        return self._book_at(self._find(book_id))
+
+    def __setitem__(self, book_id: int, book: Book) -> None:
+        # Checked before any row state changes, so a value that does not fit leaves no half-written row
+        try:
+            _ID_SLOT[0] = book_id
+            _YEAR_SLOT[0] = book.published_year
+            _QUANTITY_SLOT[0] = book.quantity
+        except OverflowError:
+            raise ValueError(f"Book with ID {book_id} has a number too large for the columnar store") from None
+        row = self._row_for(book_id)
+        if row is None or self._titles[row] is None:
+            if row is None:
+                row = bisect_left(self._ids, book_id)
+                self._insert_row(row, book_id)
+            self._live += 1
+        self._titles[row] = book.title
+        self._authors[row] = sys.intern(book.author)
+        self._years[row] = book.published_year
+        self._quantities[row] = book.quantity
+
+    def __delitem__(self, book_id: int) -> None:
+        row = self._find(book_id)
+        self._titles[row] = None
+        self._authors[row] = None
+        self._live -= 1
+        if len(self._ids) - self._live > self._live:
+            self._compact()
+
+    def __iter__(self) -> Iterator[int]:
+        for row, title in enumerate(self._titles):
+            if title is not None:
+                yield self._ids[row]
+
+    def __len__(self) -> int:
+        return self._live
+
+    def __contains__(self, book_id: object) -> bool:
+        return isinstance(book_id, int) and self._live_row(book_id) is not None
+
+    def get(self, book_id: int, default: Optional[Book] = None) -> Optional[Book]:
+        row = self._live_row(book_id)
+        return default if row is None else self._book_at(row)
+
+    def pop(self, book_id: int, *default: Optional[Book]) -> Optional[Book]:
+        row = self._live_row(book_id)
+        if row is None:
+            if default:
+                return default[0]
+            raise KeyError(book_id)
+        book = self._book_at(row)
+        del self[book_id]
+        return book
+
+    def values(self) -> Iterator[Book]:
+        for row, title in enumerate(self._titles):
+            if title is not None:
+                yield self._book_at(row)
+
+    def copy(self) -> 'BookColumnStore':
+        # Copies the columns, not the books; the strings themselves are shared
+        clone = BookColumnStore()
+        clone._ids = self._ids[:]
+        clone._titles = self._titles[:]
+        clone._authors = self._authors[:]
+        clone._years = self._years[:]
+        clone._quantities = self._quantities[:]
+        clone._live = self._live
+        return clone
+
+    def _book_at(self, row: int) -> Book:
+        return Book(
+            title=self._titles[row],
+            author=self._authors[row],
+            published_year=self._years[row],
+            quantity=self._quantities[row],
+            id=self._ids[row]
+        )
+
+    def _row_for(self, book_id: int) -> Optional[int]:
+        row = bisect_left(self._ids, book_id)
+        if row < len(self._ids) and self._ids[row] == book_id:
+            return row
+        return None
+
+    def _live_row(self, book_id: int) -> Optional[int]:
+        row = self._row_for(book_id)
+        if row is None or self._titles[row] is None:
+            return None
+        return row
+
+    def _find(self, book_id: int) -> int:
+        row = self._live_row(book_id)
+        if row is None:
+            raise KeyError(book_id)
+        return row
+
+    def _insert_row(self, row: int, book_id: int) -> None:
+        # Appending is the common case; an out-of-order id shifts the tail to keep ids sorted
+        self._ids.insert(row, book_id)
+        self._titles.insert(row, None)
+        self._authors.insert(row, None)
+        self._years.insert(row, 0)
+        self._quantities.insert(row, 0)
+
+    def _compact(self) -> None:
+        keep = [row for row, title in enumerate(self._titles) if title is not None]
+        self._ids = array('q', (self._ids[row] for row in keep))
+        self._titles = [self._titles[row] for row in keep]
+        self._authors = [self._authors[row] for row in keep]
+        self._years = array('l', (self._years[row] for row in keep))
+        self._quantities = array('q', (self._quantities[row] for row in keep))
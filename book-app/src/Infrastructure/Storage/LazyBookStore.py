@@ -0,0 +1,79 @@
+from typing import BinaryIO, Dict, Iterator, MutableMapping, Optional, Tuple, Union
+from src.Domain.Entities.Book import Book
+from src.Infrastructure.Persistence.BookSnapshotCodecs import JsonArrayCodec, TextSnapshotCodec
+
+# Id-keyed book store that starts as an id -> (start, end) byte-offset index into a text snapshot
+# and only parses a record into a Book the first time it is accessed.
+class LazyBookStore(MutableMapping[int, Book]):
+    def __init__(self, file_path: str, codec: TextSnapshotCodec):
+        if not isinstance(codec, TextSnapshotCodec):
+            raise ValueError(f"Lazy loading needs a text codec, not {codec.name}")
+        self.file_path = file_path
+        self.codec = codec
+        self._entries: Dict[int, Union[Book, Tuple[int, int]]] = {}
+
+    @classmethod
+    def index_file(cls, file_path: str, codec: Optional[TextSnapshotCodec] = None) -> 'LazyBookStore':
+        store = cls(file_path, codec or JsonArrayCodec())
+        with open(file_path, 'rb') as file:
+            for book_id, start, end in store.codec.index(file):
+                store._entries[book_id] = (start, end)
+        return store
+
+    def __getitem__(self, book_id: int) -> Book:
+        entry = self._entries[book_id]
+        if isinstance(entry, Book):
+            return entry
+        book = self._materialize(entry)
+        self._entries[book_id] = book
+        return book
+
+    def __setitem__(self, book_id: int, book: Book) -> None:
+        self._entries[book_id] = book
+
+    def __delitem__(self, book_id: int) -> None:
+        del self._entries[book_id]
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, book_id: object) -> bool:
+        return book_id in self._entries
+
+    def get(self, book_id: int, default: Optional[Book] = None) -> Optional[Book]:
+        if book_id not in self._entries:
+            return default
+        return self[book_id]
+
+    def pop(self, book_id: int, *default: Optional[Book]) -> Optional[Book]:
+        if book_id not in self._entries:
+            if default:
+                return default[0]
+            raise KeyError(book_id)
+        book = self[book_id]
+        del self._entries[book_id]
+        return book
+
+    def values(self) -> Iterator[Book]:
+        # Materializes every pending record, e.g. before the snapshot is rewritten
+        pending = [book_id for book_id, entry in self._entries.items() if not isinstance(entry, Book)]
+        if pending:
+            with open(self.file_path, 'rb') as file:
+                for book_id in pending:
+                    self._entries[book_id] = self._materialize(self._entries[book_id], file)
+        return iter(list(self._entries.values()))
+
+    @property
+    def materialized_count(self) -> int:
+        return sum(1 for entry in self._entries.values() if isinstance(entry, Book))
+
+    def _materialize(self, offsets: Tuple[int, int], file: Optional[BinaryIO] = None) -> Book:
+        start, end = offsets
+        if file is None:
+            with open(self.file_path, 'rb') as file:
+                return self._materialize(offsets, file)
+        file.seek(start)
+        return self.codec.decode(file.read(end - start))
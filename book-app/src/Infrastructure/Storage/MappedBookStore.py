@@ -0,0 +1,76 @@
+from typing import Dict, Iterator, MutableMapping, Optional, Set
+from src.Domain.Entities.Book import Book
+from src.Infrastructure.Persistence.BookSnapshotCodecs import MappedBookTable
+
+# Id-keyed book store over a memory-mapped binary snapshot. Opening it reads only the header;
+# records are decoded straight from the map on access, and changes made since the snapshot live
+# in small overlays until the next snapshot write.
+class MappedBookStore(MutableMapping[int, Book]):
+    def __init__(self, table: MappedBookTable):
+        self._table = table
+        self._replaced: Dict[int, Book] = {}
+        self._added: Dict[int, Book] = {}
+        self._deleted: Set[int] = set()
+
+    @classmethod
+    def open(cls, file_path: str) -> 'MappedBookStore':
+        return cls(MappedBookTable.open(file_path))
+
+    def __getitem__(self, book_id: int) -> Book:
+        book = self.get(book_id)
+        if book is None:
+            raise KeyError(book_id)
+        return book
+
+    def __setitem__(self, book_id: int, book: Book) -> None:
+        if book_id in self._deleted or self._table.find(book_id) is not None:
+            self._deleted.discard(book_id)
+            self._replaced[book_id] = book
+        else:
+            self._added[book_id] = book
+
+    def __delitem__(self, book_id: int) -> None:
+        if self._added.pop(book_id, None) is not None:
+            return
+        if book_id in self._deleted or self._table.find(book_id) is None:
+            raise KeyError(book_id)
+        self._replaced.pop(book_id, None)
+        self._deleted.add(book_id)
+
+    def __iter__(self) -> Iterator[int]:
+        for row in range(len(self._table)):
+            book_id = self._table.id_at(row)
+            if book_id not in self._deleted:
+                yield book_id
+        yield from self._added
+
+    def __len__(self) -> int:
+        return len(self._table) - len(self._deleted) + len(self._added)
+
+    def __contains__(self, book_id: object) -> bool:
+        return isinstance(book_id, int) and self.get(book_id) is not None
+
+    def get(self, book_id: int, default: Optional[Book] = None) -> Optional[Book]:
+        if book_id in self._added:
+            return self._added[book_id]
+        if book_id in self._replaced:
+            return self._replaced[book_id]
+        if book_id in self._deleted:
+            return default
+        row = self._table.find(book_id)
+        return default if row is None else self._table.book_at(row)
+
+    def values(self) -> Iterator[Book]:
+        for row in range(len(self._table)):
+            book_id = self._table.id_at(row)
+            if book_id in self._deleted:
+                continue
+            book = self._replaced.get(book_id)
+            yield book if book is not None else self._table.book_at(row)
+        yield from self._added.values()
+
+    def max_id(self) -> int:
+        return max(self._table.max_id, max(self._added, default=-1))
+
+    def close(self) -> None:
+        self._table.close()
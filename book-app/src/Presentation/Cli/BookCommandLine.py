@@ -0,0 +1,171 @@
+import argparse
+import shlex
+import sys
+from typing import IO, Callable, Iterable, List, Optional
+from src.Presentation.Controllers.BookController import BookController
+from src.Presentation.Serialization.BookJson import book_to_json
+
+# Commands that touch few books open a JSON snapshot lazily: records are indexed at startup and
+# only parsed when a command reads them
+_LAZY_COMMANDS = {'list', 'get', 'export'}
+_TRANSFER_FORMATS = ('csv', 'jsonl')
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='main.py',
+        description="Book Management System batch mode. Without a command the interactive menu starts."
+    )
+    commands = parser.add_subparsers(dest='command', required=True)
+    list_parser = commands.add_parser('list', help="print books as JSON lines")
+    list_parser.add_argument('--limit', type=int)
+    list_parser.add_argument('--offset', type=int, default=0)
+    list_parser.add_argument('--after', type=int, help="only books with a larger ID")
+    get_parser = commands.add_parser('get', help="print one book as JSON")
+    get_parser.add_argument('book_id', type=int)
+    search_parser = commands.add_parser('search', help="print books matching every term")
+    search_parser.add_argument('terms', nargs='+')
+    import_parser = commands.add_parser('import', help="add books from CSV, JSON lines or a JSON array, optionally gzipped")
+    import_parser.add_argument('file', help="path to read, or - for stdin")
+    import_parser.add_argument('--format', choices=_TRANSFER_FORMATS, help="default: from the suffix or the data")
+    import_parser.add_argument('--chunk-size', type=int, default=1000, help="rows added per bulk call")
+    export_parser = commands.add_parser('export', help="stream every book as JSON lines or CSV")
+    export_parser.add_argument('--output', help="file to write instead of stdout")
+    export_parser.add_argument('--format', choices=_TRANSFER_FORMATS, help="default: from the --output suffix, else jsonl")
+    export_parser.add_argument('--gzip', action='store_true', default=None, help="compress; implied by a .gz --output")
+    export_parser.add_argument('--chunk-size', type=int, default=1000, help="books encoded per write")
+    commands.add_parser('batch', help="run one command per line from stdin")
+    serve_parser = commands.add_parser('serve', help="serve the HTTP/JSON API until interrupted")
+    serve_parser.add_argument('--host', default='127.0.0.1')
+    serve_parser.add_argument('--port', type=int, default=8000)
+    serve_parser.add_argument('--workers', type=int, default=8, help="threads per process")
+    serve_parser.add_argument('--processes', type=int, default=1, help="pre-forked server processes sharing the catalogue")
+    serve_parser.add_argument('--max-in-flight', type=int, default=64, help="concurrent requests per process before 503")
+    serve_parser.add_argument('--metrics', action='store_true', help="time every layer and expose GET /metrics")
+    serve_parser.add_argument('--log-requests', action='store_true')
+    return parser
+
+class BookCommandLine:
+    def __init__(
+        self,
+        controller_factory: Callable[..., BookController],
+        stdin: Optional[IO] = None,
+        stdout: Optional[IO] = None
+    ):
+        # controller_factory(lazy=...) is called on the first command, so --help and usage errors
+        # never load the catalogue; serve passes it on to build a controller per server process
+        self._controller_factory = controller_factory
+        self._controller: Optional[BookController] = None
+        self._stdin = stdin
+        self._stdout = stdout
+        self._parser = build_parser()
+
+    def run(self, argv: List[str]) -> int:
+        args = self._parse(argv)
+        if args is None:
+            return 2
+        if args.command == 'batch':
+            return self._run_batch(self._stdin or sys.stdin)
+        if args.command == 'serve':
+            return self._serve(args)
+        return self._execute(args, lazy=args.command in _LAZY_COMMANDS)
+
+    def _run_batch(self, lines: Iterable[str]) -> int:
+        # Every line shares one fully loaded controller; a failing line is reported and the rest still run
+        status = 0
+        for line in lines:
+            argv = shlex.split(line, comments=True)
+            if not argv:
+                continue
+            args = self._parse(argv)
+            if args is None or args.command in ('batch', 'serve'):
+                if args is not None:
+                    print(f"Error: {args.command} cannot run inside batch", file=sys.stderr)
+                status = 1
+                continue
+            status = self._execute(args, lazy=False) or status
+        return status
+
+    def _parse(self, argv: List[str]) -> Optional[argparse.Namespace]:
+        # argparse reports usage errors itself and then exits; turn that into a status instead
+        try:
+            return self._parser.parse_args(argv)
+        except SystemExit as e:
+            return None if e.code else argparse.Namespace(command='help')
+
+    def _execute(self, args: argparse.Namespace, lazy: bool) -> int:
+        if args.command == 'help':
+            return 0
+        if self._controller is None:
+            self._controller = self._controller_factory(lazy=lazy)
+        try:
+            return getattr(self, f"_{args.command}")(self._controller, args)
+        except (OSError, ValueError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+
+    def _write(self, text: str) -> None:
+        print(text, file=self._stdout or sys.stdout)
+
+    def _list(self, controller: BookController, args: argparse.Namespace) -> int:
+        for book in controller.iter_books(args.offset, args.limit, args.after):
+            self._write(book_to_json(book))
+        return 0
+
+    def _get(self, controller: BookController, args: argparse.Namespace) -> int:
+        self._write(book_to_json(controller.get_book_by_id(args.book_id)))
+        return 0
+
+    def _search(self, controller: BookController, args: argparse.Namespace) -> int:
+        for book in controller.search_books(' '.join(args.terms)):
+            self._write(book_to_json(book))
+        return 0
+
+    def _import(self, controller: BookController, args: argparse.Namespace) -> int:
+        # Binary stdin where there is one, so piped gzip data can be detected
+        source = args.file
+        if source == '-':
+            stdin = self._stdin or sys.stdin
+            source = getattr(stdin, 'buffer', stdin)
+        summary = controller.import_books(source, args.format, args.chunk_size)
+        for failure in summary.failures:
+            print(f"Row {failure.index + 1}: {failure.error}", file=sys.stderr)
+        self._write(f"Imported {summary.imported} of {summary.rows} books")
+        return 0 if summary.imported == summary.rows else 1
+
+    def _export(self, controller: BookController, args: argparse.Namespace) -> int:
+        target = args.output
+        if not target:
+            stdout = self._stdout or sys.stdout
+            stdout.flush()
+            target = getattr(stdout, 'buffer', stdout)
+        controller.export_books(target, args.format, args.gzip, args.chunk_size)
+        return 0
+
+    def _serve(self, args: argparse.Namespace) -> int:
+        from src.Presentation.Http.BookHttpServer import BookHttpServer
+        metrics = None
+        if args.metrics:
+            from src.Application.Instrumentation.Metrics import MetricsRegistry
+            metrics = MetricsRegistry()
+        shared = args.processes > 1
+        try:
+            server = BookHttpServer(
+                lambda: self._controller_factory(metrics=metrics, thread_safe=True, shared=shared),
+                host=args.host,
+                port=args.port,
+                workers=args.workers,
+                processes=args.processes,
+                max_in_flight=args.max_in_flight,
+                metrics=metrics,
+                log_requests=args.log_requests
+            )
+        except (OSError, ValueError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        host, port = server.address
+        print(f"Serving on http://{host}:{port} ({args.processes} x {args.workers} workers)", file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        return 0
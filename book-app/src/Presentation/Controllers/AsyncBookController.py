@@ -0,0 +1,60 @@
+from typing import Dict, Any, List, AsyncIterator, Optional
+from src.Application.Events.BookChangeFeed import BookChangeStream
+from src.Application.Services.AsyncBookServices import AsyncBookServices
+from src.Domain.Entities.Book import Book
+from src.Domain.Entities.BulkResult import BulkResult
+
+class AsyncBookController:
+    def __init__(self, service: AsyncBookServices):
+        self.service = service
+
+    async def get_all_books(self) -> List[Book]:
+        return await self.service.browse()
+
+    async def get_books_page(self, offset: int = 0, limit: Optional[int] = None, after_id: Optional[int] = None) -> List[Book]:
+        return await self.service.browse(offset, limit, after_id)
+
+    def iter_books(self, offset: int = 0, limit: Optional[int] = None, after_id: Optional[int] = None) -> AsyncIterator[Book]:
+        return self.service.iter_books(offset, limit, after_id)
+
+    async def get_book_by_id(self, book_id: int) -> Book:
+        return await self.service.read(book_id)
+
+    async def search_books(self, query: str) -> List[Book]:
+        return await self.service.search(query)
+
+    async def get_books_by_author(self, author: str) -> List[Book]:
+        return await self.service.find_by_author(author)
+
+    async def get_books_by_year_range(self, start_year: int, end_year: int) -> List[Book]:
+        return await self.service.find_by_year_range(start_year, end_year)
+
+    async def create_book(self, book_data: Dict[str, Any]) -> int:
+        return await self.service.add(book_data)
+
+    async def update_book(self, book_id: int, book_data: Dict[str, Any]) -> bool:
+        return await self.service.edit(book_id, book_data)
+
+    async def delete_book(self, book_id: int) -> bool:
+        return await self.service.delete(book_id)
+
+    async def increment_book_quantity(self, book_id: int, amount: int = 1) -> int:
+        return await self.service.increment_quantity(book_id, amount)
+
+    async def decrement_book_quantity(self, book_id: int, amount: int = 1) -> int:
+        return await self.service.decrement_quantity(book_id, amount)
+
+    async def reserve_book(self, book_id: int, amount: int = 1) -> bool:
+        return await self.service.reserve(book_id, amount)
+
+    async def create_books(self, books_data: List[Dict[str, Any]]) -> List[BulkResult]:
+        return await self.service.add_many(books_data)
+
+    async def update_books(self, books_data: List[Dict[str, Any]]) -> List[BulkResult]:
+        return await self.service.edit_many(books_data)
+
+    async def delete_books(self, book_ids: List[int]) -> List[BulkResult]:
+        return await self.service.delete_many(book_ids)
+
+    def stream_changes(self, since: Optional[int] = None, max_pending: int = 1000) -> BookChangeStream:
+        return self.service.stream_changes(since, max_pending)
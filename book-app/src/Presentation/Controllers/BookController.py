@@ -1,6 +1,11 @@
-from typing import Dict, Any, List
-from src.Application.Services.BookServices import BookServices
+from typing import IO, Dict, Any, Callable, List, Iterator, Optional, Union
+from src.Application.Services.BookServices import TRANSFER_CHUNK_SIZE, BookServices
+from src.Application.Events.BookChangeFeed import BookChangeStream, BookSubscription
 from src.Domain.Entities.Book import Book
+from src.Domain.Entities.BookChange import BookChange
+from src.Domain.Entities.BookSnapshot import BookSnapshot
+from src.Domain.Entities.BulkResult import BulkResult
+from src.Domain.Entities.ImportSummary import ImportSummary
 
 class BookController:
     def __init__(self, service: BookServices):
@@ -9,9 +14,27 @@ class BookController:
     def get_all_books(self) -> List[Book]:
         return self.service.browse()
 
+    def get_books_page(self, offset: int = 0, limit: Optional[int] = None, after_id: Optional[int] = None) -> List[Book]:
+        return self.service.browse(offset, limit, after_id)
+
+    def iter_books(self, offset: int = 0, limit: Optional[int] = None, after_id: Optional[int] = None) -> Iterator[Book]:
+        return self.service.iter_books(offset, limit, after_id)
+
+    def get_snapshot(self) -> BookSnapshot:
+        return self.service.snapshot()
+
     def get_book_by_id(self, book_id: int) -> Book:
         return self.service.read(book_id)
 
+    def search_books(self, query: str) -> List[Book]:
+        return self.service.search(query)
+
+    def get_books_by_author(self, author: str) -> List[Book]:
+        return self.service.find_by_author(author)
+
+    def get_books_by_year_range(self, start_year: int, end_year: int) -> List[Book]:
+        return self.service.find_by_year_range(start_year, end_year)
+
     def create_book(self, book_data: Dict[str, Any]) -> int:
         return self.service.add(book_data)
 
@@ -20,3 +43,42 @@ class BookController:
 
     def delete_book(self, book_id: int) -> bool:
         return self.service.delete(book_id)
+
+    def increment_book_quantity(self, book_id: int, amount: int = 1) -> int:
+        return self.service.increment_quantity(book_id, amount)
+
+    def decrement_book_quantity(self, book_id: int, amount: int = 1) -> int:
+        return self.service.decrement_quantity(book_id, amount)
+
+    def reserve_book(self, book_id: int, amount: int = 1) -> bool:
+        return self.service.reserve(book_id, amount)
+
+    def create_books(self, books_data: List[Dict[str, Any]]) -> List[BulkResult]:
+        return self.service.add_many(books_data)
+
+    def update_books(self, books_data: List[Dict[str, Any]]) -> List[BulkResult]:
+        return self.service.edit_many(books_data)
+
+    def delete_books(self, book_ids: List[int]) -> List[BulkResult]:
+        return self.service.delete_many(book_ids)
+
+    def export_books(
+        self,
+        target: Union[str, IO],
+        format_name: Optional[str] = None,
+        compress: Optional[bool] = None,
+        chunk_size: int = TRANSFER_CHUNK_SIZE
+    ) -> int:
+        return self.service.export_books(target, format_name, compress, chunk_size)
+
+    def import_books(self, source: Union[str, IO], format_name: Optional[str] = None, chunk_size: int = TRANSFER_CHUNK_SIZE) -> ImportSummary:
+        return self.service.import_books(source, format_name, chunk_size)
+
+    def subscribe_to_changes(self, callback: Callable[[BookChange], None], since: Optional[int] = None) -> BookSubscription:
+        return self.service.subscribe(callback, since)
+
+    def get_changes_since(self, sequence: int) -> List[BookChange]:
+        return self.service.changes_since(sequence)
+
+    def stream_changes(self, since: Optional[int] = None, max_pending: int = 1000) -> BookChangeStream:
+        return self.service.stream_changes(since, max_pending)
@@ -0,0 +1,435 @@
+import json
+import os
+import re
+import selectors
+import signal
+import socket
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+from src.Domain.Entities.BookNotFoundError import BookNotFoundError
+from src.Presentation.Controllers.BookController import BookController
+from src.Presentation.Serialization.BookJson import book_to_dict
+
+_MAX_BODY_BYTES = 1 << 20
+_JSON = 'application/json'
+_BODY_METHODS = ('POST', 'PUT', 'PATCH')
+
+# (method, path pattern, handler method name); groups in the pattern become arguments
+_ROUTES = [
+    ('GET', re.compile(r'/books'), '_browse'),
+    ('POST', re.compile(r'/books'), '_create'),
+    ('GET', re.compile(r'/books/search'), '_search'),
+    ('GET', re.compile(r'/books/(\d+)'), '_read'),
+    ('PATCH', re.compile(r'/books/(\d+)'), '_update'),
+    ('PUT', re.compile(r'/books/(\d+)'), '_update'),
+    ('DELETE', re.compile(r'/books/(\d+)'), '_delete'),
+    ('GET', re.compile(r'/health'), '_health'),
+    ('GET', re.compile(r'/metrics'), '_metrics'),
+]
+
+class HttpError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+class BookRequestHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 keeps connections open between requests; every response carries Content-Length
+    protocol_version = 'HTTP/1.1'
+    server_version = 'BookHttp/1.0'
+    # Headers and body go out as separate small writes; without TCP_NODELAY every response on a
+    # kept-alive connection waits for the client's delayed ACK
+    disable_nagle_algorithm = True
+
+    def setup(self) -> None:
+        # Bounds how long a worker waits for the rest of a request that has started to arrive
+        self.timeout = self.server.keep_alive_timeout
+        super().setup()
+
+    def handle(self) -> None:
+        # The server calls handle_one_request for each request as the connection becomes readable
+        pass
+
+    def finish(self) -> None:
+        # Connections outlive a single handle(); the server calls close() when one is done
+        pass
+
+    def close(self) -> None:
+        super().finish()
+
+    def has_buffered_request(self) -> bool:
+        # Peeks without blocking: a buffered next request never shows up in the selector
+        self.connection.settimeout(0)
+        try:
+            return bool(self.rfile.peek(1))
+        except OSError:
+            return False
+        finally:
+            self.connection.settimeout(self.timeout)
+
+    def do_GET(self) -> None:
+        self._dispatch('GET')
+
+    def do_POST(self) -> None:
+        self._dispatch('POST')
+
+    def do_PUT(self) -> None:
+        self._dispatch('PUT')
+
+    def do_PATCH(self) -> None:
+        self._dispatch('PATCH')
+
+    def do_DELETE(self) -> None:
+        self._dispatch('DELETE')
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if self.server.log_requests:
+            super().log_message(format, *args)
+
+    def _dispatch(self, method: str) -> None:
+        started = time.perf_counter()
+        url = urlsplit(self.path)
+        route = 'unmatched'
+        headers: Dict[str, str] = {}
+        try:
+            # The body is always read, so the next request on this connection starts in the right place
+            body = self._read_body()
+            handler, arguments, route = self._route(method, url.path)
+            if not self.server.limiter.acquire(timeout=self.server.queue_timeout):
+                headers['Retry-After'] = '1'
+                raise HttpError(503, "Server is busy")
+            try:
+                status, payload = handler(*arguments, query=parse_qs(url.query), body=body)
+            finally:
+                self.server.limiter.release()
+        except HttpError as e:
+            status, payload = e.status, {'error': str(e)}
+            if e.status == 405:
+                headers['Allow'] = ', '.join(m for m, pattern, _ in _ROUTES if pattern.fullmatch(url.path))
+        except BookNotFoundError as e:
+            status, payload = 404, {'error': str(e)}
+        except ValueError as e:
+            status, payload = 400, {'error': str(e)}
+        except Exception:
+            self.server.handle_error(self.request, self.client_address)
+            status, payload = 500, {'error': "Internal server error"}
+        self._respond(status, payload, headers)
+        if self.server.metrics is not None:
+            self.server.metrics.observe(f"http.{method} {route}", time.perf_counter() - started, status >= 500)
+
+    def _route(self, method: str, path: str) -> Tuple[Callable[..., Tuple[int, Any]], Tuple[str, ...], str]:
+        path_matched = False
+        for route_method, pattern, name in _ROUTES:
+            match = pattern.fullmatch(path)
+            if not match:
+                continue
+            path_matched = True
+            if route_method == method:
+                return getattr(self, name), match.groups(), pattern.pattern
+        if path_matched:
+            raise HttpError(405, f"Method {method} not allowed")
+        raise HttpError(404, f"No route for {path}")
+
+    def _read_body(self) -> Optional[bytes]:
+        # Without a usable length the end of the body is unknown, so is where the next request
+        # starts: the connection is closed after the error response
+        header = self.headers.get('Content-Length')
+        if header is None:
+            if self.command in _BODY_METHODS or 'Transfer-Encoding' in self.headers:
+                self.close_connection = True
+                raise HttpError(400, "Content-Length is required")
+            return None
+        header = header.strip()
+        if not (header.isascii() and header.isdigit()):
+            self.close_connection = True
+            raise HttpError(400, "Content-Length must be a non-negative integer")
+        length = int(header)
+        if length > _MAX_BODY_BYTES:
+            self.close_connection = True
+            raise HttpError(413, "Request body too large")
+        return self.rfile.read(length) if length else None
+
+    def _respond(self, status: int, payload: Any, headers: Dict[str, str]) -> None:
+        if isinstance(payload, str):
+            data, content_type = payload.encode('utf-8'), 'text/plain; version=0.0.4'
+        elif payload is None:
+            data, content_type = b'', None
+        else:
+            data, content_type = json.dumps(payload).encode('utf-8'), _JSON
+        self.send_response(status)
+        if content_type:
+            self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    @staticmethod
+    def _json_object(body: Optional[bytes]) -> Dict[str, Any]:
+        try:
+            data = json.loads(body or b'')
+        except ValueError:
+            raise HttpError(400, "Body must be JSON") from None
+        if not isinstance(data, dict):
+            raise HttpError(400, "Body must be a JSON object")
+        return data
+
+    @staticmethod
+    def _int_param(query: Dict[str, List[str]], name: str, default: Optional[int] = None) -> Optional[int]:
+        values = query.get(name)
+        if not values:
+            return default
+        try:
+            return int(values[0])
+        except ValueError:
+            raise HttpError(400, f"Query parameter {name} must be an integer") from None
+
+    @property
+    def _controller(self) -> BookController:
+        return self.server.controller
+
+    def _browse(self, query: Dict[str, List[str]], body: Optional[bytes]) -> Tuple[int, Any]:
+        books = self._controller.get_books_page(
+            self._int_param(query, 'offset', 0), self._int_param(query, 'limit'), self._int_param(query, 'after_id')
+        )
+        return 200, [book_to_dict(book) for book in books]
+
+    def _search(self, query: Dict[str, List[str]], body: Optional[bytes]) -> Tuple[int, Any]:
+        if not query.get('q'):
+            raise HttpError(400, "Query parameter q is required")
+        return 200, [book_to_dict(book) for book in self._controller.search_books(query['q'][0])]
+
+    def _read(self, book_id: str, query: Dict[str, List[str]], body: Optional[bytes]) -> Tuple[int, Any]:
+        return 200, book_to_dict(self._controller.get_book_by_id(int(book_id)))
+
+    def _create(self, query: Dict[str, List[str]], body: Optional[bytes]) -> Tuple[int, Any]:
+        book_id = self._controller.create_book(self._json_object(body))
+        return 201, {'id': book_id}
+
+    def _update(self, book_id: str, query: Dict[str, List[str]], body: Optional[bytes]) -> Tuple[int, Any]:
+        self._controller.update_book(int(book_id), self._json_object(body))
+        return 200, book_to_dict(self._controller.get_book_by_id(int(book_id)))
+
+    def _delete(self, book_id: str, query: Dict[str, List[str]], body: Optional[bytes]) -> Tuple[int, Any]:
+        self._controller.delete_book(int(book_id))
+        return 204, None
+
+    def _health(self, query: Dict[str, List[str]], body: Optional[bytes]) -> Tuple[int, Any]:
+        return 200, {'status': 'ok', 'pid': os.getpid()}
+
+    def _metrics(self, query: Dict[str, List[str]], body: Optional[bytes]) -> Tuple[int, Any]:
+        if self.server.metrics is None:
+            raise HttpError(404, "Metrics are not enabled")
+        return 200, self.server.metrics.export_prometheus()
+
+# Workers serve one request at a time rather than one connection. Between requests a kept-alive
+# connection waits in a selector on its own thread and goes back to the pool once it is readable,
+# so idle connections never hold a worker and open connections are not capped by the pool size.
+class _PooledHTTPServer(HTTPServer):
+    def __init__(self, address: Tuple[str, int]):
+        super().__init__(address, BookRequestHandler)
+        # Forked servers all wake for each new connection; only one wins the accept, and a
+        # blocking accept would stall the others' serving loops. socketserver skips a failed accept.
+        self.socket.setblocking(False)
+        self.controller: Optional[BookController] = None
+        self.limiter = threading.BoundedSemaphore(1)
+        self.queue_timeout = 1.0
+        self.keep_alive_timeout = 5.0
+        self.log_requests = False
+        self.metrics: Any = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._wakeup_reader: Optional[socket.socket] = None
+        self._wakeup_writer: Optional[socket.socket] = None
+        # Handlers queued by workers for the selector thread, which alone touches the selector
+        self._parked: Deque[BookRequestHandler] = deque()
+        self._idle_since: Dict[BookRequestHandler, float] = {}
+        self._idle_thread: Optional[threading.Thread] = None
+        self._closing = False
+
+    def start_workers(self, workers: int, controller: BookController, max_in_flight: int) -> None:
+        # Called in the process that serves, i.e. after any fork: forked children must not share
+        # one epoll instance
+        self.controller = controller
+        self.limiter = threading.BoundedSemaphore(max_in_flight)
+        self._executor = ThreadPoolExecutor(workers, thread_name_prefix='book-http')
+        self._selector = selectors.DefaultSelector()
+        self._wakeup_reader, self._wakeup_writer = socket.socketpair()
+        self._selector.register(self._wakeup_reader, selectors.EVENT_READ)
+        self._idle_thread = threading.Thread(target=self._watch_idle, name='book-http-idle', daemon=True)
+        self._idle_thread.start()
+
+    def process_request(self, request: socket.socket, client_address: Any) -> None:
+        # The handler only wraps the socket here; its requests run on the workers
+        try:
+            handler = self.RequestHandlerClass(request, client_address, self)
+        except Exception:
+            self.handle_error(request, client_address)
+            self.shutdown_request(request)
+            return
+        self._executor.submit(self._serve_request, handler)
+
+    def _serve_request(self, handler: 'BookRequestHandler') -> None:
+        try:
+            handler.handle_one_request()
+        except Exception:
+            self.handle_error(handler.request, handler.client_address)
+            handler.close_connection = True
+        if handler.close_connection or self._closing:
+            self._close(handler)
+        elif handler.has_buffered_request():
+            # The client pipelined its next request, which is already read into the buffer
+            self._executor.submit(self._serve_request, handler)
+        else:
+            self._parked.append(handler)
+            self._wakeup_writer.send(b'\0')
+
+    def _watch_idle(self) -> None:
+        while not self._closing:
+            for key, _ in self._selector.select(timeout=min(1.0, self.keep_alive_timeout)):
+                if key.fileobj is self._wakeup_reader:
+                    self._wakeup_reader.recv(4096)
+                    continue
+                self._selector.unregister(key.fileobj)
+                del self._idle_since[key.data]
+                self._executor.submit(self._serve_request, key.data)
+            now = time.monotonic()
+            while self._parked:
+                handler = self._parked.popleft()
+                self._selector.register(handler.connection, selectors.EVENT_READ, handler)
+                self._idle_since[handler] = now
+            for handler, since in list(self._idle_since.items()):
+                if now - since > self.keep_alive_timeout:
+                    self._unpark(handler)
+        for handler in list(self._idle_since):
+            self._unpark(handler)
+        while self._parked:
+            self._close(self._parked.popleft())
+
+    def _unpark(self, handler: 'BookRequestHandler') -> None:
+        self._selector.unregister(handler.connection)
+        del self._idle_since[handler]
+        self._close(handler)
+
+    def _close(self, handler: 'BookRequestHandler') -> None:
+        try:
+            handler.close()
+        finally:
+            self.shutdown_request(handler.request)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self._closing = True
+        if self._idle_thread is None:
+            return
+        self._wakeup_writer.send(b'\0')
+        self._idle_thread.join()
+        self._executor.shutdown(wait=True)
+        # A worker may have parked its connection after the idle thread stopped
+        while self._parked:
+            self._close(self._parked.popleft())
+        self._selector.close()
+        self._wakeup_reader.close()
+        self._wakeup_writer.close()
+
+class BookHttpServer:
+    def __init__(
+        self,
+        controller_factory: Callable[[], BookController],
+        host: str = '127.0.0.1',
+        port: int = 8000,
+        workers: int = 8,
+        processes: int = 1,
+        max_in_flight: int = 64,
+        queue_timeout: float = 1.0,
+        keep_alive_timeout: float = 5.0,
+        metrics: Any = None,
+        log_requests: bool = False
+    ):
+        # workers: threads per process. processes > 1 pre-forks that many servers sharing the
+        # listening socket; each builds its own controller, so the repository must be opened in
+        # shared mode. max_in_flight caps requests inside the controller per process; a request
+        # that waits longer than queue_timeout for a slot gets 503.
+        if workers < 1 or processes < 1 or max_in_flight < 1:
+            raise ValueError("Workers, processes and max_in_flight must be positive")
+        if processes > 1 and not hasattr(os, 'fork'):
+            raise ValueError("Process workers need os.fork")
+        self.controller_factory = controller_factory
+        self.workers = workers
+        self.processes = processes
+        self.max_in_flight = max_in_flight
+        self._server = _PooledHTTPServer((host, port))
+        self._server.queue_timeout = queue_timeout
+        self._server.keep_alive_timeout = keep_alive_timeout
+        self._server.metrics = metrics
+        self._server.log_requests = log_requests
+        self._children: List[int] = []
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        return self._server.server_address[:2]
+
+    def serve_forever(self) -> None:
+        if self.processes == 1:
+            self._serve()
+            return
+        if threading.current_thread() is threading.main_thread():
+            # Stopping the parent, e.g. with kill, stops the children too
+            signal.signal(signal.SIGTERM, lambda *_: self._signal_children())
+        try:
+            for _ in range(self.processes):
+                pid = os.fork()
+                if pid == 0:
+                    self._serve_child()
+                self._children.append(pid)
+            self._reap()
+        finally:
+            # Only does anything when the parent stops early, e.g. on Ctrl-C
+            self._signal_children()
+            self._reap()
+            self._server.server_close()
+
+    def shutdown(self) -> None:
+        # Safe to call from another thread; in process mode it stops every child
+        if self.processes == 1:
+            self._server.shutdown()
+        else:
+            self._signal_children()
+
+    def _serve(self) -> None:
+        self._server.start_workers(self.workers, self.controller_factory(), self.max_in_flight)
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+
+    def _serve_child(self) -> None:
+        # shutdown() blocks until the serving loop stops, so it cannot run on the loop's own thread
+        signal.signal(signal.SIGTERM, lambda *_: threading.Thread(target=self._server.shutdown).start())
+        status = 0
+        try:
+            self._serve()
+        except BaseException:
+            status = 1
+        finally:
+            os._exit(status)
+
+    def _signal_children(self) -> None:
+        for pid in self._children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    def _reap(self) -> None:
+        while self._children:
+            try:
+                os.waitpid(self._children[0], 0)
+            except ChildProcessError:
+                pass
+            self._children.pop(0)
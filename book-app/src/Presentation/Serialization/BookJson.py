@@ -0,0 +1,7 @@
+import json
+from src.Domain.Entities.Book import Book
+# Wire format shared by the command line and the HTTP API: the Books.json record layout
+from src.Infrastructure.Persistence.BookSnapshotCodecs import book_to_dict
+
+def book_to_json(book: Book) -> str:
+    return json.dumps(book_to_dict(book))
@@ -0,0 +1,67 @@
+import asyncio
+import threading
+import pytest
+from src.Application.Interfaces.AsyncBookRepositoryAdapter import AsyncBookRepositoryAdapter
+from src.Application.Interfaces.BookInterfaceImplementation import BookInterfaceImplementation
+
+def _book(n):
+    return {"title": f"Book {n}", "author": "Author", "published_year": 2020, "quantity": n}
+
+class TestAsyncBookRepositoryAdapter:
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        """Setup test environment before each test"""
+        self.file_path = str(tmp_path / "books.json")
+        self.repository = BookInterfaceImplementation(self.file_path, thread_safe=True)
+        self.adapter = AsyncBookRepositoryAdapter(self.repository)
+
+    def test_rejects_repository_without_locking(self):
+        """Should refuse a JSON repository that was not created thread-safe"""
+        with pytest.raises(ValueError, match="thread_safe=True"):
+            AsyncBookRepositoryAdapter(BookInterfaceImplementation(self.file_path))
+
+    def test_crud_round_trip(self):
+        """Should add, read, edit, search and delete through the event loop"""
+        async def scenario():
+            book_id = await self.adapter.add(_book(1))
+            await self.adapter.edit(book_id, {"title": "Renamed"})
+            found = await self.adapter.search("renamed")
+            book = await self.adapter.read(book_id)
+            deleted = await self.adapter.delete(book_id)
+            return book, found, deleted, await self.adapter.browse()
+        book, found, deleted, remaining = asyncio.run(scenario())
+        assert book.title == "Renamed"
+        assert [b.id for b in found] == [book.id]
+        assert deleted
+        assert remaining == []
+
+    def test_concurrent_adds_get_unique_ids(self):
+        """Should give every concurrently added book its own ID and persist them all"""
+        async def scenario():
+            return await asyncio.gather(*(self.adapter.add(_book(n)) for n in range(50)))
+        ids = asyncio.run(scenario())
+        assert sorted(ids) == list(range(50))
+        assert len(BookInterfaceImplementation(self.file_path).books) == 50
+
+    def test_calls_run_off_the_event_loop_thread(self, monkeypatch):
+        """Should call the repository on a worker thread"""
+        threads = []
+        original_read = self.repository.read
+        def read(book_id):
+            threads.append(threading.get_ident())
+            return original_read(book_id)
+        monkeypatch.setattr(self.repository, "read", read)
+        async def scenario():
+            await self.adapter.read(0)
+            return threading.get_ident()
+        loop_thread = asyncio.run(scenario())
+        assert threads and threads[0] != loop_thread
+
+    def test_iter_books_streams_pages(self):
+        """Should stream books in order, honouring offset, limit and after_id"""
+        self.repository.add_many([_book(n) for n in range(1200)])
+        async def collect(**kwargs):
+            return [book.id async for book in self.adapter.iter_books(**kwargs)]
+        assert asyncio.run(collect()) == list(range(1200))
+        assert asyncio.run(collect(offset=10, limit=600)) == list(range(10, 610))
+        assert asyncio.run(collect(after_id=1195)) == [1196, 1197, 1198, 1199]
@@ -0,0 +1,91 @@
+import asyncio
+import pytest
+from src.Application.Services.AsyncBookServices import AsyncBookServices
+from src.Application.Interfaces.AsyncBookRepositoryAdapter import AsyncBookRepositoryAdapter
+from src.Application.Interfaces.BookInterfaceImplementation import BookInterfaceImplementation
+
+class TestAsyncBookServices:
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        """Setup test environment before each test"""
+        repository = BookInterfaceImplementation(str(tmp_path / "test_books.json"), thread_safe=True)
+        self.book_services = AsyncBookServices(AsyncBookRepositoryAdapter(repository))
+        self.book_data = {"title": "Test Book", "author": "Test Author", "published_year": 2023, "quantity": 5}
+
+    def test_add_and_read(self):
+        """Test adding a book and reading it back"""
+        async def scenario():
+            book_id = await self.book_services.add(self.book_data)
+            return await self.book_services.read(book_id)
+        book = asyncio.run(scenario())
+        assert book.title == "Test Book"
+
+    def test_add_invalid_book(self):
+        """Test that validation errors are raised before the repository is called"""
+        with pytest.raises(ValueError, match="Title must be a non-empty string"):
+            asyncio.run(self.book_services.add({**self.book_data, "title": ""}))
+        assert asyncio.run(self.book_services.browse()) == []
+
+    def test_read_missing_book(self):
+        """Test reading a book that does not exist"""
+        with pytest.raises(ValueError, match="Book with ID 999 not found"):
+            asyncio.run(self.book_services.read(999))
+
+    def test_edit_and_delete_missing_book(self):
+        """Test editing and deleting a book that does not exist"""
+        with pytest.raises(ValueError, match="Book with ID 999 not found"):
+            asyncio.run(self.book_services.edit(999, {"quantity": 1}))
+        with pytest.raises(ValueError, match="Book with ID 999 not found"):
+            asyncio.run(self.book_services.delete(999))
+
+    def test_bulk_operations(self):
+        """Test bulk add and edit with mixed valid and invalid rows"""
+        async def scenario():
+            added = await self.book_services.add_many([self.book_data, {**self.book_data, "quantity": -1}])
+            edited = await self.book_services.edit_many([{"id": 0, "quantity": 9}, {"id": "0", "quantity": 1}])
+            return added, edited, await self.book_services.read(0)
+        added, edited, book = asyncio.run(scenario())
+        assert [result.success for result in added] == [True, False]
+        assert [result.success for result in edited] == [True, False]
+        assert edited[1].error == "Id must be an integer"
+        assert book.quantity == 9
+
+    def test_concurrent_reads_during_writes(self):
+        """Test that reads and writes interleave on the event loop"""
+        async def scenario():
+            book_id = await self.book_services.add(self.book_data)
+            writes = [self.book_services.edit(book_id, {"quantity": n}) for n in range(20)]
+            reads = [self.book_services.read(book_id) for _ in range(20)]
+            await asyncio.gather(*writes, *reads)
+            return await self.book_services.search("test")
+        found = asyncio.run(scenario())
+        assert len(found) == 1
+
+    def test_concurrent_reservations(self):
+        """Test that concurrent reservations never oversell"""
+        async def scenario():
+            book_id = await self.book_services.add(self.book_data)
+            reserved = await asyncio.gather(*(self.book_services.reserve(book_id) for _ in range(8)))
+            return reserved, await self.book_services.read(book_id)
+        reserved, book = asyncio.run(scenario())
+        assert reserved.count(True) == 5
+        assert book.quantity == 0
+
+    def test_stream_changes_from_worker_thread_writes(self):
+        """Test streaming the change feed while writes run on executor threads"""
+        async def scenario():
+            async with self.book_services.stream_changes() as changes:
+                book_id = await self.book_services.add(self.book_data)
+                await self.book_services.delete(book_id)
+                return [(change.op, change.book_id) async for change in _take(changes, 2)]
+        assert asyncio.run(scenario()) == [("add", 0), ("delete", 0)]
+
+    def test_stream_changes_needs_a_feed(self):
+        """Test that a repository without a change feed is reported"""
+        services = AsyncBookServices(object())
+        with pytest.raises(ValueError, match="does not publish changes"):
+            services.stream_changes()
+
+async def _take(changes, count):
+    for _ in range(count):
+        yield await changes.__anext__()
@@ -0,0 +1,39 @@
+import pytest
+from src.Application.Indexes.BookAttributeIndex import BookAttributeIndex, normalize_author
+from src.Domain.Entities.Book import Book
+
+class TestBookAttributeIndex:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup test environment before each test"""
+        self.index = BookAttributeIndex([
+            Book(title="Dune", author="Frank Herbert", published_year=1965, quantity=1, id=0),
+            Book(title="Emma", author="Jane Austen", published_year=1815, quantity=1, id=1),
+            Book(title="Dune Messiah", author="Frank  HERBERT", published_year=1969, quantity=1, id=2),
+            Book(title="Persuasion", author="Jane Austen", published_year=1817, quantity=1, id=3)
+        ])
+
+    def test_normalize_author(self):
+        """Should fold case and collapse whitespace"""
+        assert normalize_author("  Frank   HERBERT ") == "frank herbert"
+
+    def test_find_by_author(self):
+        """Should match normalized author names and return ids in order"""
+        assert self.index.find_by_author("frank herbert") == [0, 2]
+        assert self.index.find_by_author("Nobody") == []
+
+    def test_find_by_year_range(self):
+        """Should return books in the inclusive range ordered by year"""
+        assert self.index.find_by_year_range(1815, 1817) == [1, 3]
+        assert self.index.find_by_year_range(1900, 2000) == [0, 2]
+        assert self.index.find_by_year_range(2000, 2020) == []
+
+    def test_update_and_remove(self):
+        """Should move edited books and drop removed ones"""
+        self.index.update(Book(title="Dune", author="Brian Herbert", published_year=1999, quantity=1, id=0))
+        self.index.remove(3)
+        self.index.remove(42)
+        assert self.index.find_by_author("Frank Herbert") == [2]
+        assert self.index.find_by_author("Brian Herbert") == [0]
+        assert self.index.find_by_author("Jane Austen") == [1]
+        assert self.index.find_by_year_range(1990, 2000) == [0]
@@ -0,0 +1,111 @@
+import asyncio
+import threading
+import pytest
+from src.Application.Events.BookChangeFeed import BookChangeFeed
+from src.Domain.Entities.Book import Book
+from src.Domain.Entities.ChangeFeedGapError import ChangeFeedGapError
+
+BOOK = Book(id=0, title="Dune", author="Frank Herbert", published_year=1965, quantity=2)
+
+class TestBookChangeFeed:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup a feed that keeps the last three changes"""
+        self.feed = BookChangeFeed(retention=3)
+
+    def test_sequences_are_ordered_without_gaps(self):
+        """Should number changes from 1 and deliver them to callbacks in order"""
+        received = []
+        self.feed.subscribe(received.append)
+        self.feed.publish("add", 0, BOOK)
+        self.feed.publish("edit", 0, BOOK, {"quantity": 2})
+        self.feed.publish("delete", 0)
+        assert [(change.sequence, change.op) for change in received] == [(1, "add"), (2, "edit"), (3, "delete")]
+        assert self.feed.sequence == 3
+
+    def test_resume_replays_retained_changes_first(self):
+        """Should deliver retained changes after since, then live ones"""
+        for book_id in range(4):
+            self.feed.publish("delete", book_id)
+        received = []
+        subscription = self.feed.subscribe(received.append, since=2)
+        self.feed.publish("delete", 4)
+        assert [change.sequence for change in received] == [3, 4, 5]
+        assert subscription.sequence == 5
+        assert self.feed.changes_since(5) == []
+
+    def test_resume_past_retention_raises_gap(self):
+        """Should refuse to resume from a sequence whose successors were dropped"""
+        for book_id in range(5):
+            self.feed.publish("delete", book_id)
+        with pytest.raises(ChangeFeedGapError) as exc_info:
+            self.feed.subscribe(lambda change: None, since=1)
+        assert exc_info.value.sequence == 1
+        assert [change.sequence for change in self.feed.changes_since(2)] == [3, 4, 5]
+
+    def test_resume_ahead_of_feed_raises_gap(self):
+        """Should refuse a cursor past the latest sequence, such as one from an earlier run"""
+        self.feed.publish("delete", 0)
+        with pytest.raises(ChangeFeedGapError) as exc_info:
+            self.feed.changes_since(5)
+        assert exc_info.value.sequence == 5
+        assert self.feed.changes_since(1) == []
+
+    def test_failing_subscriber_is_dropped(self):
+        """Should unsubscribe a callback that raises and keep delivering to the others"""
+        received = []
+
+        def fail(change):
+            raise RuntimeError("consumer down")
+
+        failing = self.feed.subscribe(fail)
+        self.feed.subscribe(received.append)
+        self.feed.publish("delete", 0)
+        self.feed.publish("delete", 1)
+        assert not failing.active
+        assert failing.sequence is None
+        assert [change.sequence for change in received] == [1, 2]
+
+    def test_closed_subscription_stops_receiving(self):
+        """Should stop delivering once the subscription is closed"""
+        received = []
+        with self.feed.subscribe(received.append):
+            self.feed.publish("delete", 0)
+        self.feed.publish("delete", 1)
+        assert [change.sequence for change in received] == [1]
+
+    def test_stream_receives_changes_from_other_threads(self):
+        """Should yield changes published on another thread, resuming after since"""
+        self.feed.publish("delete", 0)
+
+        async def consume():
+            received = []
+            changes = self.feed.stream(since=0)
+            received.append(await changes.__anext__())
+            writer = threading.Thread(target=lambda: [self.feed.publish("delete", book_id) for book_id in (1, 2)])
+            writer.start()
+            received.append(await changes.__anext__())
+            received.append(await changes.__anext__())
+            writer.join()
+            await changes.aclose()
+            return [change.sequence for change in received]
+
+        assert asyncio.run(consume()) == [1, 2, 3]
+        assert self.feed._subscriptions == []
+
+    def test_stream_overflow_raises_gap_with_resume_point(self):
+        """Should end a stream that falls more than max_pending behind, naming where to resume"""
+
+        async def consume():
+            changes = self.feed.stream(max_pending=1)
+            self.feed.publish("delete", 0)
+            first = await changes.__anext__()
+            for book_id in range(1, 4):
+                self.feed.publish("delete", book_id)
+            await asyncio.sleep(0)
+            assert (await changes.__anext__()).sequence == 2
+            with pytest.raises(ChangeFeedGapError) as exc_info:
+                await changes.__anext__()
+            return first.sequence, exc_info.value.sequence
+
+        assert asyncio.run(consume()) == (1, 2)
@@ -1,9 +1,17 @@
+import multiprocessing
 import pytest
+import threading
 import sys
 import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
 from src.Application.Interfaces.BookInterfaceImplementation import BookInterfaceImplementation
 from src.Domain.Entities.Book import Book
+from src.Domain.Entities.InsufficientStockError import InsufficientStockError
+
+def _add_shared_books(file_path, worker):
+    repository = BookInterfaceImplementation(file_path, shared=True)
+    for n in range(20):
+        repository.add({"title": f"Book {worker}-{n}", "author": "Author", "published_year": 2020, "quantity": 1})
 
 class TestBookInterfaceImplementation:
     @pytest.fixture(autouse=True)
@@ -53,6 +61,38 @@ class TestBookInterfaceImplementation:
         assert len(result) == 3
         assert [book.title for book in result] == ["Book 1", "Book 2", "Book 3"]
 
+    def test_browse_offset_limit(self):
+        """Should return a single page by offset and limit"""
+        # Arrange
+        for i in range(5):
+            self.book_interface.add({"title": f"Book {i}", "author": "Author", "published_year": 2020, "quantity": i})
+        # Act
+        result = self.book_interface.browse(offset=1, limit=2)
+        # Assert
+        assert [book.id for book in result] == [1, 2]
+
+    def test_browse_after_id(self):
+        """Should continue a keyset page after the given ID"""
+        # Arrange
+        for i in range(5):
+            self.book_interface.add({"title": f"Book {i}", "author": "Author", "published_year": 2020, "quantity": i})
+        self.book_interface.delete(2)
+        # Act
+        result = self.book_interface.browse(limit=2, after_id=1)
+        # Assert
+        assert [book.id for book in result] == [3, 4]
+
+    def test_iter_books_streams_lazily(self):
+        """Should yield books one at a time in insertion order"""
+        # Arrange
+        for i in range(3):
+            self.book_interface.add({"title": f"Book {i}", "author": "Author", "published_year": 2020, "quantity": i})
+        # Act
+        books = self.book_interface.iter_books()
+        # Assert
+        assert not isinstance(books, list)
+        assert [book.id for book in books] == [0, 1, 2]
+
     # Read Tests
     def test_read_existing_book(self):
         """Should return correct book when it exists"""
@@ -83,6 +123,21 @@ class TestBookInterfaceImplementation:
         # Assert
         assert result is None
 
+    # Search Tests
+    def test_search_tracks_mutations(self):
+        """Should keep search results in step with add, edit and delete"""
+        # Arrange
+        first_id = self.book_interface.add({"title": "Dune", "author": "Frank Herbert", "published_year": 1965, "quantity": 1})
+        second_id = self.book_interface.add({"title": "Emma", "author": "Jane Austen", "published_year": 1815, "quantity": 1})
+        assert [book.id for book in self.book_interface.search("dune")] == [first_id]
+        # Act
+        self.book_interface.edit(second_id, {"title": "Dune Messiah"})
+        third_id = self.book_interface.add({"title": "Dune Road", "author": "Someone", "published_year": 2001, "quantity": 1})
+        self.book_interface.delete(first_id)
+        # Assert
+        assert [book.id for book in self.book_interface.search("dun")] == [second_id, third_id]
+        assert self.book_interface.search("emma") == []
+
     # Add Tests
     def test_add_valid_book(self):
         """Should add book successfully with valid data"""
@@ -127,6 +182,18 @@ class TestBookInterfaceImplementation:
         assert result is True
         assert self.book_interface.read(book_id).title == "Updated"
 
+    def test_edit_keeps_insertion_order(self):
+        """Should keep an edited book at its original position"""
+        # Arrange
+        ids = [
+            self.book_interface.add({"title": f"Book {i}", "author": "Author", "published_year": 2020, "quantity": i})
+            for i in range(3)
+        ]
+        # Act
+        self.book_interface.edit(ids[0], {"title": "Edited"})
+        # Assert
+        assert [book.title for book in self.book_interface.browse()] == ["Edited", "Book 1", "Book 2"]
+
     def test_edit_nonexistent_book(self):
         """Should return False when editing nonexistent book"""
         # Act
@@ -144,6 +211,224 @@ class TestBookInterfaceImplementation:
             self.book_interface.edit(book_id, {"title": ""})
         assert self.book_interface.read(book_id).title == "Original"
 
+    def test_edit_without_changes_skips_write(self, monkeypatch):
+        """Should report success without rewriting the snapshot when nothing changes"""
+        # Arrange
+        book_id = self.book_interface.add({"title": "Original", "author": "Author", "published_year": 2023, "quantity": 5})
+        book = self.book_interface.read(book_id)
+        saves = []
+        monkeypatch.setattr(self.book_interface, "_write_snapshot", lambda books: saves.append(1))
+        # Act
+        results = [self.book_interface.edit(book_id, {}), self.book_interface.edit(book_id, {"title": "Original", "quantity": 5})]
+        # Assert
+        assert results == [True, True]
+        assert saves == []
+        assert self.book_interface.read(book_id) is book
+
+    # Change Feed Tests
+    def test_mutations_publish_changes_in_order(self):
+        """Should publish add, edit and delete changes with the resulting books, and nothing for no-ops"""
+        # Arrange
+        received = []
+        self.book_interface.changes.subscribe(received.append)
+        book = {"title": "Book", "author": "Author", "published_year": 2020, "quantity": 1}
+        # Act
+        self.book_interface.add_many([book, book])
+        self.book_interface.edit(0, {"title": "Renamed", "quantity": 1})
+        self.book_interface.edit(0, {"title": "Renamed"})
+        self.book_interface.adjust_quantity(1, 4)
+        self.book_interface.delete_many([0, 7])
+        # Assert
+        assert [(change.sequence, change.op, change.book_id, change.changes) for change in received] == [
+            (1, "add", 0, None), (2, "add", 1, None), (3, "edit", 0, {"title": "Renamed"}),
+            (4, "edit", 1, {"quantity": 5}), (5, "delete", 0, None)
+        ]
+        assert received[2].book.title == "Renamed"
+        assert received[3].book.quantity == 5
+        assert received[4].book is None
+
+    def test_journal_replay_publishes_nothing(self):
+        """Should only publish changes made through the instance, not ones loaded from disk"""
+        # Arrange
+        writer = BookInterfaceImplementation(self.test_file, journaled=True)
+        writer.add({"title": "Book", "author": "Author", "published_year": 2020, "quantity": 1})
+        writer.close()
+        # Act
+        reader = BookInterfaceImplementation(self.test_file, journaled=True)
+        # Assert
+        assert reader.changes.sequence == 0
+        assert len(reader.books) == 1
+        reader.close()
+        os.remove(self.test_file + ".journal")
+
+    def test_subscriber_can_call_back_into_repository(self):
+        """Should deliver after the locks are released, so a callback may read and write"""
+        # Arrange
+        repository = BookInterfaceImplementation(self.test_file, thread_safe=True)
+        seen = []
+
+        def restock(change):
+            seen.append(repository.read(change.book_id).quantity)
+            if change.op == "add":
+                repository.adjust_quantity(change.book_id, 1)
+
+        repository.changes.subscribe(restock)
+        # Act
+        worker = threading.Thread(
+            target=repository.add, args=({"title": "Book", "author": "Author", "published_year": 2020, "quantity": 1},), daemon=True
+        )
+        worker.start()
+        worker.join(timeout=5)
+        # Assert
+        assert not worker.is_alive()
+        assert seen == [1, 2]
+        assert repository.changes.sequence == 2
+
+    def test_failed_write_is_published_with_next_successful_write(self, monkeypatch):
+        """Should hold back a failed write's changes until a later write saves them, keeping feed and store in step"""
+        # Arrange
+        received = []
+        self.book_interface.changes.subscribe(received.append)
+        book = {"title": "Book", "author": "Author", "published_year": 2020, "quantity": 1}
+
+        def fail(books):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(self.book_interface, "_write_snapshot", fail)
+        # Act
+        with pytest.raises(OSError):
+            self.book_interface.add(book)
+        published_after_failure = list(received)
+        monkeypatch.undo()
+        self.book_interface.add(book)
+        # Assert
+        assert published_after_failure == []
+        assert [(change.sequence, change.op, change.book_id) for change in received] == [(1, "add", 0), (2, "add", 1)]
+        reloaded = BookInterfaceImplementation(self.test_file)
+        assert [book.id for book in reloaded.browse()] == [change.book_id for change in received]
+
+    # Snapshot Tests
+    def test_snapshot_is_unaffected_by_later_mutations(self):
+        """Should keep a pinned view at its version while writers add, edit and delete"""
+        # Arrange
+        for n in range(3):
+            self.book_interface.add({"title": f"Book {n}", "author": "Author", "published_year": 2020, "quantity": n})
+        snapshot = self.book_interface.snapshot()
+        # Act
+        self.book_interface.add({"title": "Book 3", "author": "Author", "published_year": 2020, "quantity": 3})
+        self.book_interface.edit(0, {"title": "Renamed"})
+        self.book_interface.delete(1)
+        later = self.book_interface.snapshot()
+        # Assert
+        assert [book.title for book in snapshot] == ["Book 0", "Book 1", "Book 2"]
+        assert snapshot.read(1).title == "Book 1"
+        assert [book.id for book in snapshot.browse(offset=1, limit=1)] == [1]
+        assert [book.id for book in snapshot.iter_books(after_id=0)] == [1, 2]
+        assert [book.title for book in later] == ["Renamed", "Book 2", "Book 3"]
+        assert later.version > snapshot.version
+
+    def test_snapshot_copies_store_once_per_pinned_version(self):
+        """Should share the live store until the next write, then copy it once"""
+        # Arrange
+        self.book_interface.add({"title": "Book", "author": "Author", "published_year": 2020, "quantity": 1})
+        store = self.book_interface._books
+        # Act
+        first, second = self.book_interface.snapshot(), self.book_interface.snapshot()
+        self.book_interface.adjust_quantity(0, 1)
+        copied = self.book_interface._books
+        self.book_interface.adjust_quantity(0, 1)
+        # Assert
+        assert first._books is second._books is store
+        assert copied is not store
+        assert self.book_interface._books is copied
+        assert first.read(0).quantity == 1
+
+    def test_write_after_snapshot_closed_does_not_copy(self):
+        """Should only copy the store while a view of it is still open"""
+        # Arrange
+        self.book_interface.add({"title": "Book", "author": "Author", "published_year": 2020, "quantity": 1})
+        store = self.book_interface._books
+        # Act
+        with self.book_interface.snapshot():
+            pass
+        first, second = self.book_interface.snapshot(), self.book_interface.snapshot()
+        first.close()
+        first.close()
+        second.close()
+        self.book_interface.adjust_quantity(0, 1)
+        # Assert
+        assert self.book_interface._books is store
+        assert self.book_interface._open_views == 0
+
+    @pytest.mark.parametrize("options", [{"columnar": True}, {"lazy": True}, {"lazy": True, "codec": "binary"}])
+    def test_snapshot_of_compact_stores(self, options):
+        """Should give columnar and lazy stores the same isolation, even after the file is rewritten"""
+        # Arrange
+        writer = BookInterfaceImplementation(self.test_file, codec=options.get("codec", "json"))
+        writer.add_many([{"title": f"Book {n}", "author": "Author", "published_year": 2020, "quantity": 1} for n in range(3)])
+        repository = BookInterfaceImplementation(self.test_file, **options)
+        snapshot = repository.snapshot()
+        # Act
+        repository.delete(0)
+        repository.add({"title": "Book 3", "author": "Author", "published_year": 2020, "quantity": 1})
+        # Assert
+        assert [book.title for book in snapshot] == ["Book 0", "Book 1", "Book 2"]
+        assert [book.title for book in repository.snapshot()] == ["Book 1", "Book 2", "Book 3"]
+        repository.close()
+
+    def test_snapshot_reader_does_not_block_writers(self):
+        """Should let a writer thread finish while a reader is part way through a snapshot"""
+        # Arrange
+        repository = BookInterfaceImplementation(self.test_file, thread_safe=True)
+        repository.add_many([{"title": f"Book {n}", "author": "Author", "published_year": 2020, "quantity": 1} for n in range(10)])
+        snapshot = repository.snapshot()
+        books = iter(snapshot)
+        seen = [next(books)]
+        # Act
+        writer = threading.Thread(target=lambda: [repository.delete(book_id) for book_id in range(10)])
+        writer.start()
+        writer.join(timeout=5)
+        seen.extend(books)
+        # Assert
+        assert not writer.is_alive()
+        assert repository.browse() == []
+        assert [book.id for book in seen] == list(range(10))
+
+    def test_batch_defers_snapshot_write_to_outermost_exit(self, monkeypatch):
+        """Should write one snapshot for every mutation inside nested batches"""
+        # Arrange
+        saves = []
+        monkeypatch.setattr(self.book_interface, "_write_snapshot", lambda books: saves.append(len(books)))
+        book = {"title": "Book", "author": "Author", "published_year": 2020, "quantity": 1}
+        # Act
+        with self.book_interface.batch():
+            with self.book_interface.batch():
+                self.book_interface.add(book)
+                self.book_interface.add_many([book, book])
+            self.book_interface.delete(0)
+            writes_inside = list(saves)
+        # Assert
+        assert writes_inside == []
+        assert saves == [2]
+
+    def test_snapshot_write_reencodes_only_changed_books(self, monkeypatch):
+        """Should reuse the encoded text of unchanged books and still write the full snapshot"""
+        # Arrange
+        ids = [
+            self.book_interface.add({"title": f"Book {i}", "author": "Author", "published_year": 2020, "quantity": i})
+            for i in range(3)
+        ]
+        encoded = []
+        encode = self.book_interface.codec.encode
+        monkeypatch.setattr(self.book_interface.codec, "encode", lambda book: encoded.append(book.id) or encode(book))
+        # Act
+        self.book_interface.edit(ids[1], {"quantity": 9})
+        self.book_interface.delete(ids[2])
+        # Assert
+        assert encoded == [ids[1]]
+        reloaded = BookInterfaceImplementation(self.test_file)
+        assert [(book.id, book.quantity) for book in reloaded.browse()] == [(ids[0], 0), (ids[1], 9)]
+
     # Delete Tests
     def test_delete_existing_book(self):
         """Should remove book successfully when it exists"""
@@ -156,6 +441,19 @@ class TestBookInterfaceImplementation:
         assert result is True
         assert len(self.book_interface.books) == 0
 
+    def test_delete_keeps_remaining_order(self):
+        """Should keep the remaining books in insertion order after a delete"""
+        # Arrange
+        ids = [
+            self.book_interface.add({"title": f"Book {i}", "author": "Author", "published_year": 2020, "quantity": i})
+            for i in range(3)
+        ]
+        # Act
+        self.book_interface.delete(ids[1])
+        # Assert
+        assert [book.id for book in self.book_interface.browse()] == [ids[0], ids[2]]
+        assert self.book_interface.read(ids[2]).title == "Book 2"
+
     def test_delete_nonexistent_book(self):
         """Should return False when deleting nonexistent book"""
         # Act
@@ -174,3 +472,197 @@ class TestBookInterfaceImplementation:
         # Assert
         assert result is False
 
+    # Bulk Tests
+    def test_add_many_assigns_ids_and_persists_once(self, monkeypatch):
+        """Should add every valid row with sequential IDs and save a single time"""
+        # Arrange
+        saves = []
+        monkeypatch.setattr(self.book_interface, "_write_snapshot", lambda books: saves.append(1))
+        rows = [
+            {"title": "Book 1", "author": "Author 1", "published_year": 2021, "quantity": 1},
+            {"title": "", "author": "Author 2", "published_year": 2022, "quantity": 2},
+            {"title": "Book 3", "author": "Author 3"},
+            {"title": "Book 4", "author": "Author 4", "published_year": 2024, "quantity": 4}
+        ]
+        # Act
+        results = self.book_interface.add_many(rows)
+        # Assert
+        assert [result.success for result in results] == [True, False, False, True]
+        assert [result.book_id for result in results if result.success] == [0, 1]
+        assert "Missing required field" in results[2].error
+        assert len(saves) == 1
+
+    def test_edit_many_reports_missing_books(self):
+        """Should update existing rows and report unknown IDs"""
+        # Arrange
+        book_id = self.book_interface.add({"title": "Original", "author": "Author", "published_year": 2023, "quantity": 5})
+        # Act
+        results = self.book_interface.edit_many([
+            {"id": book_id, "quantity": 9},
+            {"id": 999, "quantity": 1}
+        ])
+        # Assert
+        assert [result.success for result in results] == [True, False]
+        assert results[1].error == "Book with ID 999 not found"
+        assert self.book_interface.read(book_id).quantity == 9
+
+    def test_delete_many_reports_missing_books(self):
+        """Should delete existing rows and report unknown IDs"""
+        # Arrange
+        book_id = self.book_interface.add({"title": "Test Book", "author": "Test Author", "published_year": 2023, "quantity": 5})
+        # Act
+        results = self.book_interface.delete_many([book_id, book_id])
+        # Assert
+        assert [result.success for result in results] == [True, False]
+        assert len(self.book_interface.books) == 0
+
+    # Concurrency Tests
+    def test_concurrent_adds_get_unique_ids(self, tmp_path):
+        """Should hand out unique IDs and keep every book when threads add and read at once"""
+        # Arrange
+        file_path = str(tmp_path / "books.json")
+        repository = BookInterfaceImplementation(file_path, journaled=True, thread_safe=True)
+        ids, errors = [], []
+        def writer(worker):
+            try:
+                for n in range(25):
+                    book_id = repository.add({"title": f"Book {worker}-{n}", "author": "Author", "published_year": 2020, "quantity": 1})
+                    ids.append(book_id)
+                    assert repository.read(book_id).title == f"Book {worker}-{n}"
+                    repository.search("Author")
+            except Exception as e:
+                errors.append(e)
+        def reader():
+            for _ in range(25):
+                list(repository.iter_books(limit=10))
+                repository.browse()
+        threads = [threading.Thread(target=writer, args=(worker,)) for worker in range(4)]
+        threads += [threading.Thread(target=reader) for _ in range(2)]
+        # Act
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+        repository.close()
+        # Assert
+        assert errors == []
+        assert sorted(ids) == list(range(100))
+        assert len(BookInterfaceImplementation(file_path, journaled=True).books) == 100
+
+    # Shared Mode Tests
+    def test_shared_instances_see_each_others_changes(self, tmp_path):
+        """Should reload when another writer has replaced the snapshot"""
+        # Arrange
+        file_path = str(tmp_path / "books.json")
+        first = BookInterfaceImplementation(file_path, shared=True)
+        second = BookInterfaceImplementation(file_path, shared=True)
+        # Act
+        first_id = first.add({"title": "First", "author": "Author", "published_year": 2020, "quantity": 1})
+        second_id = second.add({"title": "Second", "author": "Author", "published_year": 2020, "quantity": 1})
+        # Assert
+        assert (first_id, second_id) == (0, 1)
+        assert [book.title for book in first.browse()] == ["First", "Second"]
+        assert [book.title for book in first.search("second")] == ["Second"]
+
+    def test_shared_reads_skip_reload_when_unchanged(self, tmp_path, monkeypatch):
+        """Should not re-read the snapshot when nobody has written it"""
+        # Arrange
+        file_path = str(tmp_path / "books.json")
+        repository = BookInterfaceImplementation(file_path, shared=True)
+        repository.add({"title": "Book", "author": "Author", "published_year": 2020, "quantity": 1})
+        loads = []
+        monkeypatch.setattr(repository, "_load_from_json", lambda: loads.append(1))
+        # Act
+        for _ in range(5):
+            repository.read(0)
+        # Assert
+        assert loads == []
+
+    def test_shared_rejects_deferred_writes(self, tmp_path):
+        """Should refuse options that keep changes out of the snapshot"""
+        with pytest.raises(ValueError):
+            BookInterfaceImplementation(str(tmp_path / "books.json"), shared=True, journaled=True)
+        with pytest.raises(ValueError):
+            BookInterfaceImplementation(str(tmp_path / "books.json"), shared=True, lazy=True)
+
+    @pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="needs the fork start method")
+    def test_shared_processes_do_not_lose_writes(self, tmp_path):
+        """Should keep every book when several processes add to one snapshot"""
+        # Arrange
+        file_path = str(tmp_path / "books.json")
+        context = multiprocessing.get_context("fork")
+        workers = [context.Process(target=_add_shared_books, args=(file_path, worker)) for worker in range(4)]
+        # Act
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(30)
+        # Assert
+        books = BookInterfaceImplementation(file_path).books
+        assert sorted(book.id for book in books) == list(range(80))
+
+    # Attribute Index Tests
+    def test_find_by_author_and_year_range_follow_changes(self):
+        """Should keep author and year lookups current across add, edit and delete"""
+        # Arrange
+        self.book_interface.add_many([
+            {"title": "Emma", "author": "Jane Austen", "published_year": 1815, "quantity": 1},
+            {"title": "Dune", "author": "Frank Herbert", "published_year": 1965, "quantity": 1},
+            {"title": "Persuasion", "author": "Jane Austen", "published_year": 1817, "quantity": 1}
+        ])
+        assert [book.id for book in self.book_interface.find_by_author("jane austen")] == [0, 2]
+        # Act
+        self.book_interface.edit(1, {"author": "Jane  Austen", "published_year": 1816})
+        self.book_interface.delete(0)
+        self.book_interface.add({"title": "Sanditon", "author": "JANE AUSTEN", "published_year": 1817, "quantity": 1})
+        # Assert
+        assert [book.id for book in self.book_interface.find_by_author("Jane Austen")] == [1, 2, 3]
+        assert [book.id for book in self.book_interface.find_by_year_range(1816, 1817)] == [1, 2, 3]
+        assert self.book_interface.find_by_year_range(1900, 2000) == []
+
+    # Stock Tests
+    def test_adjust_quantity_journals_only_the_new_quantity(self, tmp_path):
+        """Should append a small stock record instead of rewriting the snapshot"""
+        # Arrange
+        file_path = str(tmp_path / "books.json")
+        repository = BookInterfaceImplementation(file_path, journaled=True)
+        book_id = repository.add({"title": "Book", "author": "Author", "published_year": 2020, "quantity": 5})
+        # Act
+        quantity = repository.adjust_quantity(book_id, -2)
+        repository.close()
+        # Assert
+        with open(file_path + ".journal") as journal:
+            last_record = journal.readlines()[-1]
+        assert quantity == 3
+        assert last_record.strip() == '{"op":"stock","id":0,"quantity":3}'
+        assert BookInterfaceImplementation(file_path, journaled=True).read(book_id).quantity == 3
+
+    def test_adjust_quantity_refuses_negative_stock(self):
+        """Should leave the book unchanged when the delta would go below zero"""
+        # Arrange
+        book_id = self.book_interface.add({"title": "Book", "author": "Author", "published_year": 2020, "quantity": 1})
+        # Act
+        with pytest.raises(InsufficientStockError) as error:
+            self.book_interface.adjust_quantity(book_id, -2)
+        # Assert
+        assert (error.value.available, error.value.requested) == (1, 2)
+        assert self.book_interface.read(book_id).quantity == 1
+        assert self.book_interface.adjust_quantity(99, 1) is None
+
+    def test_concurrent_adjustments_are_not_lost(self):
+        """Should apply every delta when threads adjust the same book"""
+        # Arrange
+        repository = BookInterfaceImplementation(self.test_file, thread_safe=True, commit_interval=60)
+        book_id = repository.add({"title": "Book", "author": "Author", "published_year": 2020, "quantity": 100})
+        def checkout():
+            for _ in range(25):
+                repository.adjust_quantity(book_id, -1)
+        threads = [threading.Thread(target=checkout) for _ in range(4)]
+        # Act
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+        repository.close()
+        # Assert
+        assert repository.read(book_id).quantity == 0
@@ -0,0 +1,47 @@
+import json
+from src.Application.Interfaces.BookRepositoryFactory import (
+    create_async_repository, create_repository, load_connection_string, sqlite_path_from_connection_string
+)
+from src.Application.Interfaces.AsyncBookRepositoryAdapter import AsyncBookRepositoryAdapter
+from src.Application.Interfaces.CachingBookRepository import CachingBookRepository
+from src.Application.Interfaces.BookInterfaceImplementation import BookInterfaceImplementation
+from src.Application.Interfaces.BookSqliteImplementation import BookSqliteImplementation
+
+class TestBookRepositoryFactory:
+    def test_sqlite_connection_strings(self):
+        """Should recognize SQLite URL and Data Source styles"""
+        assert sqlite_path_from_connection_string("sqlite:///books.db") == "books.db"
+        assert sqlite_path_from_connection_string("Data Source=books.db;Cache=Shared") == "books.db"
+
+    def test_non_sqlite_connection_strings(self):
+        """Should not treat server connection strings as SQLite"""
+        assert sqlite_path_from_connection_string(None) is None
+        assert sqlite_path_from_connection_string("Server=host;Database=BookAppDb;") is None
+
+    def test_load_connection_string(self, tmp_path):
+        """Should read DefaultConnection from appsettings"""
+        settings_file = tmp_path / "appsettings.json"
+        settings_file.write_text(json.dumps({"ConnectionStrings": {"DefaultConnection": "Data Source=x.db"}}))
+        assert load_connection_string(str(settings_file)) == "Data Source=x.db"
+        assert load_connection_string(str(tmp_path / "missing.json")) is None
+
+    def test_create_repository(self, tmp_path):
+        """Should pick the backend from the connection string"""
+        sqlite_repository = create_repository(f"Data Source={tmp_path / 'books.db'}")
+        json_repository = create_repository("Server=host;", json_path=str(tmp_path / "books.json"))
+        assert isinstance(sqlite_repository, BookSqliteImplementation)
+        assert isinstance(json_repository, BookInterfaceImplementation)
+        sqlite_repository.close()
+
+    def test_create_async_repository(self, tmp_path):
+        """Should wrap a thread-safe repository for asyncio callers"""
+        repository = create_async_repository(json_path=str(tmp_path / "books.json"))
+        assert isinstance(repository, AsyncBookRepositoryAdapter)
+        assert repository.repository.thread_safe
+
+    def test_create_cached_repository(self, tmp_path):
+        """Should wrap the backend in the read-through cache when asked"""
+        repository = create_repository(f"Data Source={tmp_path / 'books.db'}", cached=True)
+        assert isinstance(repository, CachingBookRepository)
+        assert isinstance(repository.repository, BookSqliteImplementation)
+        repository.close()
@@ -0,0 +1,52 @@
+import pytest
+from src.Application.Indexes.BookSearchIndex import BookSearchIndex, matches, tokenize
+from src.Domain.Entities.Book import Book
+
+class TestBookSearchIndex:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup test environment before each test"""
+        self.index = BookSearchIndex([
+            Book(title="The Hobbit", author="J.R.R. Tolkien", published_year=1937, quantity=1, id=0),
+            Book(title="Dune", author="Frank Herbert", published_year=1965, quantity=2, id=1),
+            Book(title="Dune Messiah", author="Frank Herbert", published_year=1969, quantity=3, id=2)
+        ])
+
+    def test_tokenize_normalizes_case_and_punctuation(self):
+        """Should lower-case text and split on non-word characters"""
+        assert tokenize("J.R.R. Tolkien") == ["j", "r", "r", "tolkien"]
+
+    def test_search_whole_token(self):
+        """Should match titles and authors by token"""
+        assert self.index.search("dune") == {1, 2}
+        assert self.index.search("HERBERT") == {1, 2}
+
+    def test_search_prefix_and_substring(self):
+        """Should match fragments anywhere inside a token"""
+        assert self.index.search("hob") == {0}
+        assert self.index.search("olkie") == {0}
+        assert self.index.search("essi") == {2}
+
+    def test_search_requires_every_term(self):
+        """Should intersect results across query terms"""
+        assert self.index.search("dune mess") == {2}
+        assert self.index.search("dune tolkien") == set()
+
+    def test_search_empty_query(self):
+        """Should return nothing for a query without terms"""
+        assert self.index.search("  ") == set()
+
+    def test_update_and_remove(self):
+        """Should drop stale tokens when books change or disappear"""
+        self.index.update(Book(title="Children of Dune", author="Frank Herbert", published_year=1976, quantity=1, id=2))
+        self.index.remove(1)
+        assert self.index.search("messiah") == set()
+        assert self.index.search("dune") == {2}
+        assert self.index.search("child") == {2}
+
+    def test_matches_single_book(self):
+        """Should apply the index's matching rule to one book"""
+        book = Book(title="Dune Messiah", author="Frank Herbert", published_year=1969, quantity=3, id=2)
+        assert matches("dune herb", book)
+        assert not matches("dune tolkien", book)
+        assert not matches("  ", book)
@@ -1,7 +1,9 @@
 import pytest
+import json
 from src.Application.Services.BookServices import BookServices
 from src.Application.Interfaces.BookInterfaceImplementation import BookInterfaceImplementation
 from src.Domain.Entities.Book import Book
+from src.Domain.Entities.BookNotFoundError import BookNotFoundError
 
 class TestBookServices:
     @pytest.fixture(autouse=True)
@@ -79,6 +81,57 @@ class TestBookServices:
             self.book_services.read(book_id)
         assert f"Book with ID {book_id} not found" in str(exc_info.value)
 
+    # Search Tests
+    def test_search_by_title_or_author(self):
+        """Test searching books by title and author fragments"""
+        self.book_services.add({"title": "Dune", "author": "Frank Herbert", "published_year": 1965, "quantity": 1})
+        self.book_services.add({"title": "Emma", "author": "Jane Austen", "published_year": 1815, "quantity": 1})
+        assert [book.title for book in self.book_services.search("herb")] == ["Dune"]
+        assert [book.title for book in self.book_services.search("AUSTEN")] == ["Emma"]
+        assert self.book_services.search("tolkien") == []
+
+    # Find Tests
+    def test_find_by_author_and_year_range(self):
+        """Test looking books up by author and published year range"""
+        self.book_services.add({"title": "Dune", "author": "Frank Herbert", "published_year": 1965, "quantity": 1})
+        self.book_services.add({"title": "Emma", "author": "Jane Austen", "published_year": 1815, "quantity": 1})
+        assert [book.title for book in self.book_services.find_by_author("jane austen")] == ["Emma"]
+        assert [book.title for book in self.book_services.find_by_year_range(1900, 2000)] == ["Dune"]
+
+    def test_find_rejects_invalid_arguments(self):
+        """Test validation of find arguments"""
+        with pytest.raises(ValueError, match="Author must be a non-empty string"):
+            self.book_services.find_by_author("  ")
+        with pytest.raises(ValueError, match="Start year must be a positive integer"):
+            self.book_services.find_by_year_range("1900", 2000)
+        with pytest.raises(ValueError, match="Start year must not be after end year"):
+            self.book_services.find_by_year_range(2000, 1900)
+
+    # Stock Tests
+    def test_increment_and_decrement_quantity(self):
+        """Test adjusting stock by a positive amount"""
+        book_id = self.book_services.add({"title": "Dune", "author": "Frank Herbert", "published_year": 1965, "quantity": 1})
+        assert self.book_services.increment_quantity(book_id, 4) == 5
+        assert self.book_services.decrement_quantity(book_id) == 4
+        assert self.book_services.read(book_id).quantity == 4
+
+    def test_stock_operations_reject_invalid_input(self):
+        """Test stock validation and missing books"""
+        book_id = self.book_services.add({"title": "Dune", "author": "Frank Herbert", "published_year": 1965, "quantity": 1})
+        with pytest.raises(ValueError, match="Amount must be a positive integer"):
+            self.book_services.increment_quantity(book_id, 0)
+        with pytest.raises(BookNotFoundError, match="Book with ID 999 not found"):
+            self.book_services.decrement_quantity(999)
+        with pytest.raises(ValueError, match="cannot remove 2"):
+            self.book_services.decrement_quantity(book_id, 2)
+
+    def test_reserve(self):
+        """Test reserving copies until the stock runs out"""
+        book_id = self.book_services.add({"title": "Dune", "author": "Frank Herbert", "published_year": 1965, "quantity": 2})
+        assert self.book_services.reserve(book_id, 2)
+        assert not self.book_services.reserve(book_id)
+        assert self.book_services.read(book_id).quantity == 0
+
     # Add Tests
     def test_add_book_success(self):
         """Test adding valid book"""
@@ -174,3 +227,71 @@ class TestBookServices:
             self.book_services.delete(book_id)
         assert f"Book with ID {book_id} not found" in str(exc_info.value)
 
+    # Bulk Tests
+    def test_add_many_keeps_row_indexes(self):
+        """Test bulk add reports validation errors against the original rows"""
+        rows = [
+            {"title": "Book 1", "author": "Author 1", "published_year": 2020, "quantity": 3},
+            {"title": "Book 2", "author": "Author 2", "published_year": 0, "quantity": 2},
+            {"title": "Book 3", "author": "Author 3", "published_year": 2022, "quantity": 1}
+        ]
+        results = self.book_services.add_many(rows)
+        assert [result.index for result in results] == [0, 1, 2]
+        assert [result.success for result in results] == [True, False, True]
+        assert "Published_year must be a positive integer" in results[1].error
+        assert len(self.book_services.browse()) == 2
+
+    def test_add_many_reports_every_error_of_a_row(self):
+        """Test bulk add lists all validation errors of a rejected row"""
+        results = self.book_services.add_many([{"title": "", "author": "Author", "published_year": 0}])
+        assert results[0].error == (
+            "Missing required fields: quantity; Title must be a non-empty string; "
+            "Published_year must be a positive integer"
+        )
+
+    def test_edit_many_requires_id(self):
+        """Test bulk edit rejects rows without an ID"""
+        book_id = self.book_services.add({"title": "Book", "author": "Author", "published_year": 2020, "quantity": 3})
+        results = self.book_services.edit_many([{"quantity": 1}, {"id": book_id, "quantity": -1}, {"id": book_id, "quantity": 7}])
+        assert [result.success for result in results] == [False, False, True]
+        assert self.book_services.read(book_id).quantity == 7
+
+    def test_delete_many(self):
+        """Test bulk delete"""
+        book_id = self.book_services.add({"title": "Book", "author": "Author", "published_year": 2020, "quantity": 3})
+        results = self.book_services.delete_many([book_id, 999])
+        assert [result.success for result in results] == [True, False]
+
+    # Export and Import Tests
+    def test_export_import_round_trip(self, tmp_path):
+        """Test streaming export to gzipped CSV and importing it into another catalogue"""
+        rows = [{"title": f"Book {i}", "author": "Author", "published_year": 2000 + i, "quantity": i} for i in range(5)]
+        self.book_services.add_many(rows)
+        export_path = str(tmp_path / "books.csv.gz")
+        assert self.book_services.export_books(export_path, chunk_size=2) == 5
+        target = BookServices(BookInterfaceImplementation(str(tmp_path / "copy.json")))
+        summary = target.import_books(export_path, chunk_size=2)
+        assert (summary.rows, summary.imported, summary.failures) == (5, 5, [])
+        assert target.browse() == self.book_services.browse()
+
+    def test_import_numbers_failures_across_chunks(self, tmp_path, monkeypatch):
+        """Test import reports rejected rows by source position and writes the snapshot once"""
+        source = tmp_path / "books.jsonl"
+        rows = [{"title": f"Book {i}", "author": "Author", "published_year": 2020, "quantity": -1 if i == 3 else 1} for i in range(5)]
+        source.write_text("\n".join(json.dumps(row) for row in rows))
+        saves = []
+        monkeypatch.setattr(self.repository, "_write_snapshot", lambda books: saves.append(len(books)))
+        summary = self.book_services.import_books(str(source), chunk_size=2)
+        assert (summary.rows, summary.imported) == (5, 4)
+        assert [(failure.index, failure.error) for failure in summary.failures] == [(3, "Quantity must be a non-negative integer")]
+        assert saves == [4]
+
+    def test_import_csv_rejects_malformed_number_row(self, tmp_path):
+        """Test a CSV cell like --5 fails only its own row"""
+        source = tmp_path / "books.csv"
+        source.write_text(
+            "title,author,published_year,quantity\nBook 0,Author,2020,1\nBook 1,Author,2020,--5\nBook 2,Author,2020,1\n"
+        )
+        summary = self.book_services.import_books(str(source))
+        assert (summary.rows, summary.imported) == (3, 2)
+        assert [failure.index for failure in summary.failures] == [1]
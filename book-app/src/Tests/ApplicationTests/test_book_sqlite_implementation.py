@@ -0,0 +1,203 @@
+import pytest
+import sqlite3
+from src.Application.Interfaces.BookSqliteImplementation import BookSqliteImplementation
+from src.Domain.Entities.Book import Book
+from src.Domain.Entities.InsufficientStockError import InsufficientStockError
+
+class TestBookSqliteImplementation:
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        """Setup test environment before each test"""
+        self.database_file = tmp_path / "test_books.db"
+        self.repository = BookSqliteImplementation(str(self.database_file))
+        self.book_data = {"title": "Test Book", "author": "Test Author", "published_year": 2023, "quantity": 5}
+        yield
+        self.repository.close()
+
+    def test_uses_wal_and_indexes(self):
+        """Should enable WAL and index the queried columns"""
+        connection = sqlite3.connect(str(self.database_file))
+        journal_mode = connection.execute("PRAGMA journal_mode").fetchone()[0]
+        indexes = {row[1] for row in connection.execute("PRAGMA index_list(books)")}
+        connection.close()
+        assert journal_mode == "wal"
+        assert {"ix_books_title", "ix_books_author", "ix_books_published_year"} <= indexes
+
+    def test_add_and_read(self):
+        """Should assign incremental IDs starting at zero"""
+        first_id = self.repository.add(self.book_data)
+        second_id = self.repository.add({**self.book_data, "title": "Second"})
+        assert (first_id, second_id) == (0, 1)
+        assert self.repository.read(second_id) == Book(title="Second", author="Test Author", published_year=2023, quantity=5, id=1)
+        assert self.repository.read(999) is None
+
+    def test_add_invalid_book(self):
+        """Should raise ValueError and store nothing"""
+        with pytest.raises(ValueError):
+            self.repository.add({**self.book_data, "title": ""})
+        assert self.repository.browse() == []
+
+    def test_browse_in_insertion_order(self):
+        """Should return books ordered by ID"""
+        for title in ["Book 1", "Book 2", "Book 3"]:
+            self.repository.add({**self.book_data, "title": title})
+        assert [book.title for book in self.repository.browse()] == ["Book 1", "Book 2", "Book 3"]
+
+    def test_browse_pages(self):
+        """Should page by offset/limit and by keyset"""
+        self.repository.add_many([{**self.book_data, "title": f"Book {i}"} for i in range(5)])
+        assert [book.id for book in self.repository.browse(offset=3)] == [3, 4]
+        assert [book.id for book in self.repository.browse(limit=2, after_id=2)] == [3, 4]
+
+    def test_iter_books_across_batches(self, monkeypatch):
+        """Should stream every row across keyset batches"""
+        monkeypatch.setattr("src.Application.Interfaces.BookSqliteImplementation._STREAM_BATCH_SIZE", 2)
+        self.repository.add_many([{**self.book_data, "title": f"Book {i}"} for i in range(5)])
+        assert [book.id for book in self.repository.iter_books()] == [0, 1, 2, 3, 4]
+        assert [book.id for book in self.repository.iter_books(offset=1, limit=3)] == [1, 2, 3]
+
+    def test_edit_and_delete(self):
+        """Should update and remove existing rows only"""
+        book_id = self.repository.add(self.book_data)
+        assert self.repository.edit(book_id, {"quantity": 9})
+        assert self.repository.read(book_id).quantity == 9
+        assert not self.repository.edit(999, {"quantity": 1})
+        assert self.repository.delete(book_id)
+        assert not self.repository.delete(book_id)
+
+    def test_edit_without_changes_issues_no_update(self):
+        """Should leave the row untouched when the edit changes nothing"""
+        book_id = self.repository.add(self.book_data)
+        changes_before = self.repository._connection.total_changes
+        assert self.repository.edit(book_id, {"quantity": self.book_data["quantity"]})
+        assert self.repository.edit(book_id, {})
+        assert self.repository._connection.total_changes == changes_before
+
+    def test_search(self):
+        """Should match every term against title or author"""
+        self.repository.add({**self.book_data, "title": "Dune", "author": "Frank Herbert"})
+        self.repository.add({**self.book_data, "title": "100%_Pure", "author": "Someone"})
+        assert [book.title for book in self.repository.search("DUNE herb")] == ["Dune"]
+        assert [book.title for book in self.repository.search("pure")] == ["100%_Pure"]
+        assert self.repository.search("dune tolkien") == []
+
+    def test_search_index_follows_edits_and_deletes(self):
+        """Should answer long terms from the full-text index and keep it in step with writes"""
+        dune = self.repository.add({**self.book_data, "title": "Dune", "author": "Frank Herbert"})
+        emile = self.repository.add({**self.book_data, "title": "Émile", "author": "Rousseau"})
+        plan = " ".join(row[3] for row in self.repository._connection.execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM books WHERE id IN (SELECT rowid FROM books_search WHERE books_search MATCH 'une')"
+        ))
+        assert self.repository.full_text_search
+        assert "books_search" in plan
+        assert [book.id for book in self.repository.search("ÉMI")] == [emile]
+        self.repository.edit(dune, {"title": "Children of Dune"})
+        assert [book.id for book in self.repository.search("children he")] == [dune]
+        self.repository.delete(dune)
+        assert self.repository.search("herbert") == []
+
+    def test_search_indexes_existing_database(self):
+        """Should build the full-text index for rows written before it existed"""
+        connection = sqlite3.connect(str(self.database_file))
+        connection.executescript("DROP TABLE books_search; DROP TRIGGER books_search_insert;")
+        connection.execute("INSERT INTO books VALUES (5, 'Dune', 'Frank Herbert', 1965, 1)")
+        connection.commit()
+        connection.close()
+        repository = BookSqliteImplementation(str(self.database_file))
+        assert [book.id for book in repository.search("herbert")] == [5]
+        repository.close()
+
+    def test_search_falls_back_to_like_without_full_text(self):
+        """Should give the same results by scanning when FTS5 is unavailable"""
+        self.repository.add({**self.book_data, "title": "Dune", "author": "Frank Herbert"})
+        self.repository.full_text_search = False
+        assert [book.title for book in self.repository.search("DUNE herb")] == ["Dune"]
+
+    def test_bulk_operations(self):
+        """Should report per-row results for bulk calls"""
+        results = self.repository.add_many([self.book_data, {"title": "Only title"}, self.book_data])
+        assert [result.book_id for result in results] == [0, None, 1]
+        results = self.repository.edit_many([{"id": 0, "quantity": 2}, {"id": 7, "quantity": 2}])
+        assert [result.success for result in results] == [True, False]
+        results = self.repository.delete_many([1, 1])
+        assert [result.success for result in results] == [True, False]
+        assert [book.id for book in self.repository.browse()] == [0]
+
+    def test_data_survives_reconnect(self):
+        """Should persist rows across connections"""
+        book_id = self.repository.add(self.book_data)
+        self.repository.close()
+        self.repository = BookSqliteImplementation(str(self.database_file))
+        assert self.repository.read(book_id).title == "Test Book"
+
+    def test_find_by_author_and_year_range(self):
+        """Should look books up by author and by published year range"""
+        self.repository.add_many([
+            {**self.book_data, "author": "Jane Austen", "published_year": 1815},
+            {**self.book_data, "author": "jane  austen", "published_year": 1811},
+            {**self.book_data, "author": "Frank Herbert", "published_year": 1965}
+        ])
+        assert [book.id for book in self.repository.find_by_author("JANE AUSTEN")] == [0]
+        assert [book.id for book in self.repository.find_by_year_range(1800, 1900)] == [1, 0]
+
+    def test_adjust_quantity(self):
+        """Should apply quantity deltas in the database and refuse negative stock"""
+        book_id = self.repository.add(self.book_data)
+        assert self.repository.adjust_quantity(book_id, 3) == 8
+        with pytest.raises(InsufficientStockError):
+            self.repository.adjust_quantity(book_id, -9)
+        assert self.repository.read(book_id).quantity == 8
+        assert self.repository.adjust_quantity(42, 1) is None
+
+    def test_snapshot_reads_one_version_while_writes_commit(self):
+        """Should keep a read transaction on its own connection until the snapshot is closed"""
+        self.repository.add_many([{**self.book_data, "title": f"Book {n}"} for n in range(3)])
+        with self.repository.snapshot() as snapshot:
+            self.repository.delete(0)
+            self.repository.edit(1, {"title": "Renamed"})
+            self.repository.add({**self.book_data, "title": "Book 3"})
+            assert [book.title for book in snapshot] == ["Book 0", "Book 1", "Book 2"]
+            assert len(snapshot) == 3
+            assert snapshot.read(0).title == "Book 0"
+            assert [book.id for book in snapshot.browse(after_id=0, limit=1)] == [1]
+        assert [book.title for book in self.repository.snapshot()] == ["Renamed", "Book 2", "Book 3"]
+
+    def test_in_memory_snapshot_is_a_copy(self):
+        """Should copy the rows when the database cannot be opened a second time"""
+        repository = BookSqliteImplementation(":memory:")
+        repository.add(self.book_data)
+        snapshot = repository.snapshot()
+        repository.delete(0)
+        assert [book.title for book in snapshot] == ["Test Book"]
+        repository.close()
+
+    def test_changes_are_published_after_commit(self, monkeypatch):
+        """Should publish committed changes in order and nothing from a rolled back transaction"""
+        received = []
+        self.repository.changes.subscribe(received.append)
+        self.repository.add_many([self.book_data, self.book_data])
+        self.repository.edit(0, {"quantity": 7})
+        self.repository.adjust_quantity(1, -2)
+        self.repository.delete(0)
+        monkeypatch.setattr(self.repository, "_insert_params", lambda book: 1 / 0)
+        with pytest.raises(ZeroDivisionError):
+            self.repository.add(self.book_data)
+        assert [(change.op, change.book_id, change.changes) for change in received] == [
+            ("add", 0, None), ("add", 1, None), ("edit", 0, {"quantity": 7}), ("edit", 1, {"quantity": 3}), ("delete", 0, None)
+        ]
+        assert [change.sequence for change in received] == [1, 2, 3, 4, 5]
+
+    def test_callback_write_is_numbered_after_its_batch(self):
+        """Should publish a write made from a callback after the whole transaction it reacted to"""
+        received = []
+
+        def restock(change):
+            received.append(change)
+            if (change.op, change.book_id) == ("add", 0):
+                self.repository.adjust_quantity(0, 5)
+
+        self.repository.changes.subscribe(restock)
+        self.repository.add_many([self.book_data, self.book_data])
+        assert [(change.sequence, change.op, change.book_id) for change in received] == [
+            (1, "add", 0), (2, "add", 1), (3, "edit", 0)
+        ]
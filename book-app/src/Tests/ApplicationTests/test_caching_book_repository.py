@@ -0,0 +1,157 @@
+import pytest
+from unittest.mock import Mock
+from src.Application.Interfaces.BookInterfaceImplementation import BookInterfaceImplementation
+from src.Application.Interfaces.CachingBookRepository import CachingBookRepository
+
+def _book(title, author="Author"):
+    return {"title": title, "author": author, "published_year": 2020, "quantity": 1}
+
+class TestCachingBookRepository:
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        """Setup test environment before each test"""
+        self.now = 0.0
+        self.backend = Mock(wraps=BookInterfaceImplementation(str(tmp_path / "books.json")))
+        self.repository = CachingBookRepository(self.backend, read_cache_size=2, query_ttl=10, clock=lambda: self.now)
+        self.backend.add_many([_book("Dune", "Frank Herbert"), _book("Emma", "Jane Austen"), _book("Ulysses", "James Joyce")])
+
+    def test_read_hits_cache(self):
+        """Should call the backend once for repeated reads and count hits and misses"""
+        # Act
+        first = self.repository.read(0)
+        second = self.repository.read(0)
+        # Assert
+        assert first == second
+        assert self.backend.read.call_count == 1
+        assert (self.repository.stats.read_hits, self.repository.stats.read_misses) == (1, 1)
+
+    def test_read_cache_is_size_bounded(self):
+        """Should evict the least recently used book"""
+        # Act
+        self.repository.read(0)
+        self.repository.read(1)
+        self.repository.read(0)
+        self.repository.read(2)
+        self.repository.read(0)
+        self.repository.read(1)
+        # Assert
+        assert self.backend.read.call_count == 4
+
+    def test_query_cache_expires(self):
+        """Should serve browse and search from cache until the TTL passes"""
+        # Act
+        self.repository.browse()
+        self.repository.search("dune")
+        self.repository.browse()
+        self.repository.search("dune")
+        self.now = 11
+        self.repository.browse()
+        # Assert
+        assert self.backend.browse.call_count == 2
+        assert self.backend.search.call_count == 1
+        assert (self.repository.stats.query_hits, self.repository.stats.query_misses) == (2, 3)
+
+    def test_cached_lists_are_copies(self):
+        """Should not let callers change cached results"""
+        # Act
+        self.repository.browse().clear()
+        # Assert
+        assert len(self.repository.browse()) == 3
+
+    def test_edit_invalidates_only_affected_entries(self):
+        """Should drop the edited book, pages holding it and searches it now matches"""
+        # Arrange
+        self.repository.read(0)
+        self.repository.read(1)
+        self.repository.browse(limit=1)
+        self.repository.browse(after_id=0, limit=1)
+        self.repository.search("austen")
+        self.repository.search("messiah")
+        self.backend.reset_mock()
+        # Act
+        self.repository.edit(0, {"title": "Dune Messiah"})
+        # Assert
+        assert self.repository.read(0).title == "Dune Messiah"
+        assert self.repository.read(1).title == "Emma"
+        assert [book.title for book in self.repository.browse(limit=1)] == ["Dune Messiah"]
+        self.repository.browse(after_id=0, limit=1)
+        self.repository.search("austen")
+        assert [book.id for book in self.repository.search("messiah")] == [0]
+        assert self.backend.read.call_count == 1
+        assert self.backend.browse.call_count == 1
+        assert self.backend.search.call_count == 1
+
+    def test_add_invalidates_open_pages_and_matching_searches(self):
+        """Should refresh pages the new book lands on and searches it matches"""
+        # Arrange
+        assert self.repository.read(3) is None
+        self.repository.browse(limit=2)
+        self.repository.browse()
+        self.repository.search("herbert")
+        self.repository.search("tolkien")
+        self.backend.reset_mock()
+        # Act
+        book_id = self.repository.add(_book("The Hobbit", "J.R.R. Tolkien"))
+        # Assert
+        assert self.repository.read(book_id).title == "The Hobbit"
+        self.repository.browse(limit=2)
+        assert len(self.repository.browse()) == 4
+        self.repository.search("herbert")
+        assert [book.id for book in self.repository.search("tolkien")] == [book_id]
+        assert self.backend.browse.call_count == 1
+        assert self.backend.search.call_count == 1
+
+    def test_delete_invalidates_shifted_pages(self):
+        """Should refresh pages at or after the deleted book and searches holding it"""
+        # Arrange
+        self.repository.browse(limit=1)
+        self.repository.browse(offset=1, limit=1)
+        self.repository.search("emma")
+        self.backend.reset_mock()
+        # Act
+        self.repository.delete(1)
+        # Assert
+        assert self.repository.read(1) is None
+        self.repository.browse(limit=1)
+        assert [book.id for book in self.repository.browse(offset=1, limit=1)] == [2]
+        assert self.repository.search("emma") == []
+        assert self.backend.browse.call_count == 1
+        assert self.backend.search.call_count == 1
+
+    def test_bulk_writes_invalidate(self):
+        """Should invalidate entries touched by successful bulk rows"""
+        # Arrange
+        self.repository.read(0)
+        self.repository.read(1)
+        # Act
+        self.repository.edit_many([{"id": 0, "quantity": 7}])
+        self.repository.delete_many([1])
+        # Assert
+        assert self.repository.read(0).quantity == 7
+        assert self.repository.read(1) is None
+
+    def test_find_results_follow_edits(self):
+        """Should cache author and year lookups and drop those an edit changes"""
+        # Arrange
+        self.repository.find_by_author("jane austen")
+        self.repository.find_by_year_range(1900, 2000)
+        self.repository.find_by_author("JANE  AUSTEN")
+        self.backend.reset_mock()
+        # Act
+        self.repository.edit(0, {"author": "Jane Austen"})
+        # Assert
+        assert [book.id for book in self.repository.find_by_author("Jane Austen")] == [0, 1]
+        self.repository.find_by_year_range(1900, 2000)
+        assert self.backend.find_by_author.call_count == 1
+        assert self.backend.find_by_year_range.call_count == 0
+
+    def test_adjust_quantity_invalidates(self):
+        """Should drop the adjusted book and pages holding it"""
+        # Arrange
+        self.repository.read(0)
+        self.repository.browse()
+        # Act
+        self.repository.adjust_quantity(0, 4)
+        # Assert
+        assert self.repository.read(0).quantity == 5
+        assert self.repository.browse()[0].quantity == 5
@@ -1,6 +1,7 @@
 import pytest
 import json
 import os
+from src.Application.Concurrency.ReadWriteLock import ReadWriteLock
 from src.Application.Interfaces.BookInterfaceImplementation import BookInterfaceImplementation
 from src.Domain.Entities.Book import Book
 
@@ -64,6 +65,83 @@ class TestJsonOperations:
             assert data[0]['title'] == "Book 1"
             assert data[1]['title'] == "Book 2"
 
+    def test_save_replaces_file_atomically(self):
+        """Should not leave temp files next to the snapshot"""
+        # Act
+        self.book_interface._save_to_json()
+        self.book_interface._save_to_json()
+
+        # Assert
+        assert os.listdir(self.test_file.parent) == [self.test_file.name]
+
+    # Group Commit Tests
+    def test_commit_interval_batches_snapshot_writes(self):
+        """Should defer the snapshot write until the commit window is flushed"""
+        # Arrange
+        repository = BookInterfaceImplementation(str(self.test_file), commit_interval=60)
+        book_data = {"title": "Test Book", "author": "Test Author", "published_year": 2023, "quantity": 5}
+
+        # Act
+        repository.add(book_data)
+        repository.add(book_data)
+
+        # Assert
+        assert not os.path.exists(self.test_file)
+        repository.flush()
+        with open(self.test_file, 'r') as file:
+            assert len(json.load(file)) == 2
+
+    def test_failed_flush_keeps_changes_for_close(self, monkeypatch):
+        """Should keep the window dirty when its snapshot write fails, so close() still saves it"""
+        # Arrange
+        repository = BookInterfaceImplementation(str(self.test_file), commit_interval=60)
+        repository.add({"title": "Test Book", "author": "Test Author", "published_year": 2023, "quantity": 5})
+
+        def fail(books):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(repository, "_write_snapshot", fail)
+
+        # Act
+        with pytest.raises(OSError):
+            repository.flush()
+        monkeypatch.undo()
+        repository.close()
+
+        # Assert
+        with open(self.test_file, 'r') as file:
+            assert [book["title"] for book in json.load(file)] == ["Test Book"]
+
+    def test_commit_timer_reads_store_under_lock(self):
+        """Should give a repository with a commit timer a real lock even when not thread-safe"""
+        # Act
+        repository = BookInterfaceImplementation(str(self.test_file), columnar=True, commit_interval=0.001)
+        for n in range(200):
+            repository.add({"title": f"Book {n}", "author": "Author", "published_year": 2023, "quantity": 1})
+            repository.delete(n)
+        repository.close()
+
+        # Assert
+        assert isinstance(repository._lock, ReadWriteLock)
+        with open(self.test_file, 'r') as file:
+            assert json.load(file) == []
+
+    def test_commit_interval_batches_journal_fsyncs(self, monkeypatch):
+        """Should share one fsync across journal appends in the same window"""
+        # Arrange
+        fsync_calls = []
+        monkeypatch.setattr(os, "fsync", lambda fd: fsync_calls.append(fd))
+        repository = BookInterfaceImplementation(str(self.test_file), journaled=True, commit_interval=60)
+        book_data = {"title": "Test Book", "author": "Test Author", "published_year": 2023, "quantity": 5}
+
+        # Act
+        for _ in range(5):
+            repository.add(book_data)
+        repository.close()
+
+        # Assert
+        assert len(fsync_calls) == 1
+
     # Load from JSON Tests
     def test_load_from_nonexistent_file(self):
         """Should initialize empty library when file doesn't exist"""
@@ -73,6 +151,20 @@ class TestJsonOperations:
         # Assert
         assert len(self.book_interface.books) == 0
         assert self.book_interface.next_id == 0
+        assert self.book_interface.corrupt_snapshot_path is None
+
+    def test_write_after_invalid_json_keeps_original(self):
+        """Should move an unreadable snapshot aside so the next save cannot overwrite it"""
+        # Arrange
+        with open(self.test_file, 'w') as file:
+            file.write('[{"id": 0, "title": "Book 1"')
+        # Act
+        repository = BookInterfaceImplementation(str(self.test_file))
+        repository.add({"title": "New", "author": "Author", "published_year": 2020, "quantity": 1})
+        # Assert
+        with open(repository.corrupt_snapshot_path) as file:
+            assert file.read() == '[{"id": 0, "title": "Book 1"'
+        assert [book.title for book in BookInterfaceImplementation(str(self.test_file)).books] == ["New"]
 
     def test_load_from_empty_file(self):
         """Should load empty library correctly"""
@@ -129,4 +221,6 @@ class TestJsonOperations:
         
         # Assert
         assert len(self.book_interface.books) == 0
-        assert self.book_interface.next_id == 0
\ No newline at end of file
+        assert self.book_interface.next_id == 0
+        with open(self.book_interface.corrupt_snapshot_path) as file:
+            assert file.read() == "Invalid JSON"
@@ -0,0 +1,116 @@
+import asyncio
+import pytest
+from src.Application.Instrumentation.Metrics import LatencyHistogram, MetricsRegistry, instrument
+from src.Application.Interfaces.AsyncBookRepositoryAdapter import AsyncBookRepositoryAdapter
+from src.Application.Interfaces.BookInterfaceImplementation import BookInterfaceImplementation
+from src.Application.Services.AsyncBookServices import AsyncBookServices
+from src.Application.Services.BookServices import BookServices
+from src.Presentation.Controllers.BookController import BookController
+
+BOOK = {"title": "Dune", "author": "Frank Herbert", "published_year": 1965, "quantity": 3}
+
+class TestLatencyHistogram:
+    def test_quantiles_follow_buckets(self):
+        """Should estimate quantiles from bucket bounds, capped at the slowest observation"""
+        # Arrange
+        histogram = LatencyHistogram(bounds=(0.001, 0.01, 0.1))
+        # Act
+        for _ in range(9):
+            histogram.observe(0.0005)
+        histogram.observe(0.05)
+        # Assert
+        assert histogram.quantile(0.5) == 0.001
+        assert histogram.quantile(0.99) == 0.05
+        assert histogram.counts == [9, 0, 1, 0]
+
+class TestMetricsRegistry:
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        """Setup an instrumented controller, service and repository"""
+        self.metrics = MetricsRegistry()
+        self.spans = []
+        self.metrics.add_span_listener(self.spans.append)
+        self.repository = instrument(BookInterfaceImplementation(str(tmp_path / "books.json")), self.metrics, 'repository')
+        self.service = instrument(BookServices(self.repository), self.metrics, 'service')
+        self.controller = instrument(BookController(self.service), self.metrics, 'controller')
+
+    def test_records_every_layer(self):
+        """Should count calls per operation on the controller, service and repository"""
+        # Act
+        book_id = self.controller.create_book(BOOK)
+        self.controller.get_book_by_id(book_id)
+        self.controller.get_book_by_id(book_id)
+        # Assert
+        snapshot = self.metrics.snapshot()
+        assert snapshot["controller.get_book_by_id"]["calls"] == 2
+        assert snapshot["service.read"]["calls"] == 2
+        assert snapshot["repository.read"]["calls"] == 2
+        assert snapshot["service._validate_book_data"]["calls"] == 1
+        assert snapshot["repository._write_snapshot"]["calls"] == 1
+
+    def test_counts_errors(self):
+        """Should count failed calls and still raise the error"""
+        # Act
+        with pytest.raises(ValueError):
+            self.controller.get_book_by_id(99)
+        # Assert
+        assert self.metrics.snapshot()["controller.get_book_by_id"]["errors"] == 1
+        assert isinstance(self.spans[-1].error, ValueError)
+
+    def test_spans_record_parents(self):
+        """Should report nested spans innermost first, each naming its caller"""
+        # Act
+        self.controller.search_books("dune")
+        # Assert
+        assert [(span.name, span.parent) for span in self.spans] == [
+            ("repository._ensure_search_index", "repository.search"),
+            ("repository.search", "service.search"),
+            ("service.search", "controller.search_books"),
+            ("controller.search_books", None),
+        ]
+
+    def test_disabled_registry_records_nothing(self):
+        """Should pass calls straight through while disabled"""
+        # Arrange
+        self.metrics.enabled = False
+        # Act
+        book_id = self.controller.create_book(BOOK)
+        # Assert
+        assert self.controller.get_book_by_id(book_id).title == "Dune"
+        assert self.metrics.snapshot() == {}
+        assert self.spans == []
+
+    def test_instrument_without_registry_returns_target(self):
+        """Should leave objects untouched when there is no registry"""
+        # Arrange
+        controller = BookController(BookServices(self.repository))
+        # Act & Assert
+        assert instrument(controller, None, 'controller') is controller
+
+    def test_export_prometheus(self):
+        """Should export cumulative buckets, sum, count and errors per operation"""
+        # Arrange
+        self.controller.search_books("dune")
+        # Act
+        exported = self.metrics.export_prometheus()
+        # Assert
+        assert '# TYPE book_operation_seconds histogram' in exported
+        assert 'book_operation_seconds_bucket{operation="controller.search_books",le="+Inf"} 1' in exported
+        assert 'book_operation_seconds_count{operation="repository.search"} 1' in exported
+        assert 'book_operation_seconds_errors_total{operation="service.search"} 0' in exported
+        # Each family is one contiguous block under its own TYPE line
+        lines = exported.splitlines()
+        error_lines = [n for n, line in enumerate(lines) if line.startswith("book_operation_seconds_errors_total")]
+        type_line = lines.index("# TYPE book_operation_seconds_errors_total counter")
+        assert error_lines == list(range(type_line + 1, len(lines)))
+
+    def test_times_coroutines(self):
+        """Should time async methods until they complete"""
+        # Arrange
+        backend = BookInterfaceImplementation(self.repository.file_path, thread_safe=True)
+        service = instrument(AsyncBookServices(AsyncBookRepositoryAdapter(backend)), self.metrics, 'async_service')
+        # Act
+        asyncio.run(service.add(BOOK))
+        # Assert
+        assert self.metrics.snapshot()["async_service.add"]["calls"] == 1
+        assert self.spans[-1].name == "async_service.add"
@@ -0,0 +1,80 @@
+import threading
+import time
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+from src.Application.Concurrency.ReadWriteLock import NullReadWriteLock, ReadWriteLock
+
+class TestReadWriteLock:
+    def test_readers_share_the_lock(self):
+        """Should let several readers hold the lock at once"""
+        # Arrange
+        lock = ReadWriteLock()
+        barrier = threading.Barrier(3, timeout=5)
+        def reader():
+            with lock.reading:
+                barrier.wait()
+        threads = [threading.Thread(target=reader) for _ in range(3)]
+        # Act
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+        # Assert
+        assert not barrier.broken
+        assert not any(thread.is_alive() for thread in threads)
+
+    def test_writer_excludes_readers(self):
+        """Should keep readers out until the writer releases"""
+        # Arrange
+        lock = ReadWriteLock()
+        events = []
+        lock.acquire_write()
+        def reader():
+            with lock.reading:
+                events.append("read")
+        thread = threading.Thread(target=reader)
+        # Act
+        thread.start()
+        time.sleep(0.05)
+        events.append("write done")
+        lock.release_write()
+        thread.join(5)
+        # Assert
+        assert events == ["write done", "read"]
+
+    def test_waiting_writer_blocks_new_readers(self):
+        """Should make readers arriving after a waiting writer wait for it"""
+        # Arrange
+        lock = ReadWriteLock()
+        events = []
+        lock.acquire_read()
+        def writer():
+            with lock.writing:
+                events.append("write")
+        def late_reader():
+            with lock.reading:
+                events.append("read")
+        writer_thread = threading.Thread(target=writer)
+        reader_thread = threading.Thread(target=late_reader)
+        # Act
+        writer_thread.start()
+        time.sleep(0.05)
+        reader_thread.start()
+        time.sleep(0.05)
+        lock.release_read()
+        writer_thread.join(5)
+        reader_thread.join(5)
+        # Assert
+        assert events == ["write", "read"]
+
+    def test_null_lock_is_a_no_op(self):
+        """Should allow nesting without blocking"""
+        # Arrange
+        lock = NullReadWriteLock()
+        # Act
+        with lock.writing:
+            with lock.reading:
+                result = True
+        # Assert
+        assert result
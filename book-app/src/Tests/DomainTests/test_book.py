@@ -2,7 +2,7 @@ import pytest
 import sys
 import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
-from src.Domain.Entities.Book import Book
+from src.Domain.Entities.Book import Book, changed_fields
 
 class TestBook:
     def test_create_book(self):
@@ -18,4 +18,22 @@ class TestBook:
     
     def test_create_book_invalid_year_type(self):
         with pytest.raises(ValueError, match="Published year must be a positive integer."):
-            Book("Test Book", "Test Author", "invalid_year", "2")
\ No newline at end of file
+            Book("Test Book", "Test Author", "invalid_year", "2")
+
+    def test_book_is_frozen(self):
+        book = Book("Test Book", "Test Author", 2023, 2)
+        with pytest.raises(AttributeError):
+            book.quantity = 5
+
+    def test_book_has_no_instance_dict(self):
+        book = Book("Test Book", "Test Author", 2023, 2)
+        assert not hasattr(book, "__dict__")
+
+    def test_changed_fields_keeps_only_differences(self):
+        book = Book("Test Book", "Test Author", 2023, 2, id=1)
+        changes = changed_fields(book, {"title": "Test Book", "quantity": 3, "id": 5, "extra": 1})
+        assert changes == {"quantity": 3}
+
+    def test_changed_fields_compares_types(self):
+        book = Book("Test Book", "Test Author", 2023, 1)
+        assert changed_fields(book, {"quantity": True}) == {"quantity": True}
@@ -0,0 +1,40 @@
+import pytest
+from src.Domain.Validation.BookSchema import BOOK_SCHEMA, is_non_empty_string, is_non_negative_integer, is_positive_integer
+
+VALID_ROW = {"title": "Dune", "author": "Frank Herbert", "published_year": 1965, "quantity": 2}
+
+class TestBookSchema:
+    def test_predicates(self):
+        assert is_non_empty_string("Dune")
+        assert not is_non_empty_string("   ")
+        assert not is_non_empty_string(5)
+        assert is_positive_integer(1) and not is_positive_integer(0)
+        assert is_non_negative_integer(0) and not is_non_negative_integer(-1)
+        assert not is_positive_integer("1")
+
+    def test_validate_accepts_valid_rows(self):
+        BOOK_SCHEMA.validate(VALID_ROW)
+        BOOK_SCHEMA.validate({"quantity": 0}, is_update=True)
+
+    def test_validate_reports_missing_fields_in_schema_order(self):
+        with pytest.raises(ValueError, match="Missing required fields: author, quantity"):
+            BOOK_SCHEMA.validate({"title": "Dune", "published_year": 1965})
+
+    def test_validate_raises_first_field_error(self):
+        with pytest.raises(ValueError, match="Published_year must be a positive integer"):
+            BOOK_SCHEMA.validate({**VALID_ROW, "published_year": 0, "quantity": -1})
+
+    def test_errors_lists_every_problem(self):
+        errors = BOOK_SCHEMA.errors({"title": "", "quantity": -1})
+        assert errors == [
+            "Missing required fields: author, published_year",
+            "Title must be a non-empty string",
+            "Quantity must be a non-negative integer"
+        ]
+
+    def test_validate_batch_reports_only_invalid_rows(self):
+        rows = [VALID_ROW, {**VALID_ROW, "author": " "}, VALID_ROW, {"quantity": "3"}]
+        assert BOOK_SCHEMA.validate_batch(rows, is_update=True) == {
+            1: ["Author must be a non-empty string"],
+            3: ["Quantity must be a non-negative integer"]
+        }
@@ -0,0 +1,58 @@
+import pytest
+import os
+from src.Infrastructure.Persistence.AtomicFile import atomic_write
+
+class TestAtomicFile:
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        """Setup test environment before each test"""
+        self.tmp_path = tmp_path
+        self.test_file = tmp_path / "test_books.json"
+
+    def test_write_creates_file(self):
+        """Should create the target file with the written content"""
+        # Act
+        with atomic_write(str(self.test_file)) as file:
+            file.write("[]")
+        # Assert
+        assert self.test_file.read_text() == "[]"
+        assert os.listdir(self.tmp_path) == ["test_books.json"]
+
+    def test_failed_write_keeps_original(self):
+        """Should leave the previous file untouched and remove the temp file on failure"""
+        # Arrange
+        self.test_file.write_text("original")
+        # Act
+        with pytest.raises(RuntimeError):
+            with atomic_write(str(self.test_file)) as file:
+                file.write("partial")
+                raise RuntimeError("crash mid-dump")
+        # Assert
+        assert self.test_file.read_text() == "original"
+        assert os.listdir(self.tmp_path) == ["test_books.json"]
+
+    @pytest.mark.skipif(os.name != "posix", reason="POSIX permission bits")
+    def test_replace_keeps_file_mode(self):
+        """Should give the new file the permissions of the one it replaces"""
+        # Arrange
+        self.test_file.write_text("original")
+        os.chmod(self.test_file, 0o644)
+        # Act
+        with atomic_write(str(self.test_file)) as file:
+            file.write("[]")
+        # Assert
+        assert self.test_file.stat().st_mode & 0o777 == 0o644
+
+    @pytest.mark.skipif(os.name != "posix", reason="POSIX permission bits")
+    def test_new_file_follows_umask(self):
+        """Should create a new file with the mode open() would give it rather than 0600"""
+        # Arrange
+        umask = os.umask(0o022)
+        os.umask(umask)
+        reference = self.tmp_path / "reference"
+        reference.write_text("")
+        # Act
+        with atomic_write(str(self.test_file)) as file:
+            file.write("[]")
+        # Assert
+        assert self.test_file.stat().st_mode & 0o777 == reference.stat().st_mode & 0o777
@@ -0,0 +1,79 @@
+import pytest
+from src.Infrastructure.Storage.BookColumnStore import BookColumnStore
+from src.Application.Interfaces.BookInterfaceImplementation import BookInterfaceImplementation
+from src.Domain.Entities.Book import Book
+
+class TestBookColumnStore:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup test environment before each test"""
+        self.store = BookColumnStore(
+            Book(title=f"Book {i}", author="Author", published_year=2000 + i, quantity=i, id=i) for i in range(4)
+        )
+
+    def test_get_and_iterate(self):
+        """Should return books rebuilt from the columns in id order"""
+        assert self.store[2] == Book(title="Book 2", author="Author", published_year=2002, quantity=2, id=2)
+        assert list(self.store) == [0, 1, 2, 3]
+        assert [book.id for book in self.store.values()] == [0, 1, 2, 3]
+
+    def test_missing_ids(self):
+        """Should behave like a mapping for unknown IDs"""
+        assert self.store.get(99) is None
+        assert 99 not in self.store
+        assert self.store.pop(99, None) is None
+        with pytest.raises(KeyError):
+            self.store[99]
+
+    def test_overwrite_in_place(self):
+        """Should replace a row without moving it"""
+        self.store[1] = Book(title="Edited", author="Other", published_year=1999, quantity=7, id=1)
+        assert [book.title for book in self.store.values()] == ["Book 0", "Edited", "Book 2", "Book 3"]
+        assert len(self.store) == 4
+
+    def test_delete_and_compact(self):
+        """Should hide deleted rows and keep lookups working after compaction"""
+        del self.store[0]
+        del self.store[1]
+        del self.store[2]
+        assert list(self.store) == [3]
+        assert len(self.store) == 1
+        assert self.store[3].quantity == 3
+        self.store[4] = Book(title="Book 4", author="Author", published_year=2004, quantity=4, id=4)
+        assert list(self.store) == [3, 4]
+
+    def test_oversized_numbers_leave_store_unchanged(self):
+        """Should reject a value too large for its column without writing part of the row"""
+        with pytest.raises(ValueError, match="too large"):
+            self.store[4] = Book(title="Book 4", author="Author", published_year=2004, quantity=2 ** 64, id=4)
+        with pytest.raises(ValueError, match="too large"):
+            self.store[1] = Book(title="Edited", author="Author", published_year=2 ** 64, quantity=1, id=1)
+        assert list(self.store) == [0, 1, 2, 3]
+        assert len(self.store) == 4
+        assert self.store[1].title == "Book 1"
+
+    def test_repository_add_many_reports_oversized_row(self, tmp_path):
+        """Should turn an oversized value into a failed row and keep the other rows"""
+        repository = BookInterfaceImplementation(str(tmp_path / "books.json"), columnar=True)
+        results = repository.add_many([
+            {"title": "Big", "author": "Author", "published_year": 2020, "quantity": 2 ** 64},
+            {"title": "Small", "author": "Author", "published_year": 2020, "quantity": 1}
+        ])
+        assert [result.success for result in results] == [False, True]
+        assert [book.title for book in repository.browse()] == ["Small"]
+
+    def test_interns_authors(self):
+        """Should share one string object per distinct author"""
+        self.store[10] = Book(title="Book 10", author="".join(["Aut", "hor"]), published_year=2010, quantity=1, id=10)
+        assert self.store[10].author is self.store[0].author
+
+    def test_repository_columnar_mode(self, tmp_path):
+        """Should serve the repository interface from the column store"""
+        repository = BookInterfaceImplementation(str(tmp_path / "books.json"), columnar=True)
+        book_id = repository.add({"title": "Dune", "author": "Frank Herbert", "published_year": 1965, "quantity": 1})
+        repository.edit(book_id, {"quantity": 4})
+        assert isinstance(repository._books, BookColumnStore)
+        assert repository.read(book_id).quantity == 4
+        assert [book.title for book in repository.search("dune")] == ["Dune"]
+        reloaded = BookInterfaceImplementation(str(tmp_path / "books.json"), columnar=True)
+        assert reloaded.browse() == repository.browse()
@@ -0,0 +1,97 @@
+import pytest
+import json
+import os
+from src.Application.Interfaces.BookInterfaceImplementation import BookInterfaceImplementation
+from src.Infrastructure.Persistence.BookJournal import BookJournal
+
+class TestBookJournal:
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        """Setup test environment before each test"""
+        self.test_file = tmp_path / "test_books.json"
+        self.journal_file = tmp_path / "test_books.json.journal"
+        self.book_data = {"title": "Test Book", "author": "Test Author", "published_year": 2023, "quantity": 5}
+
+    def _repository(self, **kwargs):
+        return BookInterfaceImplementation(str(self.test_file), journaled=True, **kwargs)
+
+    # Journal Tests
+    def test_append_and_replay(self):
+        """Should replay appended records in order"""
+        # Arrange
+        journal = BookJournal(str(self.journal_file))
+        journal.append({"op": "delete", "id": 1})
+        journal.append({"op": "delete", "id": 2})
+        journal.close()
+        # Act
+        records = list(BookJournal(str(self.journal_file)).replay())
+        # Assert
+        assert [record["id"] for record in records] == [1, 2]
+
+    def test_replay_skips_torn_line(self):
+        """Should ignore a partially written record and keep appending after it"""
+        # Arrange
+        with open(self.journal_file, 'w') as file:
+            file.write('{"op":"delete","id":1}\n{"op":"del')
+        journal = BookJournal(str(self.journal_file))
+        # Act
+        journal.append({"op": "delete", "id": 2})
+        journal.close()
+        # Assert
+        assert [record["id"] for record in journal.replay()] == [1, 2]
+
+    # Journaled Repository Tests
+    def test_mutations_append_instead_of_rewriting_snapshot(self):
+        """Should append one record per mutation without writing the snapshot"""
+        # Act
+        repository = self._repository()
+        book_id = repository.add(self.book_data)
+        repository.edit(book_id, {"quantity": 7})
+        repository.delete(book_id)
+        repository.close()
+        # Assert
+        assert not os.path.exists(self.test_file)
+        with open(self.journal_file, 'r') as file:
+            assert [json.loads(line)["op"] for line in file] == ["add", "patch", "delete"]
+
+    def test_edit_journals_only_changed_fields(self):
+        """Should journal the changed fields of an edit and nothing for a no-op edit"""
+        # Arrange
+        repository = self._repository()
+        book_id = repository.add(self.book_data)
+        # Act
+        repository.edit(book_id, {**self.book_data, "quantity": 7})
+        repository.edit(book_id, {"quantity": 7})
+        repository.close()
+        # Assert
+        with open(self.journal_file, 'r') as file:
+            records = [json.loads(line) for line in file]
+        assert records[1:] == [{"op": "patch", "id": book_id, "changes": {"quantity": 7}}]
+
+    def test_load_replays_snapshot_and_journal(self):
+        """Should rebuild state from the snapshot plus the journal"""
+        # Arrange
+        repository = self._repository()
+        first_id = repository.add(self.book_data)
+        repository.compact()
+        second_id = repository.add({**self.book_data, "title": "Second"})
+        repository.edit(first_id, {"quantity": 9})
+        repository.close()
+        # Act
+        reloaded = self._repository()
+        # Assert
+        assert [book.id for book in reloaded.browse()] == [first_id, second_id]
+        assert reloaded.read(first_id).quantity == 9
+        assert reloaded.next_id == second_id + 1
+
+    def test_compaction_threshold_folds_journal(self):
+        """Should fold the journal into the snapshot once the threshold is reached"""
+        # Arrange
+        repository = self._repository(compaction_threshold=2)
+        # Act
+        repository.add(self.book_data)
+        repository.add(self.book_data)
+        # Assert
+        assert not os.path.exists(self.journal_file)
+        with open(self.test_file, 'r') as file:
+            assert len(json.load(file)) == 2
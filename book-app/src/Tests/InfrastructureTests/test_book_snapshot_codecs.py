@@ -0,0 +1,142 @@
+import pytest
+import io
+import struct
+from src.Infrastructure.Persistence.BookSnapshotCodecs import (
+    BookSnapshotCodec, MappedBookTable, SnapshotFormatError, TextSnapshotCodec, get_codec
+)
+from src.Infrastructure.Storage.LazyBookStore import LazyBookStore
+from src.Application.Interfaces.BookInterfaceImplementation import BookInterfaceImplementation
+from src.Domain.Entities.Book import Book
+
+class TestBookSnapshotCodecs:
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        """Setup test environment before each test"""
+        self.tmp_path = tmp_path
+        self.books = [
+            Book(title="Café", author="Author 1", published_year=2021, quantity=1, id=0),
+            Book(title="Book 2", author="Åuthor 2", published_year=2022, quantity=2, id=3),
+            Book(title="Book 3", author="Author 3", published_year=2023, quantity=3, id=7)
+        ]
+
+    def _write(self, codec_name, books):
+        codec = get_codec(codec_name)
+        file_path = self.tmp_path / f"books.{codec_name}"
+        with open(file_path, 'wb' if codec.binary else 'w', **({} if codec.binary else {"encoding": "utf-8"})) as file:
+            codec.dump(books, file)
+        return codec, file_path
+
+    @pytest.mark.parametrize("codec_name", ["json", "jsonl", "binary"])
+    def test_round_trip(self, codec_name):
+        """Should load back exactly the books that were dumped"""
+        codec, file_path = self._write(codec_name, self.books)
+        with open(file_path, 'rb' if codec.binary else 'r', **({} if codec.binary else {"encoding": "utf-8"})) as file:
+            assert list(codec.load(file)) == self.books
+
+    @pytest.mark.parametrize("codec_name", ["json", "jsonl"])
+    @pytest.mark.parametrize("count", [0, 1, 3])
+    def test_dump_encoded_matches_dump(self, codec_name, count):
+        """Should write the same bytes from per-record encodings as from a whole dump"""
+        codec = get_codec(codec_name)
+        whole, pieces = io.StringIO(), io.StringIO()
+        codec.dump(self.books[:count], whole)
+        codec.dump_encoded([codec.encode(book) for book in self.books[:count]], pieces)
+        assert pieces.getvalue() == whole.getvalue()
+
+    @pytest.mark.parametrize("codec_name", ["json", "jsonl"])
+    def test_index_and_decode_single_record(self, codec_name):
+        """Should locate each record and decode it on its own"""
+        codec, file_path = self._write(codec_name, self.books)
+        data = file_path.read_bytes()
+        with open(file_path, 'rb') as file:
+            index = list(codec.index(file))
+        assert [book_id for book_id, _, _ in index] == [0, 3, 7]
+        assert [codec.decode(data[start:end]) for _, start, end in index] == self.books
+
+    def test_only_text_codecs_have_record_operations(self):
+        """Should keep per-record encoding and byte ranges on text codecs, which lazy stores require"""
+        assert isinstance(get_codec("json"), TextSnapshotCodec)
+        assert not isinstance(get_codec("binary"), TextSnapshotCodec)
+        assert not hasattr(get_codec("binary"), "encode")
+        with pytest.raises(ValueError, match="text codec"):
+            LazyBookStore(str(self.tmp_path / "books.binary"), get_codec("binary"))
+        with pytest.raises(TypeError):
+            BookSnapshotCodec()
+
+    def test_unknown_codec(self):
+        """Should reject unknown codec names"""
+        with pytest.raises(ValueError):
+            get_codec("xml")
+
+    # Mapped Table Tests
+    def test_mapped_table_random_access(self):
+        """Should read and binary-search records without decoding the whole file"""
+        _, file_path = self._write("binary", self.books)
+        table = MappedBookTable.open(str(file_path))
+        assert len(table) == 3
+        assert table.max_id == 7
+        assert table.ids_sorted
+        assert table.book_at(table.find(3)) == self.books[1]
+        assert table.find(4) is None
+        table.close()
+
+    def test_mapped_table_unsorted_ids(self):
+        """Should still find records when ids are not ascending"""
+        _, file_path = self._write("binary", list(reversed(self.books)))
+        table = MappedBookTable.open(str(file_path))
+        assert not table.ids_sorted
+        assert table.book_at(table.find(0)) == self.books[0]
+        table.close()
+
+    def test_binary_codec_stores_64_bit_numbers(self):
+        """Should round-trip years beyond 32 bits and reject numbers beyond 64 with a clear error"""
+        codec = get_codec("binary")
+        book = Book(title="Far future", author="Author", published_year=2 ** 40, quantity=1, id=0)
+        buffer = io.BytesIO()
+        codec.dump([book], buffer)
+        assert list(MappedBookTable(buffer.getvalue())) == [book]
+        with pytest.raises(ValueError, match="Book with ID 0 has a number too large"):
+            codec.dump([Book(title="Book", author="Author", published_year=2020, quantity=2 ** 64, id=0)], io.BytesIO())
+
+    def test_mapped_table_reads_version_1_files(self):
+        """Should still read snapshots written with the 32-bit year layout"""
+        data = (
+            struct.pack('<4sB3xqQ', b"BKS1", 1, 0, 1)
+            + struct.pack('<qiqQII', 0, 2021, 1, 0, len("Café".encode()), len("Author 1"))
+            + "Café".encode() + b"Author 1"
+        )
+        assert list(MappedBookTable(data)) == [self.books[0]]
+
+    @pytest.mark.parametrize("data", [b"", b"BKS1", b"XXXX" + bytes(20)])
+    def test_mapped_table_rejects_invalid_files(self, data):
+        """Should raise SnapshotFormatError for truncated or foreign files"""
+        file_path = self.tmp_path / "invalid.bin"
+        file_path.write_bytes(data)
+        with pytest.raises(SnapshotFormatError):
+            MappedBookTable.open(str(file_path))
+
+    # Repository Tests
+    @pytest.mark.parametrize("codec_name", ["jsonl", "binary"])
+    @pytest.mark.parametrize("lazy", [False, True])
+    def test_repository_codecs(self, codec_name, lazy):
+        """Should persist and reload through the selected codec"""
+        file_path = str(self.tmp_path / "books.snapshot")
+        repository = BookInterfaceImplementation(file_path, codec=codec_name)
+        for book in self.books:
+            repository.add({"title": book.title, "author": book.author, "published_year": book.published_year, "quantity": book.quantity})
+        repository.delete(1)
+        reloaded = BookInterfaceImplementation(file_path, codec=codec_name, lazy=lazy)
+        assert reloaded.browse() == repository.browse()
+        assert reloaded.next_id == 3
+        assert reloaded.edit(2, {"quantity": 9})
+        assert reloaded.add({"title": "New", "author": "Author", "published_year": 2024, "quantity": 1}) == 3
+        reloaded.close()
+        final = BookInterfaceImplementation(file_path, codec=codec_name)
+        assert [(book.id, book.quantity) for book in final.browse()] == [(0, 1), (2, 9), (3, 1)]
+
+    def test_repository_invalid_binary_snapshot(self):
+        """Should start empty when the binary snapshot is unreadable"""
+        file_path = self.tmp_path / "books.bin"
+        file_path.write_bytes(b"garbage")
+        repository = BookInterfaceImplementation(str(file_path), codec="binary")
+        assert repository.browse() == []
@@ -0,0 +1,28 @@
+import pytest
+import io
+import json
+from src.Infrastructure.Persistence.BookStreamLoader import iter_json_array
+
+class TestBookStreamLoader:
+    def test_streams_elements_across_chunks(self):
+        """Should yield every element even when records span chunk boundaries"""
+        data = [{"id": i, "title": "x" * i} for i in range(20)]
+        text = json.dumps(data, indent=4)
+        result = [value for _, _, value in iter_json_array(io.StringIO(text), chunk_size=7)]
+        assert result == data
+
+    def test_reports_element_offsets(self):
+        """Should report offsets that slice back to each element"""
+        text = json.dumps([{"id": 0}, {"id": 1, "title": "é"}], indent=4, ensure_ascii=False)
+        for start, end, value in iter_json_array(io.StringIO(text), chunk_size=5):
+            assert json.loads(text[start:end]) == value
+
+    def test_empty_array(self):
+        """Should yield nothing for an empty array"""
+        assert list(iter_json_array(io.StringIO(" [ ] "))) == []
+
+    @pytest.mark.parametrize("text", ["", "Invalid JSON", "{}", "[{\"id\": 0},", "[1 2]"])
+    def test_invalid_documents(self, text):
+        """Should raise JSONDecodeError for anything but a complete array"""
+        with pytest.raises(json.JSONDecodeError):
+            list(iter_json_array(io.StringIO(text), chunk_size=3))
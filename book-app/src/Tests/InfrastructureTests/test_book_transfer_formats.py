@@ -0,0 +1,82 @@
+import pytest
+import gzip
+import io
+import json
+from src.Domain.Entities.Book import Book
+from src.Infrastructure.Persistence.BookTransferFormats import (
+    BookTransferFormat, get_transfer_format, infer_transfer_format, open_export, open_import, write_books
+)
+
+BOOKS = [
+    Book(id=0, title="Dune", author="Frank Herbert", published_year=1965, quantity=2),
+    Book(id=1, title='War, "Peace"', author="Leo Tolstoy", published_year=1869, quantity=0),
+    Book(id=2, title="Émile", author="Rousseau", published_year=1762, quantity=1),
+]
+
+def _export(format_name, compress=False, chunk_size=2):
+    output = io.BytesIO()
+    with open_export(output, compress) as file:
+        written = write_books(iter(BOOKS), file, get_transfer_format(format_name), chunk_size)
+    assert written == len(BOOKS)
+    return output.getvalue()
+
+def _import(data, format_name=None):
+    with open_import(io.BytesIO(data), format_name) as rows:
+        return list(rows)
+
+class TestBookTransferFormats:
+    @pytest.mark.parametrize("format_name", ["csv", "jsonl"])
+    @pytest.mark.parametrize("compress", [False, True])
+    def test_round_trip(self, format_name, compress):
+        """Should read back every book written in chunks, detecting format and gzip from the data"""
+        rows = _import(_export(format_name, compress))
+        assert [Book(**row) for row in rows] == BOOKS
+
+    def test_csv_layout(self):
+        """Should write a header and quote fields that need it"""
+        lines = _export("csv").decode("utf-8").splitlines()
+        assert lines[0] == "id,title,author,published_year,quantity"
+        assert lines[2] == '1,"War, ""Peace""",Leo Tolstoy,1869,0'
+
+    def test_csv_leaves_bad_numbers_for_validation(self):
+        """Should convert whole numbers only and drop an empty id"""
+        rows = _import(b"id,title,author,published_year,quantity\n,Dune,Frank Herbert,nineteen,2\n", "csv")
+        assert rows == [{"title": "Dune", "author": "Frank Herbert", "published_year": "nineteen", "quantity": 2}]
+
+    def test_csv_keeps_unparsable_digit_strings(self):
+        """Should leave strings that look numeric but are not integers for validation"""
+        rows = _import("id,title,author,published_year,quantity\n,Dune,Frank Herbert,²,--5\n".encode(), "csv")
+        assert rows == [{"title": "Dune", "author": "Frank Herbert", "published_year": "²", "quantity": "--5"}]
+
+    def test_transfer_format_base_is_abstract(self):
+        """Should require formats to implement chunk encoding and row reading"""
+        with pytest.raises(TypeError):
+            BookTransferFormat()
+
+    def test_jsonl_reader_accepts_json_array(self):
+        """Should stream the Books.json array layout as rows"""
+        data = json.dumps([{"title": "Dune"}, {"title": "Emma"}], indent=4).encode()
+        assert _import(data) == [{"title": "Dune"}, {"title": "Emma"}]
+
+    def test_jsonl_rejects_non_objects(self):
+        """Should name the row that is not a JSON object"""
+        with pytest.raises(ValueError, match="Row 2"):
+            _import(b'{"title": "Dune"}\n[1]\n', "jsonl")
+
+    def test_path_export_is_gzipped_by_suffix(self, tmp_path):
+        """Should infer format and compression from the file name"""
+        path = str(tmp_path / "books.csv.gz")
+        assert infer_transfer_format(path) == ("csv", True)
+        assert infer_transfer_format("books.txt") == (None, False)
+        with open_export(path, compress=True) as file:
+            write_books(BOOKS, file, get_transfer_format("csv"))
+        with gzip.open(path, "rt", encoding="utf-8") as file:
+            assert file.readline() == "id,title,author,published_year,quantity\n"
+        with open_import(path) as rows:
+            assert [row["title"] for row in rows] == ["Dune", 'War, "Peace"', "Émile"]
+
+    def test_compressed_export_needs_binary_stream(self):
+        """Should refuse to gzip into a text stream"""
+        with pytest.raises(ValueError):
+            with open_export(io.StringIO(), compress=True):
+                pass
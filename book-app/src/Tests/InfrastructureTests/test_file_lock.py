@@ -0,0 +1,66 @@
+import multiprocessing
+import os
+import threading
+import time
+import pytest
+from src.Infrastructure.Persistence.FileLock import FileLock, file_signature
+
+pytestmark = pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="needs the fork start method"
+)
+
+def _hold_lock(lock_path, ready, release):
+    lock = FileLock(lock_path)
+    with lock.exclusive():
+        ready.set()
+        release.wait(5)
+
+class TestFileLock:
+    def test_exclusive_lock_blocks_other_processes(self, tmp_path):
+        """Should make a second process wait until the holder releases the lock"""
+        # Arrange
+        lock_path = str(tmp_path / "books.json.lock")
+        context = multiprocessing.get_context("fork")
+        ready, release = context.Event(), context.Event()
+        holder = context.Process(target=_hold_lock, args=(lock_path, ready, release))
+        holder.start()
+        ready.wait(5)
+        # Act
+        started = time.monotonic()
+        threading.Timer(0.2, release.set).start()
+        with FileLock(lock_path).exclusive():
+            waited = time.monotonic() - started
+        holder.join(5)
+        # Assert
+        assert waited >= 0.15
+
+    def test_shared_locks_do_not_block_each_other(self, tmp_path):
+        """Should let two lock objects hold the shared lock together"""
+        # Arrange
+        first = FileLock(str(tmp_path / "books.json.lock"))
+        second = FileLock(str(tmp_path / "books.json.lock"))
+        # Act
+        with first.shared():
+            with second.shared():
+                result = True
+        first.close()
+        second.close()
+        # Assert
+        assert result
+
+    def test_file_signature_tracks_replacement(self, tmp_path):
+        """Should change when the file is replaced and be None when it is missing"""
+        # Arrange
+        path = tmp_path / "books.json"
+        missing = file_signature(str(path))
+        path.write_text("[]")
+        before = file_signature(str(path))
+        replacement = tmp_path / "books.json.tmp"
+        replacement.write_text("[]")
+        # Act
+        os.replace(replacement, path)
+        after = file_signature(str(path))
+        # Assert
+        assert missing is None
+        assert before != after
+        assert file_signature(str(path)) == after
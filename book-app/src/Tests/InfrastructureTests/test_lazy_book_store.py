@@ -0,0 +1,52 @@
+import pytest
+import json
+from src.Infrastructure.Storage.LazyBookStore import LazyBookStore
+from src.Application.Interfaces.BookInterfaceImplementation import BookInterfaceImplementation
+from src.Domain.Entities.Book import Book
+
+class TestLazyBookStore:
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        """Setup test environment before each test"""
+        self.test_file = tmp_path / "test_books.json"
+        books = [
+            {"id": 0, "title": "Café", "author": "Author 1", "published_year": 2021, "quantity": 1},
+            {"id": 1, "title": "Book 2", "author": "Author 2", "published_year": 2022, "quantity": 2},
+            {"id": 5, "title": "Book 3", "author": "Author 3", "published_year": 2023, "quantity": 3}
+        ]
+        self.test_file.write_text(json.dumps(books, indent=4, ensure_ascii=False), encoding="utf-8")
+
+    def test_indexes_without_materializing(self):
+        """Should know every ID before any record is parsed into a Book"""
+        store = LazyBookStore.index_file(str(self.test_file))
+        assert list(store) == [0, 1, 5]
+        assert store.materialized_count == 0
+
+    def test_materializes_on_access(self):
+        """Should parse a record, including non-ASCII text, the first time it is read"""
+        store = LazyBookStore.index_file(str(self.test_file))
+        assert store[0] == Book(title="Café", author="Author 1", published_year=2021, quantity=1, id=0)
+        assert store.get(5).quantity == 3
+        assert store.materialized_count == 2
+
+    def test_values_materializes_everything(self):
+        """Should return all books in file order"""
+        store = LazyBookStore.index_file(str(self.test_file))
+        assert [book.id for book in store.values()] == [0, 1, 5]
+        assert store.materialized_count == 3
+
+    def test_repository_lazy_mode(self):
+        """Should serve reads and writes through the lazy store"""
+        repository = BookInterfaceImplementation(str(self.test_file), lazy=True)
+        assert repository.next_id == 6
+        assert repository.read(1).title == "Book 2"
+        assert repository._books.materialized_count == 1
+        assert repository.delete(5)
+        assert repository.add({"title": "New", "author": "Author", "published_year": 2024, "quantity": 1}) == 6
+        reloaded = BookInterfaceImplementation(str(self.test_file))
+        assert [book.title for book in reloaded.browse()] == ["Café", "Book 2", "New"]
+
+    def test_lazy_and_columnar_are_exclusive(self):
+        """Should reject combining the lazy and columnar stores"""
+        with pytest.raises(ValueError):
+            BookInterfaceImplementation(str(self.test_file), lazy=True, columnar=True)
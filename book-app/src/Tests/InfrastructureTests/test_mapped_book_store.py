@@ -0,0 +1,42 @@
+import pytest
+from src.Infrastructure.Persistence.BookSnapshotCodecs import BinaryBookCodec
+from src.Infrastructure.Storage.MappedBookStore import MappedBookStore
+from src.Domain.Entities.Book import Book
+
+class TestMappedBookStore:
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        """Setup test environment before each test"""
+        file_path = tmp_path / "books.bin"
+        with open(file_path, 'wb') as file:
+            BinaryBookCodec().dump([
+                Book(title=f"Book {i}", author="Author", published_year=2000 + i, quantity=i, id=i) for i in range(4)
+            ], file)
+        self.store = MappedBookStore.open(str(file_path))
+        yield
+        self.store.close()
+
+    def test_reads_from_the_map(self):
+        """Should serve records straight from the snapshot"""
+        assert len(self.store) == 4
+        assert self.store[2].title == "Book 2"
+        assert self.store.get(9) is None
+        assert self.store.max_id() == 3
+
+    def test_overlays_changes_in_order(self):
+        """Should apply edits, deletes and additions on top of the snapshot"""
+        self.store[1] = Book(title="Edited", author="Author", published_year=2001, quantity=8, id=1)
+        del self.store[2]
+        self.store[4] = Book(title="Book 4", author="Author", published_year=2004, quantity=4, id=4)
+        assert list(self.store) == [0, 1, 3, 4]
+        assert [book.title for book in self.store.values()] == ["Book 0", "Edited", "Book 3", "Book 4"]
+        assert 2 not in self.store
+        assert self.store.max_id() == 4
+
+    def test_delete_missing(self):
+        """Should raise KeyError for unknown or already deleted ids"""
+        del self.store[0]
+        with pytest.raises(KeyError):
+            del self.store[0]
+        with pytest.raises(KeyError):
+            del self.store[99]
@@ -0,0 +1,80 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, Mock
+from src.Presentation.Controllers.AsyncBookController import AsyncBookController
+from src.Application.Services.AsyncBookServices import AsyncBookServices
+from src.Domain.Entities.Book import Book
+from src.Domain.Entities.BulkResult import BulkResult
+
+class TestAsyncBookController:
+    @pytest.fixture
+    def mock_service(self):
+        """Create a mock AsyncBookServices instance"""
+        return AsyncMock(spec=AsyncBookServices)
+
+    @pytest.fixture
+    def controller(self, mock_service):
+        """Create an AsyncBookController instance with mock service"""
+        return AsyncBookController(mock_service)
+
+    def test_get_all_books(self, controller, mock_service):
+        """Test getting all books"""
+        mock_books = [Book(title="Book 1", author="Author 1", published_year=2020, quantity=1, id=0)]
+        mock_service.browse.return_value = mock_books
+        result = asyncio.run(controller.get_all_books())
+        assert result == mock_books
+        mock_service.browse.assert_awaited_once_with()
+
+    def test_get_books_page(self, controller, mock_service):
+        """Test getting a page of books"""
+        mock_service.browse.return_value = []
+        asyncio.run(controller.get_books_page(offset=5, limit=10, after_id=3))
+        mock_service.browse.assert_awaited_once_with(5, 10, 3)
+
+    def test_iter_books(self, controller, mock_service):
+        """Test streaming books from the service"""
+        async def books():
+            yield Book(title="Book 1", author="Author 1", published_year=2020, quantity=1, id=0)
+        mock_service.iter_books = Mock(return_value=books())
+        result = asyncio.run(self._collect(controller.iter_books(limit=1)))
+        assert [book.id for book in result] == [0]
+        mock_service.iter_books.assert_called_once_with(0, 1, None)
+
+    def test_get_book_by_id_not_found(self, controller, mock_service):
+        """Test that service errors propagate"""
+        mock_service.read.side_effect = ValueError("Book with ID 1 not found")
+        with pytest.raises(ValueError, match="Book with ID 1 not found"):
+            asyncio.run(controller.get_book_by_id(1))
+
+    def test_search_books(self, controller, mock_service):
+        """Test searching books"""
+        mock_service.search.return_value = []
+        asyncio.run(controller.search_books("tolkien"))
+        mock_service.search.assert_awaited_once_with("tolkien")
+
+    def test_create_update_delete_book(self, controller, mock_service):
+        """Test single-book mutations"""
+        book_data = {"title": "Book", "author": "Author", "published_year": 2020, "quantity": 1}
+        mock_service.add.return_value = 7
+        mock_service.edit.return_value = True
+        mock_service.delete.return_value = True
+        assert asyncio.run(controller.create_book(book_data)) == 7
+        assert asyncio.run(controller.update_book(7, {"quantity": 2}))
+        assert asyncio.run(controller.delete_book(7))
+        mock_service.add.assert_awaited_once_with(book_data)
+        mock_service.edit.assert_awaited_once_with(7, {"quantity": 2})
+        mock_service.delete.assert_awaited_once_with(7)
+
+    def test_bulk_operations(self, controller, mock_service):
+        """Test bulk mutations"""
+        results = [BulkResult(index=0, success=True, book_id=1)]
+        mock_service.add_many.return_value = results
+        mock_service.edit_many.return_value = results
+        mock_service.delete_many.return_value = results
+        assert asyncio.run(controller.create_books([{}])) == results
+        assert asyncio.run(controller.update_books([{"id": 1}])) == results
+        assert asyncio.run(controller.delete_books([1])) == results
+
+    @staticmethod
+    async def _collect(books):
+        return [book async for book in books]
@@ -0,0 +1,96 @@
+import io
+import json
+import pytest
+from src.Application.Interfaces.BookInterfaceImplementation import BookInterfaceImplementation
+from src.Application.Services.BookServices import BookServices
+from src.Presentation.Cli.BookCommandLine import BookCommandLine
+from src.Presentation.Controllers.BookController import BookController
+
+BOOKS = [
+    {"title": "Dune", "author": "Frank Herbert", "published_year": 1965, "quantity": 2},
+    {"title": "Emma", "author": "Jane Austen", "published_year": 1815, "quantity": 1},
+    {"title": "Ulysses", "author": "James Joyce", "published_year": 1922, "quantity": 4},
+]
+
+class TestBookCommandLine:
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        """Create a catalogue and a command line that records how controllers are created"""
+        self.tmp_path = tmp_path
+        self.file_path = str(tmp_path / "books.json")
+        BookInterfaceImplementation(self.file_path).add_many(BOOKS)
+        self.lazy_flags = []
+
+    def _controller(self, lazy=False, **options):
+        self.lazy_flags.append(lazy)
+        return BookController(BookServices(BookInterfaceImplementation(self.file_path, lazy=lazy)))
+
+    def _run(self, argv, stdin=""):
+        stdout = io.StringIO()
+        status = BookCommandLine(self._controller, stdin=io.StringIO(stdin), stdout=stdout).run(argv)
+        return status, stdout.getvalue().splitlines()
+
+    def test_list_pages_lazily(self):
+        """Should print one page of books as JSON lines from a lazily opened catalogue"""
+        status, lines = self._run(["list", "--offset", "1", "--limit", "1"])
+        assert status == 0
+        assert [json.loads(line)["title"] for line in lines] == ["Emma"]
+        assert self.lazy_flags == [True]
+
+    def test_get_missing_book_fails(self, capsys):
+        """Should report an unknown ID on stderr and exit with 1"""
+        status, lines = self._run(["get", "99"])
+        assert status == 1
+        assert lines == []
+        assert "Book with ID 99 not found" in capsys.readouterr().err
+
+    def test_search_joins_terms(self):
+        """Should search for all terms together"""
+        status, lines = self._run(["search", "james", "joyce"])
+        assert status == 0
+        assert [json.loads(line)["id"] for line in lines] == [2]
+
+    def test_import_reports_rejected_rows(self, capsys):
+        """Should add valid JSON lines rows, list rejected ones and exit with 1"""
+        rows = [{**BOOKS[0], "title": "Dune Messiah"}, {**BOOKS[0], "quantity": -1}]
+        status, lines = self._run(["import", "-"], stdin="\n".join(json.dumps(row) for row in rows))
+        assert status == 1
+        assert lines == ["Imported 1 of 2 books"]
+        assert "Row 2: Quantity must be a non-negative integer" in capsys.readouterr().err
+        assert BookInterfaceImplementation(self.file_path).read(3).title == "Dune Messiah"
+
+    def test_export_round_trips_through_import(self):
+        """Should write JSON lines that import reads back"""
+        export_path = self.tmp_path / "export.jsonl"
+        assert self._run(["export", "--output", str(export_path)])[0] == 0
+        self.file_path = str(self.tmp_path / "copy.json")
+        status, lines = self._run(["import", str(export_path)])
+        assert status == 0
+        assert [book.title for book in BookInterfaceImplementation(self.file_path).browse()] == ["Dune", "Emma", "Ulysses"]
+
+    def test_export_gzipped_csv_to_stdout_round_trips(self):
+        """Should stream gzipped CSV to binary stdout and import it back from binary stdin"""
+        stdout = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+        assert BookCommandLine(self._controller, stdout=stdout).run(["export", "--format", "csv", "--gzip"]) == 0
+        data = stdout.buffer.getvalue()
+        assert data[:2] == b"\x1f\x8b"
+        self.file_path = str(self.tmp_path / "copy.json")
+        output = io.StringIO()
+        stdin = io.TextIOWrapper(io.BytesIO(data), encoding="utf-8")
+        assert BookCommandLine(self._controller, stdin=stdin, stdout=output).run(["import", "-", "--chunk-size", "2"]) == 0
+        assert output.getvalue() == "Imported 3 of 3 books\n"
+        assert [book.title for book in BookInterfaceImplementation(self.file_path).browse()] == ["Dune", "Emma", "Ulysses"]
+
+    def test_batch_shares_one_controller_and_continues_after_errors(self, capsys):
+        """Should run every stdin line on one eagerly loaded controller"""
+        commands = "get 0\n# comment\n\nbogus\nget 99\nsearch emma\n"
+        status, lines = self._run(["batch"], stdin=commands)
+        assert status == 1
+        assert [json.loads(line)["id"] for line in lines] == [0, 1]
+        assert self.lazy_flags == [False]
+
+    def test_usage_errors_do_not_load_the_catalogue(self, capsys):
+        """Should exit with 2 on a usage error and 0 on --help without creating a controller"""
+        assert self._run(["get", "not-a-number"])[0] == 2
+        assert self._run(["--help"])[0] == 0
+        assert self.lazy_flags == []
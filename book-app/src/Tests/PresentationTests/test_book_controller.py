@@ -3,6 +3,7 @@ from unittest.mock import Mock, patch
 from src.Presentation.Controllers.BookController import BookController
 from src.Application.Services.BookServices import BookServices
 from src.Domain.Entities.Book import Book
+from src.Domain.Entities.BulkResult import BulkResult
 
 class TestBookController:
     @pytest.fixture
@@ -42,6 +43,18 @@ class TestBookController:
         with pytest.raises(Exception):
             controller.get_all_books()
 
+    def test_get_books_page(self, controller, mock_service):
+        """Test getting a single page of books"""
+        mock_service.browse.return_value = []
+        controller.get_books_page(limit=20, after_id=5)
+        mock_service.browse.assert_called_once_with(0, 20, 5)
+
+    def test_iter_books(self, controller, mock_service):
+        """Test streaming books"""
+        mock_service.iter_books.return_value = iter([])
+        assert list(controller.iter_books()) == []
+        mock_service.iter_books.assert_called_once_with(0, None, None)
+
     # Read Tests
     def test_get_book_by_id_exists(self, controller, mock_service):
         """Test getting existing book by ID"""
@@ -65,6 +78,43 @@ class TestBookController:
         with pytest.raises(Exception):
             controller.get_book_by_id(1)
 
+    # Search Tests
+    def test_search_books(self, controller, mock_service):
+        """Test searching books"""
+        mock_book = Book(title="Test Book", author="Test Author", published_year=2023, quantity=5, id=1)
+        mock_service.search.return_value = [mock_book]
+        result = controller.search_books("test")
+        assert result == [mock_book]
+        mock_service.search.assert_called_once_with("test")
+
+    # Find Tests
+    def test_get_books_by_author(self, controller, mock_service):
+        """Test finding books by author"""
+        mock_service.find_by_author.return_value = []
+        result = controller.get_books_by_author("Test Author")
+        assert result == []
+        mock_service.find_by_author.assert_called_once_with("Test Author")
+
+    def test_get_books_by_year_range(self, controller, mock_service):
+        """Test finding books by published year range"""
+        mock_book = Book(title="Test Book", author="Test Author", published_year=2023, quantity=5, id=1)
+        mock_service.find_by_year_range.return_value = [mock_book]
+        result = controller.get_books_by_year_range(2020, 2025)
+        assert result == [mock_book]
+        mock_service.find_by_year_range.assert_called_once_with(2020, 2025)
+
+    # Stock Tests
+    def test_stock_operations(self, controller, mock_service):
+        """Test that stock operations delegate to the service"""
+        mock_service.increment_quantity.return_value = 6
+        mock_service.decrement_quantity.return_value = 5
+        mock_service.reserve.return_value = False
+        assert controller.increment_book_quantity(1) == 6
+        assert controller.decrement_book_quantity(1, 1) == 5
+        assert not controller.reserve_book(1, 3)
+        mock_service.increment_quantity.assert_called_once_with(1, 1)
+        mock_service.reserve.assert_called_once_with(1, 3)
+
     # Create Tests
     def test_create_book_success(self, controller, mock_service):
         """Test creating book successfully"""
@@ -132,4 +182,26 @@ class TestBookController:
         """Test deleting book when service raises error"""
         mock_service.delete.side_effect = Exception("Service error")
         with pytest.raises(Exception):
-            controller.delete_book(1)
\ No newline at end of file
+            controller.delete_book(1)
+
+    # Bulk Tests
+    def test_create_books(self, controller, mock_service):
+        """Test creating books in bulk"""
+        rows = [{"title": "New Book", "author": "New Author", "published_year": 2023, "quantity": 5}]
+        mock_service.add_many.return_value = [BulkResult(index=0, success=True, book_id=1)]
+        result = controller.create_books(rows)
+        assert result[0].book_id == 1
+        mock_service.add_many.assert_called_once_with(rows)
+
+    def test_update_books(self, controller, mock_service):
+        """Test updating books in bulk"""
+        rows = [{"id": 1, "title": "Updated"}]
+        mock_service.edit_many.return_value = [BulkResult(index=0, success=True, book_id=1)]
+        assert controller.update_books(rows)[0].success
+        mock_service.edit_many.assert_called_once_with(rows)
+
+    def test_delete_books(self, controller, mock_service):
+        """Test deleting books in bulk"""
+        mock_service.delete_many.return_value = [BulkResult(index=0, success=False, book_id=9, error="not found")]
+        assert not controller.delete_books([9])[0].success
+        mock_service.delete_many.assert_called_once_with([9])
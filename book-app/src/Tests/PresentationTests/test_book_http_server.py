@@ -0,0 +1,141 @@
+import http.client
+import json
+import threading
+import pytest
+from unittest.mock import Mock
+from src.Application.Instrumentation.Metrics import MetricsRegistry
+from src.Application.Interfaces.BookInterfaceImplementation import BookInterfaceImplementation
+from src.Application.Services.BookServices import BookServices
+from src.Domain.Entities.Book import Book
+from src.Presentation.Controllers.BookController import BookController
+from src.Presentation.Http.BookHttpServer import BookHttpServer
+
+BOOK = {"title": "Dune", "author": "Frank Herbert", "published_year": 1965, "quantity": 2}
+
+class TestBookHttpServer:
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        """Setup a catalogue file and stop every server a test starts"""
+        self.file_path = str(tmp_path / "books.json")
+        self.servers = []
+        yield
+        for server, thread in self.servers:
+            server.shutdown()
+            thread.join(timeout=10)
+
+    def _start(self, controller_factory=None, **options):
+        factory = controller_factory or (
+            lambda: BookController(BookServices(BookInterfaceImplementation(self.file_path, thread_safe=True, shared=options.get("processes", 1) > 1)))
+        )
+        server = BookHttpServer(factory, port=0, **options)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.servers.append((server, thread))
+        return http.client.HTTPConnection(*server.address, timeout=5)
+
+    @staticmethod
+    def _request(connection, method, path, body=None):
+        connection.request(method, path, body=None if body is None else json.dumps(body))
+        response = connection.getresponse()
+        data = response.read()
+        return response, json.loads(data) if data and response.getheader("Content-Type") == "application/json" else data
+
+    def test_bread_round_trip(self):
+        """Should add, read, edit, browse, search and delete books over one keep-alive connection"""
+        connection = self._start()
+        response, created = self._request(connection, "POST", "/books", BOOK)
+        assert response.status == 201
+        book_id = created["id"]
+        local_port = connection.sock.getsockname()[1]
+        assert self._request(connection, "GET", f"/books/{book_id}")[1]["title"] == "Dune"
+        assert self._request(connection, "PATCH", f"/books/{book_id}", {"quantity": 5})[1]["quantity"] == 5
+        assert [book["id"] for book in self._request(connection, "GET", "/books?offset=0&limit=10")[1]] == [book_id]
+        assert [book["id"] for book in self._request(connection, "GET", "/books/search?q=herbert")[1]] == [book_id]
+        assert self._request(connection, "DELETE", f"/books/{book_id}")[0].status == 204
+        # Every request above reused the same TCP connection
+        assert connection.sock.getsockname()[1] == local_port
+
+    def test_errors_map_to_status_codes(self):
+        """Should answer unknown books 404, invalid input 400, unknown routes 404 and wrong methods 405"""
+        connection = self._start()
+        assert self._request(connection, "GET", "/books/99")[0].status == 404
+        assert self._request(connection, "POST", "/books", {**BOOK, "title": ""})[0].status == 400
+        assert self._request(connection, "GET", "/books?limit=x")[0].status == 400
+        assert self._request(connection, "GET", "/books/search")[0].status == 400
+        assert self._request(connection, "GET", "/nothing")[0].status == 404
+        response, _ = self._request(connection, "DELETE", "/books")
+        assert response.status == 405
+        assert response.getheader("Allow") == "GET, POST"
+        connection.request("POST", "/books", body=b"not json")
+        assert connection.getresponse().status == 400
+
+    @pytest.mark.parametrize("length_header", ["Content-Length: -1\r\n", "Content-Length: abc\r\n", ""])
+    def test_unusable_content_length_returns_400_and_closes(self, length_header):
+        """Should reject a negative, non-numeric or missing body length and close the connection"""
+        connection = self._start()
+        connection.connect()
+        sock = connection.sock
+        sock.sendall(f"POST /books HTTP/1.1\r\nHost: test\r\n{length_header}\r\n{{}}".encode())
+        response = http.client.HTTPResponse(sock)
+        response.begin()
+        assert response.status == 400
+        response.read()
+        assert sock.recv(1) == b""
+
+    def test_connections_beyond_the_pool_are_served(self):
+        """Should serve more open keep-alive connections than there are workers"""
+        connections = [self._start(workers=1)]
+        server = self.servers[0][0]
+        connections += [http.client.HTTPConnection(*server.address, timeout=5) for _ in range(3)]
+        for _ in range(2):
+            for connection in connections:
+                assert self._request(connection, "GET", "/health")[0].status == 200
+
+    def test_in_flight_limit_returns_503(self):
+        """Should turn requests away with 503 once max_in_flight requests are inside the controller"""
+        entered, release = threading.Event(), threading.Event()
+
+        def slow_read(book_id):
+            entered.set()
+            release.wait(5)
+            return Book(id=book_id, **BOOK)
+
+        controller = Mock(spec=BookController)
+        controller.get_book_by_id.side_effect = slow_read
+        first = self._start(lambda: controller, workers=2, max_in_flight=1, queue_timeout=0)
+        second = http.client.HTTPConnection(*self.servers[0][0].address, timeout=5)
+        first.request("GET", "/books/1")
+        assert entered.wait(5)
+        response, _ = self._request(second, "GET", "/books/2")
+        release.set()
+        assert response.status == 503
+        assert response.getheader("Retry-After") == "1"
+        assert first.getresponse().status == 200
+
+    def test_idle_connections_time_out(self):
+        """Should close a keep-alive connection that stays idle past keep_alive_timeout"""
+        connection = self._start(keep_alive_timeout=0.2)
+        self._request(connection, "GET", "/health")
+        connection.sock.settimeout(5)
+        assert connection.sock.recv(1) == b""
+
+    def test_metrics_endpoint(self):
+        """Should expose per-route latency histograms when metrics are enabled"""
+        connection = self._start(metrics=MetricsRegistry())
+        self._request(connection, "GET", "/health")
+        response, body = self._request(connection, "GET", "/metrics")
+        assert response.status == 200
+        assert b'operation="http.GET /health"' in body
+
+    def test_process_workers_share_the_catalogue(self):
+        """Should let every forked worker see books written through another"""
+        self._start(processes=2, workers=2)
+        address = self.servers[0][0].address
+        for n in range(6):
+            # New connections land on either process
+            connection = http.client.HTTPConnection(*address, timeout=5)
+            if n == 0:
+                book_id = self._request(connection, "POST", "/books", BOOK)[1]["id"]
+            else:
+                assert self._request(connection, "GET", f"/books/{book_id}")[0].status == 200
+            connection.close()
@@ -2,9 +2,8 @@ import sys
 import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from src.Presentation.Controllers.BookController import BookController
-from src.Application.Services.BookServices import BookServices
-from src.Application.Interfaces.BookInterfaceImplementation import BookInterfaceImplementation
+# The layers are imported inside create_controller, so batch commands start without loading
+# anything they do not use
 
 def display_menu():
     print("\n=== Book Management System ===")
@@ -13,36 +12,85 @@ def display_menu():
     print("3. Update book")
     print("4. Delete book")
     print("5. Search book")
+    print("6. Find books by author")
+    print("7. Find books by published year range")
     print("0. Exit")
     print("===========================")
-    return input("Choose an option (0-5): ")
+    return input("Choose an option (0-7): ")
 
-def create_controller():
-    repository = BookInterfaceImplementation()
-    service = BookServices(repository)
-    return BookController(service)
+PAGE_SIZE = 20
+
+def format_book(book):
+    return (
+        f"ID: {book.id}\n"
+        f"Title: {book.title}\n"
+        f"Author: {book.author}\n"
+        f"Published Year: {book.published_year}\n"
+        f"Quantity: {book.quantity}\n"
+        f"{'-' * 30}"
+    )
+
+def show_found_books(found_books):
+    if not found_books:
+        print("\nNo books found.\n")
+    else:
+        print("\nFound books:")
+        for book in found_books:
+            print(format_book(book))
+
+def show_books_paged(book_controller):
+    # Fetch one keyset page at a time so the first page shows without loading the whole catalogue
+    books = book_controller.get_books_page(limit=PAGE_SIZE)
+    if not books:
+        print("\nNo books available.\n")
+        return
+    print("\nAvailable books:")
+    while books:
+        for book in books:
+            print(format_book(book))
+        if len(books) < PAGE_SIZE:
+            break
+        books = book_controller.get_books_page(limit=PAGE_SIZE, after_id=books[-1].id)
+        if books and input("Press Enter for more books (q to stop): ").strip().lower() == "q":
+            break
+
+def create_controller(metrics=None, lazy=False, thread_safe=False, shared=False):
+    from src.Presentation.Controllers.BookController import BookController
+    from src.Application.Services.BookServices import BookServices
+    from src.Application.Interfaces.BookRepositoryFactory import DEFAULT_JSON_PATH, create_repository, load_connection_string
+
+    # BOOK_APP_DATA points at another JSON catalogue
+    json_path = os.environ.get("BOOK_APP_DATA", DEFAULT_JSON_PATH)
+    repository = create_repository(load_connection_string(), json_path, thread_safe=thread_safe, lazy=lazy, shared=shared)
+    if metrics is None:
+        return BookController(BookServices(repository))
+
+    # With a registry every layer is timed
+    from src.Application.Instrumentation.Metrics import instrument
+    repository = instrument(repository, metrics, 'repository')
+    service = instrument(BookServices(repository), metrics, 'service')
+    return instrument(BookController(service), metrics, 'controller')
 
 def main():
-    book_controller = create_controller()
+    if len(sys.argv) > 1:
+        # Batch mode, e.g. "main.py list --limit 20" or "main.py batch < commands.txt"
+        from src.Presentation.Cli.BookCommandLine import BookCommandLine
+        return BookCommandLine(create_controller).run(sys.argv[1:])
+
+    # BOOK_APP_METRICS=1 prints per-operation latency histograms on exit
+    metrics = None
+    if os.environ.get("BOOK_APP_METRICS"):
+        from src.Application.Instrumentation.Metrics import MetricsRegistry
+        metrics = MetricsRegistry()
+    book_controller = create_controller(metrics)
     print("Welcome to Book Management System!")
     while True:
         try:
             choice = display_menu()
             
             if choice == "1":
-                books = book_controller.get_all_books()
-                if not books:
-                    print("\nNo books available.\n")
-                else:
-                    print("\nAvailable books:")
-                    for book in books:
-                        print(f"ID: {book.id}")
-                        print(f"Title: {book.title}")
-                        print(f"Author: {book.author}")
-                        print(f"Published Year: {book.published_year}")
-                        print(f"Quantity: {book.quantity}")
-                        print("-" * 30)
-                        
+                show_books_paged(book_controller)
+
             elif choice == "2":
                 try:
                     title = input("Enter book title: ").strip()
@@ -95,27 +143,27 @@ def main():
                 
             elif choice == "5":
                 search_term = input("Enter search term: ").strip()
-                books = book_controller.get_all_books()  # We'll filter here since search isn't implemented
-                found_books = [
-                    book for book in books 
-                    if search_term.lower() in book.title.lower() or 
-                       search_term.lower() in book.author.lower()
-                ]
-                
-                if not found_books:
-                    print("\nNo books found.\n")
-                else:
-                    print("\nFound books:")
-                    for book in found_books:
-                        print(f"ID: {book.id}")
-                        print(f"Title: {book.title}")
-                        print(f"Author: {book.author}")
-                        print(f"Published Year: {book.published_year}")
-                        print(f"Quantity: {book.quantity}")
-                        print("-" * 30)
-                        
+                show_found_books(book_controller.search_books(search_term))
+
+            elif choice == "6":
+                try:
+                    author = input("Enter author: ").strip()
+                    show_found_books(book_controller.get_books_by_author(author))
+                except ValueError as e:
+                    print(f"Invalid input: {str(e)}")
+
+            elif choice == "7":
+                try:
+                    start_year = int(input("Enter first published year: "))
+                    end_year = int(input("Enter last published year: "))
+                    show_found_books(book_controller.get_books_by_year_range(start_year, end_year))
+                except ValueError as e:
+                    print(f"Invalid input: {str(e)}")
+
             elif choice == "0":
                 print("Thank you for using Book Management System!")
+                if metrics:
+                    print(metrics.export_prometheus(), end="")
                 break
                 
             else:
@@ -126,4 +174,4 @@ def main():
             print("Please try again.")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file